@@ -0,0 +1,21 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks for pymonad.
+
+The benchmark suite times bind, map, amap, then and apply for every
+monad, along with mconcat and curry, at several chain lengths. Results
+are written to a JSON file and two result files can be compared to
+find regressions. Only the standard library is needed.
+
+  Usage:
+    python -m benchmarks run -o before.json
+    python -m benchmarks run -o after.json
+    python -m benchmarks compare before.json after.json
+
+The other modules in this package are standalone benchmarks, each
+comparing a specific implementation with the one it replaced, and can
+be run individually:
+    python -m benchmarks.state_chain
+"""
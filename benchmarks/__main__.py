@@ -0,0 +1,73 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Command line interface for the benchmark suite.
+
+  Usage:
+    python -m benchmarks run [-o results.json] [--lengths 1 10 100 10000] [--select Maybe]
+    python -m benchmarks compare before.json after.json [--threshold 0.1]
+
+'compare' exits with status 1 when any case regressed.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks import compare, suite
+
+def _print_result(result):
+    name = f'{result["name"]}[{result["length"]}]'
+    if 'error' in result:
+        print(f'{name:<32} {result["error"]}', file=sys.stderr)
+    else:
+        print(f'{name:<32} {result["ops_per_sec"]:>12.0f} ops/s'
+              f' {result["allocated_blocks"]:>8} blocks {result["peak_bytes"]:>10} peak bytes',
+              file=sys.stderr)
+
+def _run(arguments):
+    results = suite.run(arguments.lengths, arguments.select, arguments.repeat, _print_result)
+    if arguments.output == '-':
+        json.dump(results, sys.stdout, indent=2)
+    else:
+        with open(arguments.output, 'w') as output:
+            json.dump(results, output, indent=2)
+    return 0
+
+def _compare(arguments):
+    with open(arguments.before) as before_file, open(arguments.after) as after_file:
+        before, after = json.load(before_file), json.load(after_file)
+    print('\n'.join(compare.table(before, after)))
+    found = compare.regressions(before, after, arguments.threshold)
+    if found:
+        print(f'\n{len(found)} regression(s):')
+        print('\n'.join(found))
+        return 1
+    return 0
+
+def main(argv=None):
+    """ Runs the command given on the command line. """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.split('\n')[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the benchmark suite')
+    run.add_argument('-o', '--output', default='-', help='JSON results file, "-" for stdout')
+    run.add_argument('--lengths', type=int, nargs='+', default=suite.LENGTHS, help='chain lengths')
+    run.add_argument('--select', help='only run cases whose name contains this string')
+    run.add_argument('--repeat', type=int, default=3, help='timing repetitions per case')
+    run.set_defaults(command=_run)
+
+    compare_parser = commands.add_parser('compare', help='compare two results files')
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+    compare_parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='fraction by which a measurement must worsen to count as a regression'
+    )
+    compare_parser.set_defaults(command=_compare)
+
+    arguments = parser.parse_args(argv)
+    return arguments.command(arguments)
+
+if __name__ == '__main__':
+    sys.exit(main())
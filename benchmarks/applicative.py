@@ -0,0 +1,80 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks Monad.apply(...).to_arguments(...).
+
+Compares the current implementation against the previous one
+(reproduced below) which created a new sub-class on every call to
+apply and built an intermediate monad value for every argument.
+
+  Usage:
+    python -m benchmarks.applicative
+"""
+import asyncio
+import timeit
+
+from pymonad.either import Either
+from pymonad.io import _IO
+from pymonad.list import _List
+from pymonad.maybe import Maybe
+from pymonad.promise import _Promise
+from pymonad.reader import _Reader
+from pymonad.state import State
+
+def legacy_apply(cls, function):
+    """ The previous implementation of Monad.apply. """
+    class _Applicative(cls):
+        amap = cls.amap
+        bind = cls.bind
+        insert = cls.insert
+        map = cls.map
+        @staticmethod
+        def to_arguments(*args):
+            result = cls.insert(function)
+            for arg in args:
+                result = result.amap(arg)
+            if cls is _Promise:
+                # A Promise's value no longer holds everything needed to
+                # run it, so it can't be re-wrapped: return it as it is.
+                return result
+            return cls(result.value, result.monoid)
+    return _Applicative(None, None)
+
+def collect(*values):
+    """ A curried function which accepts any number of arguments, one at a time. """
+    return lambda value: collect(*values, value)
+
+def per_call(cls, apply, arity, repeat=5):
+    """ Returns the best time, in microseconds, to apply and evaluate 'arity' arguments. """
+    arguments = [cls.insert(i) for i in range(arity)]
+    number = 5000
+    if cls is _Promise:
+        async def _many():
+            for _ in range(number):
+                await apply(cls, collect).to_arguments(*arguments)
+        statement = lambda: asyncio.run(_many())
+    elif cls is State:
+        statement = lambda: [apply(cls, collect).to_arguments(*arguments).run(0) for _ in range(number)]
+    elif cls is _Reader:
+        statement = lambda: [apply(cls, collect).to_arguments(*arguments)(0) for _ in range(number)]
+    elif cls is _IO:
+        statement = lambda: [apply(cls, collect).to_arguments(*arguments).run() for _ in range(number)]
+    else:
+        statement = lambda: [apply(cls, collect).to_arguments(*arguments) for _ in range(number)]
+    best = min(timeit.repeat(statement, number=1, repeat=repeat))
+    return best / number * 1e6
+
+def main():
+    """ Prints the benchmark results. """
+    print(f'{"monad":>8} {"arity":>6} {"legacy us":>10} {"current us":>11} {"speedup":>8}')
+    current = lambda cls, function: cls.apply(function)
+    for cls in (Maybe, Either, _List, _Reader, State, _IO, _Promise):
+        for arity in (1, 2, 4):
+            legacy_time = per_call(cls, legacy_apply, arity)
+            current_time = per_call(cls, current, arity)
+            print(f'{cls.__name__:>8} {arity:>6} {legacy_time:>10.2f} {current_time:>11.2f}'
+                  f' {legacy_time / current_time:>7.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks calling and awaiting an async_func with 10 arguments.
+
+0, 1 or 10 of the arguments are promises which have yet to run, the
+others are plain values. Compares the current implementation with the
+previous one (reproduced below) which wrapped every plain value in a
+promise and gathered positional and keyword arguments separately.
+
+  Usage:
+    python -m benchmarks.async_func
+"""
+import asyncio
+import timeit
+from typing import Awaitable
+
+from pymonad.promise import Promise, _Promise, async_func
+
+def legacy_async_func(func):
+    """ The previous implementation of async_func. """
+    async def getArgs(args): # pylint: disable=invalid-name
+        return await asyncio.gather(
+            *[arg if isinstance(arg, Awaitable) else Promise.insert(arg) for arg in args]
+        )
+
+    async def getKwargs(kwargs): # pylint: disable=invalid-name
+        kwargsTasks = [arg.map(lambda x: (ith, x)) if isinstance(arg, Awaitable) else Promise.insert((ith, arg)) # pylint: disable=invalid-name, cell-var-from-loop
+                       for ith, arg in kwargs.items()]
+        return dict(await asyncio.gather(*kwargsTasks))
+
+    async def async_wrap(*args, **kwargs):
+        (_args, _kwargs) = await asyncio.gather(getArgs(args), getKwargs(kwargs))
+        return func(*_args, **_kwargs)
+
+    def wrapper(*args, **kwargs):
+        return _Promise(lambda resolve, reject: async_wrap(*args, **kwargs), None)
+    return wrapper
+
+def total(*values, **keywords):
+    """ The decorated function. """
+    return sum(values) + sum(keywords.values())
+
+def arguments(number_of_awaitables):
+    """ Returns five positional and five keyword arguments, the first 'number_of_awaitables' of them promises. """
+    values = [
+        Promise(lambda resolve, reject, value=value: resolve(value)) if value < number_of_awaitables else value
+        for value in range(10)
+    ]
+    return values[:5], {f'k{index}': value for index, value in enumerate(values[5:])}
+
+async def _call_many(function, number_of_awaitables, number):
+    for _ in range(number):
+        args, kwargs = arguments(number_of_awaitables)
+        await function(*args, **kwargs)
+
+def per_call(loop, function, number_of_awaitables, number=2000, repeat=5):
+    """ Returns the best time, in microseconds, for one call. """
+    return min(timeit.repeat(
+        lambda: loop.run_until_complete(_call_many(function, number_of_awaitables, number)),
+        number=1, repeat=repeat
+    )) / number * 1e6
+
+def main():
+    """ Prints the benchmark results. """
+    loop = asyncio.new_event_loop()
+    legacy, current = legacy_async_func(total), async_func(total)
+    print(f'{"awaitables":>10} {"legacy us":>10} {"current us":>11} {"speedup":>8}')
+    try:
+        for number_of_awaitables in (0, 1, 10):
+            before = per_call(loop, legacy, number_of_awaitables)
+            after = per_call(loop, current, number_of_awaitables)
+            print(f'{number_of_awaitables:>10} {before:>10.1f} {after:>11.1f} {before / after:>7.1f}x')
+    finally:
+        loop.close()
+
+if __name__ == '__main__':
+    main()
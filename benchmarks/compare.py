@@ -0,0 +1,69 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Compares two sets of benchmark suite results.
+
+A case regresses when its ops/sec drops, or its allocated blocks or
+peak memory grow, by more than a given fraction, or when it raises an
+error which it previously didn't.
+"""
+from typing import Any, Dict, List, Tuple
+
+# Memory differences smaller than this are treated as noise.
+MINIMUM_BYTES = 1024
+MINIMUM_BLOCKS = 8
+
+Key = Tuple[str, int]
+
+def _by_case(results: Dict[str, Any]) -> Dict[Key, Dict[str, Any]]:
+    return {(result['name'], result['length']): result for result in results['results']}
+
+def _grew(before: float, after: float, threshold: float, minimum: float) -> bool:
+    return after - before > max(before * threshold, minimum)
+
+def regressions(before: Dict[str, Any], after: Dict[str, Any], threshold: float) -> List[str]:
+    """ Returns a description of every case in 'after' which regressed.
+
+    Args:
+      before: benchmark suite results, as returned by benchmarks.suite.run.
+      after: benchmark suite results for the same cases.
+      threshold: the fraction by which a measurement must worsen to
+        count as a regression.
+    """
+    found = []
+    old_results = _by_case(before)
+    for key, new in _by_case(after).items():
+        old = old_results.get(key)
+        if old is None or 'error' in old:
+            continue
+        name = f'{key[0]}[{key[1]}]'
+        if 'error' in new:
+            found.append(f'{name}: {new["error"]}')
+            continue
+        if new['ops_per_sec'] < old['ops_per_sec'] * (1 - threshold):
+            found.append(f'{name}: ops/sec {old["ops_per_sec"]:.0f} -> {new["ops_per_sec"]:.0f}')
+        if _grew(old['allocated_blocks'], new['allocated_blocks'], threshold, MINIMUM_BLOCKS):
+            found.append(
+                f'{name}: allocated blocks {old["allocated_blocks"]} -> {new["allocated_blocks"]}'
+            )
+        if _grew(old['peak_bytes'], new['peak_bytes'], threshold, MINIMUM_BYTES):
+            found.append(f'{name}: peak bytes {old["peak_bytes"]} -> {new["peak_bytes"]}')
+    return found
+
+def table(before: Dict[str, Any], after: Dict[str, Any]) -> List[str]:
+    """ Returns the lines of a table comparing the ops/sec of every case in both results. """
+    lines = [f'{"case":<24} {"length":>6} {"before ops/s":>13} {"after ops/s":>13} {"change":>7}']
+    old_results = _by_case(before)
+    for key, new in _by_case(after).items():
+        old = old_results.get(key, {})
+        old_ops = old.get('ops_per_sec')
+        new_ops = new.get('ops_per_sec')
+        change = f'{new_ops / old_ops - 1:+.0%}' if old_ops and new_ops else ''
+        lines.append(
+            f'{key[0]:<24} {key[1]:>6} {_format_ops(old_ops):>13} {_format_ops(new_ops):>13} {change:>7}'
+        )
+    return lines
+
+def _format_ops(ops_per_sec):
+    return '-' if ops_per_sec is None else f'{ops_per_sec:.0f}'
@@ -0,0 +1,54 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks curried functions of 2 to 6 arguments.
+
+Compares pymonad.tools.curry against the previous closure based
+implementation (reproduced below) when supplying every argument at
+once and when supplying them one at a time.
+
+  Usage:
+    python -m benchmarks.curry
+"""
+import timeit
+
+from pymonad.tools import curry
+
+def _legacy_curry_helper(number_of_arguments, function_to_curry, accumulated_arguments):
+    def _curry_internal(*arguments):
+        all_arguments = accumulated_arguments[:]
+        all_arguments.extend(arguments)
+        if len(all_arguments) >= number_of_arguments:
+            return function_to_curry(*all_arguments)
+        return _legacy_curry_helper(number_of_arguments, function_to_curry, all_arguments)
+    return _curry_internal
+
+legacy_curry = _legacy_curry_helper(2, lambda n, f: _legacy_curry_helper(n, f, []), [])
+
+def one_at_a_time(function, arity):
+    """ Supplies 'arity' arguments to 'function' one call at a time. """
+    for argument in range(arity):
+        function = function(argument)
+    return function
+
+def per_call(statement, number=20000, repeat=5):
+    """ Returns the best time, in nanoseconds, to run 'statement' once. """
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number * 1e9
+
+def main():
+    """ Prints the benchmark results. """
+    print(f'{"arity":>6} {"legacy all ns":>14} {"curry all ns":>13}'
+          f' {"legacy 1-by-1 ns":>17} {"curry 1-by-1 ns":>16}')
+    for arity in range(2, 7):
+        legacy = legacy_curry(arity, lambda *args: args)
+        current = curry(arity, lambda *args: args)
+        arguments = tuple(range(arity))
+        print(f'{arity:>6}'
+              f' {per_call(lambda: legacy(*arguments)):>14.0f}'
+              f' {per_call(lambda: current(*arguments)):>13.0f}'
+              f' {per_call(lambda: one_at_a_time(legacy, arity)):>17.0f}'
+              f' {per_call(lambda: one_at_a_time(current, arity)):>16.0f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks searching for the first result of a ListMonad chain.
+
+Every step branches ten ways, so a chain of 'depth' steps has 10**depth
+results. Compares ListMonad, which computes them all before the first
+one can be taken, with LazyListMonad.first(), which computes only what
+it needs. Reports the time and the peak memory used.
+
+  Usage:
+    python -m benchmarks.lazy_list
+"""
+import time
+import tracemalloc
+
+from pymonad.list import LazyListMonad, ListMonad
+
+BRANCHES = ListMonad(*range(10))
+
+def branch(value):
+    """ The step applied at every level of the search. """
+    return BRANCHES.map(lambda digit: value * 10 + digit)
+
+def search(monad, depth):
+    """ Returns the first result greater than 0 at the given depth. """
+    result = monad.insert(0)
+    for _ in range(depth):
+        result = result.then(branch)
+    if monad is ListMonad:
+        return next(value for value in result if value > 0)
+    return result.filter(lambda value: value > 0).first().value
+
+def measure(monad, depth):
+    """ Returns the time, in milliseconds, and peak memory, in bytes, of one search. """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        search(monad, depth)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed * 1000, peak
+
+def main():
+    """ Prints the benchmark results. """
+    print(f'{"depth":>5} {"list ms":>9} {"list bytes":>11} {"lazy ms":>9} {"lazy bytes":>11}')
+    for depth in (2, 4, 5, 6):
+        eager_ms, eager_peak = measure(ListMonad, depth)
+        lazy_ms, lazy_peak = measure(LazyListMonad, depth)
+        print(f'{depth:>5} {eager_ms:>9.1f} {eager_peak:>11} {lazy_ms:>9.1f} {lazy_peak:>11}')
+
+if __name__ == '__main__':
+    main()
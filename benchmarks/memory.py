@@ -0,0 +1,111 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Measures the memory used by a single value of every monad.
+
+Uses tracemalloc to count the bytes allocated per monad value. The
+'dict' column measures a sub-class of each monad class which doesn't
+declare __slots__ and so stores its attributes in a per-instance
+__dict__, as every monad class did previously. The 'slots' column
+measures the monad class itself. Right values in the 'dict' column are
+built the way Either.insert used to build them, with a (None, True)
+literal, rather than with the current Either.insert.
+
+Every value wraps the same, shared, object or function so only the
+monad value itself, and anything its constructor allocates, is
+counted.
+
+  Usage:
+    python -m benchmarks.memory
+"""
+import tracemalloc
+
+from pymonad.either import Either, _Error
+from pymonad.io import _IO
+from pymonad.list import _List
+from pymonad.maybe import Maybe, Option
+from pymonad.promise import _Promise
+from pymonad.reader import _Reader
+from pymonad.state import State
+from pymonad.writer import Writer
+import pymonad.operators.either
+import pymonad.operators.io
+import pymonad.operators.list
+import pymonad.operators.maybe
+import pymonad.operators.reader
+import pymonad.operators.state
+import pymonad.operators.writer
+
+VALUE = object()
+
+def function(*_):
+    """ The function wrapped by every function based monad value. """
+    return VALUE
+
+def right(cls):
+    """ Creates a Right value. """
+    return cls.insert(VALUE)
+
+def old_right(cls):
+    """ Creates a Right value the way Either.insert did before it shared _RIGHT. """
+    return cls(VALUE, (None, True))
+
+def left(cls):
+    """ Creates a Left value. """
+    return cls(None, (VALUE, False))
+
+def wrapped_function(cls):
+    """ Creates a function based monad value. """
+    return cls(function, None)
+
+MONADS = (
+    ('Just', Maybe, right, right),
+    ('Some', Option, right, right),
+    ('Right', Either, right, old_right),
+    ('Left', Either, left, left),
+    ('Result', _Error, right, old_right),
+    ('Error', _Error, left, left),
+    ('ListMonad', _List, right, right),
+    ('Writer', Writer, right, right),
+    ('State', State, wrapped_function, wrapped_function),
+    ('Reader', _Reader, wrapped_function, wrapped_function),
+    ('IO', _IO, wrapped_function, wrapped_function),
+    ('Promise', _Promise, wrapped_function, wrapped_function),
+    ('ops Just', pymonad.operators.maybe.Maybe, right, right),
+    ('ops Right', pymonad.operators.either.Either, right, old_right),
+    ('ops Left', pymonad.operators.either.Either, left, left),
+    ('ops List', pymonad.operators.list._List, right, right), # pylint: disable=protected-access
+    ('ops Writer', pymonad.operators.writer.Writer, right, right),
+    ('ops State', pymonad.operators.state.State, wrapped_function, wrapped_function),
+    ('ops Reader', pymonad.operators.reader._Reader, wrapped_function, wrapped_function), # pylint: disable=protected-access
+    ('ops IO', pymonad.operators.io._IO, wrapped_function, wrapped_function), # pylint: disable=protected-access
+)
+
+def with_dict(cls):
+    """ Returns a sub-class of 'cls' whose instances have a __dict__. """
+    return type(cls.__name__, (cls,), {})
+
+def bytes_per_instance(make, cls, count=100000):
+    """ Returns the average number of bytes allocated by 'make(cls)'. """
+    instances = [None] * count
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for index in range(count):
+            instances[index] = make(cls)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+def main():
+    """ Prints the benchmark results. """
+    print(f'{"monad":>11} {"dict bytes":>11} {"slots bytes":>12} {"saved":>6}')
+    for name, cls, make, make_before in MONADS:
+        before = bytes_per_instance(make_before, with_dict(cls))
+        after = bytes_per_instance(make, cls)
+        print(f'{name:>11} {before:>11.0f} {after:>12.0f} {1 - after / before:>6.0%}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks Promise.apply with 2 to 50 slow arguments.
+
+Every argument is a promise which sleeps for 10 milliseconds, a
+stand-in for a network call. Compares the current implementation,
+which awaits all of the arguments concurrently, with the previous one
+(reproduced below) which awaited them one after the other.
+
+  Usage:
+    python -m benchmarks.promise_apply
+"""
+import asyncio
+import time
+
+import pymonad.monad
+from pymonad.promise import Promise, _Promise
+from pymonad.tools import curry
+
+DELAY = 0.01
+
+def legacy_apply(function, arguments):
+    """ The previous implementation of Promise.apply(function).to_arguments(*arguments). """
+    async def _awaitable_apply(resolve, reject): # pylint: disable=unused-argument
+        values = [await argument for argument in arguments]
+        return resolve(pymonad.monad.call_with_values(function, values))
+    return _Promise(_awaitable_apply, None)
+
+def current_apply(function, arguments):
+    """ The current implementation. """
+    return Promise.apply(function).to_arguments(*arguments)
+
+async def _sleeping(value):
+    await asyncio.sleep(DELAY)
+    return value
+
+def seconds(apply, number_of_arguments, repeat=3):
+    """ Returns the best time, in seconds, to apply a function to slow arguments. """
+    function = curry(number_of_arguments, lambda *values: sum(values))
+    async def _run():
+        arguments = [Promise.insert(value).then(_sleeping) for value in range(number_of_arguments)]
+        return await apply(function, arguments)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        asyncio.run(_run())
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    """ Prints the benchmark results. """
+    print(f'{"arguments":>9} {"legacy ms":>10} {"current ms":>11} {"speedup":>8}')
+    for number_of_arguments in (2, 5, 10, 20, 50):
+        legacy = seconds(legacy_apply, number_of_arguments)
+        current = seconds(current_apply, number_of_arguments)
+        print(f'{number_of_arguments:>9} {legacy * 1000:>10.1f} {current * 1000:>11.1f}'
+              f' {legacy / current:>7.1f}x')
+
+if __name__ == '__main__':
+    main()
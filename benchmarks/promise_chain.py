@@ -0,0 +1,96 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks awaiting Promise chains of 10 to 10000 steps.
+
+Compares the current implementation, which runs every step of a chain
+in a loop inside a single coroutine, with the previous implementation
+(reproduced below) which wrapped every step in another coroutine
+awaiting the previous one. Reports the time per step and the peak
+memory used while awaiting the chain.
+
+  Usage:
+    python -m benchmarks.promise_chain
+"""
+import asyncio
+import time
+import tracemalloc
+
+from pymonad.promise import Promise
+
+class LegacyPromise:
+    """ The previous, nested, implementation of Promise.map. """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def insert(cls, value):
+        """ See Monad.insert. """
+        async def _insert(resolve, _):
+            return resolve(value)
+        return cls(_insert)
+
+    def map(self, function):
+        """ See Monad.map. """
+        async def _map(resolve, _):
+            return resolve(function(await self))
+        return LegacyPromise(_map)
+
+    def __await__(self):
+        return self.value(lambda value: value, None).__await__()
+
+def inc(value):
+    """ The function mapped over every step. """
+    return value + 1
+
+def build(cls, length):
+    """ Returns a promise of 'length' steps. """
+    # Promise.insert creates an already resolved promise, for which
+    # map would be applied straight away, so start from a function.
+    promise = cls.insert(0) if cls is LegacyPromise else cls(lambda resolve, reject: resolve(0))
+    for _ in range(length):
+        promise = promise.map(inc)
+    return promise
+
+async def _await(promise):
+    return await promise
+
+def measure(cls, length, repeat=5):
+    """ Returns the best time, in nanoseconds, per step and the peak memory, in bytes, for awaiting a chain. """
+    loop = asyncio.new_event_loop()
+    try:
+        times = []
+        for _ in range(repeat):
+            promise = build(cls, length)
+            start = time.perf_counter_ns()
+            loop.run_until_complete(_await(promise))
+            times.append(time.perf_counter_ns() - start)
+        promise = build(cls, length)
+        tracemalloc.start()
+        try:
+            loop.run_until_complete(_await(promise))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        loop.close()
+    return min(times) / length, peak
+
+def _format(cls, length):
+    try:
+        per_step, peak = measure(cls, length)
+    except RecursionError:
+        return f'{"RecursionError":>26}'
+    return f'{per_step:>12.0f} {peak:>13}'
+
+def main():
+    """ Prints the benchmark results. """
+    print(f'{"steps":>6} {"legacy ns":>12} {"legacy bytes":>13} {"current ns":>12} {"current bytes":>13}')
+    for length in (10, 100, 1000, 10000):
+        print(f'{length:>6} {_format(LegacyPromise, length)} {_format(Promise, length)}')
+
+if __name__ == '__main__':
+    main()
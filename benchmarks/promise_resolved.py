@@ -0,0 +1,59 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks short Promise chains starting from an already known value.
+
+A cache hit typically looks like Promise.insert(cached).map(parse).
+Compares awaiting such chains with the previous implementation
+(benchmarks.promise_chain.LegacyPromise), with the current
+implementation and with Promise.run_sync, which needs no event loop.
+
+  Usage:
+    python -m benchmarks.promise_resolved
+"""
+import asyncio
+import timeit
+
+from benchmarks.promise_chain import LegacyPromise
+from pymonad.promise import Promise
+
+def inc(value):
+    """ The function mapped over every step. """
+    return value + 1
+
+def build(cls, length):
+    """ Returns a promise of 'length' steps starting from a known value. """
+    promise = cls.insert(0)
+    for _ in range(length):
+        promise = promise.map(inc)
+    return promise
+
+async def _await_many(cls, length, number):
+    for _ in range(number):
+        await build(cls, length)
+
+def per_chain(statement, number=2000, repeat=5):
+    """ Returns the best time, in nanoseconds, for one chain. """
+    return min(timeit.repeat(statement, number=1, repeat=repeat)) / number * 1e9
+
+def main():
+    """ Prints the benchmark results. """
+    loop = asyncio.new_event_loop()
+    number = 2000
+    def awaited(cls, length):
+        return lambda: loop.run_until_complete(_await_many(cls, length, number))
+    def run_sync(length):
+        return lambda: [build(Promise, length).run_sync() for _ in range(number)]
+    print(f'{"steps":>6} {"legacy await ns":>16} {"await ns":>9} {"run_sync ns":>12}')
+    try:
+        for length in (0, 1, 3, 10):
+            print(f'{length:>6}'
+                  f' {per_chain(awaited(LegacyPromise, length), number):>16.0f}'
+                  f' {per_chain(awaited(Promise, length), number):>9.0f}'
+                  f' {per_chain(run_sync(length), number):>12.0f}')
+    finally:
+        loop.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks calling long Pipe and Compose chains.
+
+Compares the chained Reader implementation against the previous
+implementation (reproduced below) where every stage wrapped the
+function built so far in another curried closure.
+
+  Usage:
+    python -m benchmarks.reader_chain
+"""
+import sys
+import timeit
+
+from pymonad.reader import Compose, Pipe
+from pymonad.tools import curry
+
+@curry(3)
+def _nested_map(function_f, function_g, read_only):
+    return function_f(function_g(read_only))
+
+@curry(3)
+def _nested_bind_or_map(function_f, function_g, read_only):
+    return_value = _nested_map(function_f, function_g, read_only)
+    try:
+        return return_value(read_only)
+    except (TypeError, AttributeError):
+        return return_value
+
+class NestedReader:
+    """ The previous Reader implementation: one closure per stage. """
+    def __init__(self, function):
+        self.value = function
+
+    def then(self, function):
+        return NestedReader(_nested_bind_or_map(function, self)) # pylint: disable=no-value-for-parameter
+
+    def __call__(self, read_only):
+        return self.value(read_only)
+
+def inc(value):
+    """ A cheap pipeline stage. """
+    return value + 1
+
+def build(start, length):
+    """ Appends 'length' stages to 'start'. """
+    for _ in range(length):
+        start = start.then(inc)
+    return start
+
+def per_call(function, argument, repeat=5):
+    """ Returns the best time, in microseconds, to call 'function' once. """
+    number = 2000
+    best = min(timeit.repeat(lambda: function(argument), number=number, repeat=repeat))
+    return best / number * 1e6
+
+def per_stage(make, length, repeat=5):
+    """ Returns the best time, in microseconds, to append one stage. """
+    best = min(timeit.repeat(lambda: build(make(), length), number=1, repeat=repeat))
+    return best / length * 1e6
+
+def main():
+    """ Prints the benchmark results. """
+    print(f'{"stages":>7} {"nested us/call":>15} {"Compose us/call":>16}'
+          f' {"Pipe us/flush":>14} {"nested us/stage":>16} {"Compose us/stage":>17}')
+    for length in (1, 10, 100, 150, 1000):
+        if 4 * length < sys.getrecursionlimit():
+            nested_call = f'{per_call(build(NestedReader(inc), length), 0):.2f}'
+            nested_build = f'{per_stage(lambda: NestedReader(inc), length):.2f}'
+        else:
+            nested_call = nested_build = 'overflow'
+        compose_call = f'{per_call(build(Compose(inc), length), 0):.2f}'
+        pipe_flush = f'{per_call(lambda pipe: pipe.flush(), build(Pipe(0), length)):.2f}'
+        compose_build = f'{per_stage(lambda: Compose(inc), length):.2f}'
+        print(f'{length:>7} {nested_call:>15} {compose_call:>16} {pipe_flush:>14}'
+              f' {nested_build:>16} {compose_build:>17}')
+
+if __name__ == '__main__':
+    main()
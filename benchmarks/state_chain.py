@@ -0,0 +1,92 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks long State chains.
+
+Compares the chained State implementation against the previous,
+nested-closure implementation (reproduced below) and reports the
+stack depth reached while running each step.
+
+  Usage:
+    python -m benchmarks.state_chain
+"""
+import sys
+import timeit
+
+from pymonad.state import State
+
+class NestedState:
+    """ The previous State implementation: one closure per step. """
+    def __init__(self, state_function):
+        self.value = state_function
+
+    @classmethod
+    def insert(cls, value):
+        return cls(lambda s: (value, s))
+
+    def bind(self, kleisli_function):
+        def _bind(state):
+            value, new_state = self.run(state)
+            return kleisli_function(value).run(new_state)
+        return NestedState(_bind)
+
+    def map(self, function):
+        def _map(state):
+            value, new_state = self.run(state)
+            return function(value), new_state
+        return NestedState(_map)
+
+    def run(self, state):
+        return self.value(state)
+
+def stack_depth():
+    """ Returns the number of frames currently on the Python stack. """
+    depth = 0
+    frame = sys._getframe() # pylint: disable=protected-access
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+def build(cls, length, start=None):
+    """ Builds a chain of 'length' alternating map and bind steps. """
+    computation = start or cls.insert(0)
+    for i in range(length):
+        if i % 2:
+            computation = computation.map(lambda x: x + 1)
+        else:
+            computation = computation.bind(lambda x, cls=cls: cls(lambda s: (x + 1, s + 1)))
+    return computation
+
+def depths(cls, length):
+    """ Returns the stack depth seen by the first and last step of a chain. """
+    seen = []
+    record = lambda x: seen.append(stack_depth()) or x # pylint: disable=unnecessary-lambda-assignment
+    build(cls, length, cls.insert(0).map(record)).map(record).run(0)
+    return seen[0], seen[-1]
+
+def per_step(cls, length, repeat=5):
+    """ Returns the best time, in nanoseconds, to run one step of a chain. """
+    computation = build(cls, length)
+    number = max(1, 10**5 // length)
+    best = min(timeit.repeat(lambda: computation.run(0), number=number, repeat=repeat))
+    return best / (number * length) * 1e9
+
+def main():
+    """ Prints the benchmark results. """
+    print(f'{"steps":>8} {"nested ns/step":>15} {"chained ns/step":>16}'
+          f' {"nested depth":>13} {"chained depth":>14}')
+    for length in (10, 100, 200, 10**4, 10**5):
+        if 4 * length < sys.getrecursionlimit():
+            nested_time = f'{per_step(NestedState, length):.0f}'
+            nested_depth = '{} -> {}'.format(*depths(NestedState, length))
+        else:
+            nested_time = nested_depth = 'overflow'
+        chained_time = f'{per_step(State, length):.0f}'
+        chained_depth = '{} -> {}'.format(*depths(State, length))
+        print(f'{length:>8} {nested_time:>15} {chained_time:>16}'
+              f' {nested_depth:>13} {chained_depth:>14}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Defines and runs the cases of the benchmark suite.
+
+Each case builds a chain of 'length' operations - calls to bind, map,
+amap, then or apply, additions for mconcat or partial applications for
+curry - and then runs it. Every case is measured for:
+
+  ops_per_sec: operations per second, building and running the chain.
+  allocated_blocks: the number of memory blocks allocated while
+    building the chain and still in use before it's run. For monads
+    like Maybe, this is only the resulting monad value. For monads
+    which wrap a function, State for instance, it includes the
+    structure recording the chain.
+  peak_bytes: the peak amount of memory in use while building and
+    running the chain.
+
+Cases which raise an exception, a RecursionError for instance, are
+recorded with an 'error' instead of measurements.
+"""
+import asyncio
+import collections
+import gc
+import operator
+import platform
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pymonad.either import Either
+from pymonad.io import _IO
+from pymonad.list import _List
+from pymonad.maybe import Maybe
+from pymonad.monoid import Monoid, mconcat
+from pymonad.promise import _Promise
+from pymonad.reader import _Reader
+from pymonad.state import State
+from pymonad.tools import curry
+from pymonad.writer import Writer
+
+LENGTHS = (1, 10, 100, 10000)
+
+Case = collections.namedtuple('Case', ['name', 'build', 'run'])
+
+add = curry(2, operator.add) # pylint: disable=invalid-name
+
+def inc(value):
+    """ The function mapped over monad values. """
+    return value + 1
+
+def _nothing_to_run(value):
+    return value
+
+def _run_promise(promise):
+    async def _await():
+        return await promise
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(_await())
+    finally:
+        loop.close()
+
+MONADS = (
+    ('Maybe', Maybe, _nothing_to_run),
+    ('Either', Either, _nothing_to_run),
+    ('ListMonad', _List, _nothing_to_run),
+    ('Writer', Writer, _nothing_to_run),
+    ('State', State, lambda state: state.run(0)),
+    ('Reader', _Reader, lambda reader: reader(0)),
+    ('IO', _IO, lambda io: io.run()),
+    ('Promise', _Promise, _run_promise),
+)
+
+def _operations(cls):
+    one = cls.insert(1)
+    lifted_inc = cls.insert(inc)
+    kleisli_inc = lambda value: cls.insert(value + 1)
+    return {
+        'bind': lambda value: value.bind(kleisli_inc),
+        'map': lambda value: value.map(inc),
+        'amap': lifted_inc.amap,
+        'then': lambda value: value.then(kleisli_inc),
+        'apply': lambda value: cls.apply(add).to_arguments(value, one),
+    }
+
+def _chain(start, operation):
+    def _build(length):
+        value = start
+        for _ in range(length):
+            value = operation(value)
+        return value
+    return _build
+
+class _Sum(Monoid):
+    """ Integer addition, for measuring mconcat on its own. """
+    __slots__ = ()
+
+    def addition_operation(self, other):
+        return _Sum(self.value + other.value)
+
+    @staticmethod
+    def identity_element():
+        return _Sum(0)
+
+def _monoid_values(make):
+    return lambda length: [make(index) for index in range(length)]
+
+def _partial_applications(length):
+    value = 0
+    for _ in range(length):
+        value = add(value)(1)
+    return value
+
+def cases() -> List[Case]:
+    """ Returns every case in the benchmark suite. """
+    suite = []
+    for monad_name, cls, run in MONADS:
+        for operation_name, operation in _operations(cls).items():
+            suite.append(Case(
+                f'{monad_name}.{operation_name}', _chain(cls.insert(0), operation), run
+            ))
+    suite.append(Case('ListMonad.mconcat', _monoid_values(_List.insert), mconcat))
+    suite.append(Case('Monoid.mconcat', _monoid_values(_Sum), mconcat))
+    suite.append(Case('curry.partial', _partial_applications, _nothing_to_run))
+    return suite
+
+def _ops_per_sec(case: Case, length: int, repeat: int) -> float:
+    timer = timeit.Timer(lambda: case.run(case.build(length)))
+    number, elapsed = timer.autorange()
+    best = min([elapsed] + timer.repeat(repeat=repeat - 1, number=number))
+    return length * number / best
+
+def _memory(case: Case, length: int) -> Dict[str, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        built = case.build(length)
+        after = tracemalloc.take_snapshot()
+        case.run(built)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    return {'allocated_blocks': blocks, 'peak_bytes': peak - start}
+
+def measure(case: Case, length: int, repeat: int = 3) -> Dict[str, Any]:
+    """ Returns the measurements for one case at one chain length. """
+    result = {'name': case.name, 'length': length}
+    try:
+        result['ops_per_sec'] = _ops_per_sec(case, length, repeat)
+        result.update(_memory(case, length))
+    except Exception as error: # pylint: disable=broad-except
+        result['error'] = f'{type(error).__name__}: {error}'
+    return result
+
+def run(
+        lengths: Iterable[int] = LENGTHS,
+        select: Optional[str] = None,
+        repeat: int = 3,
+        progress: Callable[[Dict[str, Any]], None] = lambda result: None
+) -> Dict[str, Any]:
+    """ Runs the benchmark suite.
+
+    Args:
+      lengths: the chain lengths at which every case is measured.
+      select: if given, only cases whose name contains 'select' are run.
+      repeat: the number of times each case is timed. The best time is kept.
+      progress: called with the measurements of each case as it finishes.
+
+    Returns:
+      A dictionary, suitable for saving as JSON, with information
+      about the platform under 'metadata' and a list of measurements
+      under 'results'.
+    """
+    results = []
+    for case in cases():
+        if select and select not in case.name:
+            continue
+        for length in lengths:
+            result = measure(case, length, repeat)
+            progress(result)
+            results.append(result)
+    return {
+        'metadata': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'results': results,
+    }
@@ -0,0 +1,69 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Benchmarks 'then' on chains of mapping and kleisli functions.
+
+Compares the current, type checking, implementations of 'then' with
+the previous implementation (reproduced below) which mapped the
+function, tried to join the result and fell back on the mapped value
+when join raised an exception.
+
+  Usage:
+    python -m benchmarks.then
+"""
+import timeit
+
+from pymonad.either import Either
+from pymonad.list import ListMonad
+from pymonad.maybe import Maybe
+from pymonad.writer import Writer
+
+def legacy_then(monad_value, function):
+    """ The previous implementation of Monad.then. """
+    result = monad_value.map(function)
+    try:
+        return result.join()
+    except (TypeError, AttributeError):
+        return result
+
+def inc(value):
+    """ A mapping function. """
+    return value + 1
+
+def kleisli_inc(cls):
+    """ Returns a kleisli function for 'cls'. """
+    return lambda value: cls.insert(value + 1)
+
+def chain(start, function, then, length):
+    """ Applies 'then' with 'function' 'length' times. """
+    for _ in range(length):
+        start = then(start, function)
+    return start
+
+def per_step(statement, length, repeat=5):
+    """ Returns the best time, in nanoseconds, per step of 'statement'. """
+    number = 20
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / (number * length) * 1e9
+
+def main():
+    """ Prints the benchmark results. """
+    length = 1000
+    current = lambda monad_value, function: monad_value.then(function)
+    print(f'{"monad":>8} {"legacy map ns":>14} {"current map ns":>15}'
+          f' {"legacy bind ns":>15} {"current bind ns":>16}')
+    for name, start in (
+            ('Maybe', Maybe.insert(0)),
+            ('Either', Either.insert(0)),
+            ('List', ListMonad(0, 1, 2, 3)),
+            ('Writer', Writer.insert(0)),
+    ):
+        kleisli = kleisli_inc(start)
+        print(f'{name:>8}'
+              f' {per_step(lambda: chain(start, inc, legacy_then, length), length):>14.0f}'
+              f' {per_step(lambda: chain(start, inc, current, length), length):>15.0f}'
+              f' {per_step(lambda: chain(start, kleisli, legacy_then, length), length):>15.0f}'
+              f' {per_step(lambda: chain(start, kleisli, current, length), length):>16.0f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Implements flat step chains for iteratively evaluated monads.
+
+Monads such as State wrap a function and, traditionally, every call
+to bind, map or then wraps that function in yet another function. A
+computation built from N steps then needs N nested Python frames every
+time it is run and, with a long enough chain, exceeds the recursion
+limit.
+
+A Chain instead records each step as a (kind, function) pair linked
+to the previous step. Appending a step is O(1) and never re-wraps
+anything. When the computation is run, the chain is flattened - once,
+the result is cached - into a base function followed by a tuple of
+steps which the monad can then interpret in a simple loop.
+
+Monads built on chains sub-class Chain, so that their chains can be
+told apart from plain functions, and run them with the 'run' function
+below, passing in how to call a function in the monad's context.
+
+The Lazy class uses a chain to record map, bind and then calls on any
+monad value and applies them only when asked to, fusing consecutive
+calls to map along the way.
+"""
+from operator import length_hint
+from typing import Any, Callable, List, Optional, Tuple
+
+BIND = 0
+MAP = 1
+THEN = 2
+
+Step = Tuple[int, Callable]
+
+class Chain:
+    """ A persistent, singly linked list of steps following a base function. """
+    __slots__ = ('base', 'previous', 'step', '_steps')
+
+    def __init__(self, base: Callable, previous: Optional['Chain'], step: Step):
+        """ Initializes a chain node.
+
+        You won't normally create Chain nodes directly. Use the
+        'extend' class method instead.
+
+        Args:
+          base: the function which starts the computation.
+          previous: the chain node for the preceding step or None if
+            'step' is the first step following 'base'.
+          step: a (kind, function) pair where kind is one of BIND, MAP
+            or THEN.
+        """
+        self.base = base
+        self.previous = previous
+        self.step = step
+        self._steps = None
+
+    @classmethod
+    def extend(cls, function: Callable, kind: int, step_function: Callable) -> 'Chain':
+        """ Appends a step to 'function' returning a new chain.
+
+        Args:
+          function: either a plain function, which becomes the base of
+            a new chain, or an existing chain of the same class.
+          kind: one of BIND, MAP or THEN.
+          step_function: the function applied by the new step.
+
+        Returns:
+          A new chain ending with the new step. 'function' is left
+          unchanged so chains can be safely shared and extended in
+          several different ways.
+        """
+        if isinstance(function, cls): # pylint: disable=no-else-return
+            return cls(function.base, function, (kind, step_function))
+        else:
+            return cls(function, None, (kind, step_function))
+
+    @classmethod
+    def unroll(cls, function: Callable) -> Tuple[Callable, Tuple[Step, ...]]:
+        """ Splits 'function' into its base function and a tuple of steps. """
+        if isinstance(function, cls): # pylint: disable=no-else-return
+            return function.base, function.steps()
+        else:
+            return function, ()
+
+    def steps(self) -> Tuple[Step, ...]:
+        """ Returns every step in the chain, in order, as a flat tuple. """
+        if self._steps is None:
+            reversed_steps = []
+            node = self
+            while node is not None and node._steps is None: # pylint: disable=protected-access
+                reversed_steps.append(node.step)
+                node = node.previous
+            prefix = () if node is None else node._steps # pylint: disable=protected-access
+            reversed_steps.reverse()
+            self._steps = prefix + tuple(reversed_steps)
+        return self._steps
+
+
+def run(
+        chain_class: type,
+        function: Callable,
+        call: Callable[[Callable], Any],
+        monad_class: type,
+        unwrap: Callable[[Any], Callable]
+) -> Any:
+    """ Runs a chain of steps, or a plain function, in a loop.
+
+    Kleisli functions passed to bind and then return new monad values
+    wrapping new functions. Rather than running those recursively, the
+    remaining steps of the current chain are pushed onto a stack and
+    the new chain is interpreted by the same loop, so the Python stack
+    depth stays constant no matter how the computation was built.
+
+    Args:
+      chain_class: the Chain sub-class the monad builds its chains from.
+      function: a plain function or a chain of class 'chain_class'.
+      call: calls a plain function, or the base of a chain, in the
+        monad's context and returns the resulting value.
+      monad_class: the monad's class. Values of any other class
+        returned by a function passed to then are used as they are.
+      unwrap: returns the function wrapped by a value returned by a
+        kleisli function.
+
+    Returns:
+      The value of the last step.
+    """
+    base, steps = chain_class.unroll(function)
+    value = call(base)
+    remaining = iter(steps)
+    pending = []
+    while True:
+        for kind, step_function in remaining:
+            if kind == MAP:
+                value = step_function(value)
+                continue
+            result = step_function(value)
+            if kind == THEN and not isinstance(result, monad_class):
+                value = result
+                continue
+            function = unwrap(result)
+            if isinstance(function, chain_class):
+                if length_hint(remaining):
+                    pending.append(remaining)
+                remaining = iter(function.steps())
+                value = call(function.base)
+                break
+            value = call(function)
+        else:
+            if not pending:
+                return value
+            remaining = pending.pop()
+
+def _compose(functions: List[Callable]) -> Callable:
+    """ Composes 'functions', applying them in order. """
+    if len(functions) == 1:
+        return functions[0]
+    def _composed(value):
+        for function in functions:
+            value = function(value)
+        return value
+    return _composed
+
+class Lazy:
+    """ Records map, bind and then calls on a monad value until 'run' is called.
+
+    Every call to map on a Maybe, Either, ListMonad or Writer value
+    creates a new monad value and, for ListMonad, a new list. Lazy
+    defers the calls instead: consecutive maps are fused into a single
+    call to map with the composed functions and, once the monad value
+    is Nothing, a Left or an empty list, the remaining steps are skipped
+    entirely.
+
+      Example:
+        result = (Just(1).lazy()
+                  .map(inc)
+                  .map(dbl)     # inc and dbl are applied by one call to map
+                  .then(safe_div(0))
+                  .map(inc)     # never called: safe_div(0) returned Nothing
+                  .run())
+    """
+    __slots__ = ('monad_value', '_chain')
+
+    def __init__(self, monad_value: Any, chain: Optional[Chain] = None):
+        """ Initializes a Lazy chain.
+
+        You won't normally create Lazy objects directly. Use the
+        'lazy' method of a monad value instead.
+
+        Args:
+          monad_value: the monad value the recorded steps are applied to.
+          chain: the steps recorded so far, if any.
+        """
+        self.monad_value = monad_value
+        self._chain = chain
+
+    def bind(self, kleisli_function: Callable) -> 'Lazy':
+        """ Records a call to bind. """
+        return self._extend(BIND, kleisli_function)
+
+    def map(self, function: Callable) -> 'Lazy':
+        """ Records a call to map. """
+        return self._extend(MAP, function)
+
+    def then(self, function: Callable) -> 'Lazy':
+        """ Records a call to then. """
+        return self._extend(THEN, function)
+
+    def run(self) -> Any:
+        """ Applies the recorded steps and returns the resulting monad value. """
+        monad_value = self.monad_value
+        steps = () if self._chain is None else self._chain.steps()
+        functions = []
+        for kind, function in steps:
+            if kind == MAP:
+                functions.append(function)
+                continue
+            if functions:
+                monad_value = monad_value.map(_compose(functions))
+                functions = []
+            if monad_value.halts_chain():
+                return monad_value
+            if kind == BIND:
+                monad_value = monad_value.bind(function)
+            else:
+                monad_value = monad_value.then(function)
+        if functions:
+            monad_value = monad_value.map(_compose(functions))
+        return monad_value
+
+    def _extend(self, kind: int, function: Callable) -> 'Lazy':
+        return Lazy(self.monad_value, Chain(None, self._chain, (kind, function)))
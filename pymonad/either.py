@@ -26,7 +26,7 @@ The 'insert' class method is a wrapper around the 'Right' function.
   Example:
     x = Either.insert(9) # Same as Right(9)
 """
-from typing import Any, Callable, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar, Union
 
 import pymonad.monad
 
@@ -34,12 +34,17 @@ M = TypeVar('M') # pylint: disable=invalid-name
 S = TypeVar('S') # pylint: disable=invalid-name
 T = TypeVar('T') # pylint: disable=invalid-name
 
+# Shared by every Right value: unlike Left values, there's no error to record.
+_RIGHT = (None, True)
+
 class Either(pymonad.monad.Monad, Generic[M, T]):
     """ The Either monad class. """
+    __slots__ = ()
+
     @classmethod
     def insert(cls, value: T) -> 'Either[Any, T]':
         """ See Monad.insert """
-        return cls(value, (None, True))
+        return cls(value, _RIGHT)
 
     def amap(self: 'Either[M, Callable[[S], T]]', monad_value: 'Either[M, S]') -> 'Either[M, T]':
         if self.is_left(): # pylint: disable=no-else-return
@@ -47,7 +52,17 @@ class Either(pymonad.monad.Monad, Generic[M, T]):
         elif monad_value.is_left(): # pylint: disable=no-else-return
             return monad_value
         else:
-            return self.__class__(self.value(monad_value.value), (None, True))
+            return self.__class__(self.value(monad_value.value), _RIGHT)
+
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ See Monad.apply_to_arguments. """
+        values = []
+        for argument in arguments:
+            if argument.is_left():
+                return cls(None, argument.monoid)
+            values.append(argument.value)
+        return cls(pymonad.monad.call_with_values(function, values), _RIGHT)
 
     def bind(
             self: 'Either[M, S]', kleisli_function: Callable[[S], 'Either[M, T]']
@@ -90,6 +105,10 @@ class Either(pymonad.monad.Monad, Generic[M, T]):
         else:
             return left_function(self.monoid[0])
 
+    def halts_chain(self) -> bool:
+        """ See Monad.halts_chain """
+        return self.is_left()
+
     def is_left(self) -> bool:
         """ Returns True if this Either instance was created with the 'Left' function. """
         return not self.monoid[1]
@@ -103,7 +122,19 @@ class Either(pymonad.monad.Monad, Generic[M, T]):
         if self.is_left(): # pylint: disable=no-else-return
             return self
         else:
-            return self.__class__(function(self.value), (None, True))
+            return self.__class__(function(self.value), _RIGHT)
+
+    def then(
+            self: 'Either[M, S]', function: Union[Callable[[S], T], Callable[[S], 'Either[M, T]']]
+    ) -> 'Either[M, T]':
+        """ See Monad.then """
+        if self.is_left():
+            return self
+        result = function(self.value)
+        if isinstance(result, pymonad.monad.Monad): # pylint: disable=no-else-return
+            return result
+        else:
+            return self.__class__(result, _RIGHT)
 
     def __eq__(self, other):
         """ Checks equality of Maybe objects.
@@ -124,7 +155,7 @@ def Left(value: M) -> Either[M, Any]: # pylint: disable=invalid-name
 
 def Right(value: T) -> Either[Any, T]: # pylint: disable=invalid-name
     """ Creates a value of the second possible type in the Either monad. """
-    return Either(value, (None, True))
+    return Either(value, _RIGHT)
 
 
 
@@ -132,6 +163,8 @@ def Right(value: T) -> Either[Any, T]: # pylint: disable=invalid-name
 
 
 class _Error(Either[M, T]):
+    __slots__ = ()
+
     def __repr__(self):
         return f'Result: {self.value}' if self.is_right() else f'Error: {self.monoid[0]}'
 
@@ -141,7 +174,7 @@ def Error(value: M) -> _Error[M, Any]: # pylint: disable=invalid-name
 
 def Result(value: T) -> _Error[Any, T]: # pylint: disable=invalid-name
     """ Creates a value representing the successful result of a calculation. """
-    return _Error(value, (None, True))
+    return _Error(value, _RIGHT)
 
 Error.apply = _Error.apply
 Error.insert = _Error.insert
@@ -0,0 +1,228 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Counts and times calls to bind, map, amap and then.
+
+Instrumentation is off by default and costs nothing while it's off:
+enable() replaces the bind, map, amap and then methods of every monad
+class with instrumented versions and disable() puts the original
+methods back.
+
+While enabled, two kinds of measurements are collected:
+
+  * every call to one of the methods, per monad class. For monads like
+    State, Reader, IO and Promise, where the methods only record the
+    computation, this is the cost of building the computation.
+  * every call to the functions passed to those methods, per monad
+    class, method and function (by qualified name). This is where the
+    time actually goes when the computation is run. Coroutine
+    functions are timed until the coroutine completes.
+
+Calls made by pymonad itself, Monad.then calling map for instance,
+aren't counted separately.
+
+  Example:
+    import pymonad.instrument
+    from pymonad.maybe import Just
+
+    with pymonad.instrument.instrumented():
+        Just(1).map(inc).then(safe_div(0))
+    print(pymonad.instrument.report())
+
+Monad classes created after enable() is called are instrumented only
+if they don't define their own bind, map, amap or then methods.
+"""
+import asyncio
+import contextlib
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pymonad.monad
+import pymonad.runtime
+
+OPERATIONS = ('bind', 'map', 'amap', 'then')
+
+Key = Tuple[str, str, Optional[str]]
+
+class Statistics:
+    """ Aggregated timings for calls to a method or function.
+
+    Attributes:
+      count: the number of calls.
+      total_ns: the total time spent in those calls, in nanoseconds.
+      min_ns: the shortest call, in nanoseconds.
+      max_ns: the longest call, in nanoseconds.
+      histogram: maps n to the number of calls which took at least
+        2**(n-1) and less than 2**n nanoseconds.
+    """
+    __slots__ = ('count', 'total_ns', 'min_ns', 'max_ns', 'histogram')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.histogram = {}
+
+    @property
+    def mean_ns(self) -> float:
+        """ The average time per call, in nanoseconds. """
+        return self.total_ns / self.count if self.count else 0.0
+
+    def add(self, elapsed_ns: int) -> None:
+        """ Records a call which took 'elapsed_ns' nanoseconds. """
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if self.min_ns is None or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        bucket = elapsed_ns.bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def copy(self) -> 'Statistics':
+        """ Returns an independent copy of these statistics. """
+        statistics = Statistics()
+        statistics.count = self.count
+        statistics.total_ns = self.total_ns
+        statistics.min_ns = self.min_ns
+        statistics.max_ns = self.max_ns
+        statistics.histogram = dict(self.histogram)
+        return statistics
+
+    def __repr__(self):
+        return f'Statistics(count={self.count}, mean_ns={self.mean_ns:.0f}, max_ns={self.max_ns})'
+
+_lock = threading.Lock()
+_statistics: Dict[Key, Statistics] = {}
+_originals: Dict[Tuple[type, str], Callable] = {}
+_state = threading.local()
+
+def _record(key: Key, elapsed_ns: int) -> None:
+    with _lock:
+        statistics = _statistics.get(key)
+        if statistics is None:
+            statistics = _statistics[key] = Statistics()
+        statistics.add(elapsed_ns)
+
+def _instrument_function(monad_name: str, operation: str, function: Callable) -> Callable:
+    key = (monad_name, operation, pymonad.runtime.function_name(function))
+    if asyncio.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def _instrumented_coroutine(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                _record(key, time.perf_counter_ns() - start)
+        return _instrumented_coroutine
+
+    @functools.wraps(function)
+    def _instrumented(*args, **kwargs):
+        # Code in user functions is counted even when the function is
+        # called from inside an instrumented method.
+        internal = getattr(_state, 'internal', False)
+        _state.internal = False
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(key, time.perf_counter_ns() - start)
+            _state.internal = internal
+    return _instrumented
+
+def _instrument_method(operation: str, method: Callable) -> Callable:
+    @functools.wraps(method)
+    def _instrumented(self, argument, *args, **kwargs):
+        if getattr(_state, 'internal', False):
+            return method(self, argument, *args, **kwargs)
+        monad_name = type(self).__qualname__
+        if operation != 'amap' and callable(argument):
+            argument = _instrument_function(monad_name, operation, argument)
+        _state.internal = True
+        start = time.perf_counter_ns()
+        try:
+            return method(self, argument, *args, **kwargs)
+        finally:
+            _record((monad_name, operation, None), time.perf_counter_ns() - start)
+            _state.internal = False
+    return _instrumented
+
+def _monad_classes() -> Iterator[type]:
+    seen = set()
+    remaining = [pymonad.monad.Monad]
+    while remaining:
+        cls = remaining.pop()
+        if cls not in seen:
+            seen.add(cls)
+            remaining.extend(cls.__subclasses__())
+            yield cls
+
+def enable() -> None:
+    """ Replaces bind, map, amap and then on every monad class with instrumented versions. """
+    with _lock:
+        if _originals:
+            return
+        for cls in _monad_classes():
+            for operation in OPERATIONS:
+                method = cls.__dict__.get(operation)
+                if callable(method):
+                    _originals[(cls, operation)] = method
+                    setattr(cls, operation, _instrument_method(operation, method))
+
+def disable() -> None:
+    """ Restores the original bind, map, amap and then methods. """
+    with _lock:
+        for (cls, operation), method in _originals.items():
+            setattr(cls, operation, method)
+        _originals.clear()
+
+def is_enabled() -> bool:
+    """ Returns True if instrumentation is enabled. """
+    return bool(_originals)
+
+def reset() -> None:
+    """ Discards every measurement collected so far. """
+    with _lock:
+        _statistics.clear()
+
+def snapshot() -> Dict[Key, Statistics]:
+    """ Returns a copy of the measurements collected so far.
+
+    Returns:
+      A dictionary mapping (monad class, operation, function) to the
+      Statistics for that key. 'function' is None for calls to the
+      method itself and the qualified name of the function passed to
+      the method otherwise.
+    """
+    with _lock:
+        return {key: statistics.copy() for key, statistics in _statistics.items()}
+
+def report() -> str:
+    """ Returns a table of the measurements collected so far, slowest total time first. """
+    lines = [f'{"monad":<12} {"operation":<9} {"calls":>8} {"total ms":>10}'
+             f' {"mean ns":>10} {"max ns":>10}  function']
+    rows: List[Tuple[Key, Statistics]] = sorted(
+        snapshot().items(), key=lambda item: item[1].total_ns, reverse=True
+    )
+    for (monad_name, operation, function), statistics in rows:
+        lines.append(
+            f'{monad_name:<12} {operation:<9} {statistics.count:>8}'
+            f' {statistics.total_ns / 1e6:>10.3f} {statistics.mean_ns:>10.0f}'
+            f' {statistics.max_ns:>10}  {function or "-"}'
+        )
+    return '\n'.join(lines)
+
+@contextlib.contextmanager
+def instrumented() -> Iterator[None]:
+    """ Enables instrumentation inside a 'with' block, disabling it on exit if it wasn't already enabled. """
+    already_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not already_enabled:
+            disable()
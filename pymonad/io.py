@@ -4,23 +4,35 @@
 # --------------------------------------------------------
 """ Implements a monadic wrapper type for impure procedures. """
 
-from typing import Any, Callable, Generic, Tuple, TypeVar, Union # pylint: disable=unused-import
+from typing import Any, Callable, Generic, Iterable, List, Tuple, TypeVar, Union # pylint: disable=unused-import
 
+import pymonad.chain
 import pymonad.monad
+from pymonad.chain import BIND, MAP, THEN
 
 A = TypeVar('A') # pylint: disable=invalid-name
 B = TypeVar('B') # pylint: disable=invalid-name
 
-def _bind_or_map(monad_value, function):
-    def _internal():
-        result = function(monad_value.run())
-        try:
-            return result.run()
-        except AttributeError:
-            return result
-    return _internal
+class _IOChain(pymonad.chain.Chain):
+    """ An IO action stored as a flat chain of steps. """
+    __slots__ = ()
+
+    def __call__(self):
+        return _run(self)
+
+def _run(io_function):
+    """ Runs an IO action and every action chained to it. """
+    return pymonad.chain.run(_IOChain, io_function, _call, _IO, _action)
+
+def _call(function):
+    return function()
+
+def _action(io_value):
+    return io_value.value
 
 class _IO(pymonad.monad.Monad, Generic[A]):
+    __slots__ = ()
+
     @classmethod
     def insert(cls, value: A) -> '_IO[A]':
         """ See Monad.insert. """
@@ -30,13 +42,21 @@ class _IO(pymonad.monad.Monad, Generic[A]):
         """ See Monad.amap. """
         return self.__class__(lambda: self.run()(monad_value.run()), None)
 
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ See Monad.apply_to_arguments. """
+        return cls(
+            lambda: pymonad.monad.call_with_values(function, [argument.run() for argument in arguments]),
+            None
+        )
+
     def bind(self: '_IO[A]', kleisli_function: Callable[[A], '_IO[B]']) -> '_IO[B]':
         """ See Monad.bind. """
-        return self.__class__(lambda: kleisli_function(self.run()).run(), None)
+        return self.__class__(_IOChain.extend(self.value, BIND, kleisli_function), None)
 
     def map(self: '_IO[A]', function: Callable[[A], B]) -> '_IO[B]':
         """ See Monad.map. """
-        return self.__class__(lambda: function(self.run()), None)
+        return self.__class__(_IOChain.extend(self.value, MAP, function), None)
 
     def run(self: '_IO[A]') -> A:
         """ Executes the contained impure proceedure.
@@ -44,13 +64,54 @@ class _IO(pymonad.monad.Monad, Generic[A]):
         Result:
           Can return any type.
         """
-        return self.value()
+        return _run(self.value)
+
+    @classmethod
+    def sequence(cls, actions: Iterable['_IO[A]']) -> '_IO[List[A]]':
+        """ Combines several IO actions into a single action.
+
+        Example:
+          read_all = IO.sequence(IO(lambda: print(name)) for name in names)
+          read_all.run() # prints every name, in order
+
+        Args:
+          actions: any iterable of IO actions. The iterable is consumed
+            immediately so the resulting action can be run more than once.
+
+        Result:
+          A new IO action which runs every action in order, one after the
+          other, and returns a list of their results.
+        """
+        actions = list(actions)
+        return cls(lambda: [action.run() for action in actions], None)
+
+    @classmethod
+    def traverse(
+            cls, kleisli_function: Callable[[A], '_IO[B]'], values: Iterable[A]
+    ) -> '_IO[List[B]]':
+        """ Maps a kleisli function over 'values' and sequences the resulting actions.
+
+        Example:
+          read_files = IO.traverse(lambda path: IO(lambda: open(path).read()), paths)
+
+        Args:
+          kleisli_function: a function taking a single value and returning
+            an IO action.
+          values: any iterable. It is consumed immediately so the resulting
+            action can be run more than once.
+
+        Result:
+          A new IO action which, when run, calls 'kleisli_function' on each
+          value, runs the resulting action and returns a list of the results.
+        """
+        values = list(values)
+        return cls(lambda: [kleisli_function(value).run() for value in values], None)
 
     def then(
             self: '_IO[A]', function: Union[Callable[[A], B], Callable[[A], '_IO[B]']]
     ) -> '_IO[B]':
         """ See Monad.then. """
-        return self.__class__(_bind_or_map(self, function), None)
+        return self.__class__(_IOChain.extend(self.value, THEN, function), None)
 
 def IO(function: Callable[[], A]) -> _IO[A]: # pylint: disable=invalid-name
     """ The IO Monad constructor function.
@@ -66,3 +127,5 @@ def IO(function: Callable[[], A]) -> _IO[A]: # pylint: disable=invalid-name
 
 IO.apply = _IO.apply
 IO.insert = _IO.insert
+IO.sequence = _IO.sequence
+IO.traverse = _IO.traverse
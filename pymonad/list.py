@@ -21,9 +21,31 @@ move.
                    .then(knight_move)
                    .then(knight_move)
                    .then(knight_move))
+
+ListMonad computes every result at every step. LazyListMonad works
+the same way but computes results one at a time, only as they are
+needed, so searches which only need some of the results can stop
+early and only the branch being explored is held in memory.
+
+  Example:
+    # The first square reachable in 3 moves which is a corner, if any.
+    corner = (LazyListMonad
+              .insert(initial_position)
+              .then(knight_move) # knight_move can still return a ListMonad.
+              .then(knight_move)
+              .then(knight_move)
+              .filter(is_corner)
+              .first())          # Just(square) or Nothing.
+
+Comparing a LazyListMonad with == computes its elements, up to the
+first one which differs, so comparing two infinite LazyListMonads
+which are equal never finishes and comparing one created from a
+generator uses the generator up.
 """
-from typing import Any, Callable, Generic, List, TypeVar, Union # pylint: disable=unused-import
+import itertools
+from typing import Any, Callable, Generic, Iterable, Iterator, List, TypeVar, Union # pylint: disable=unused-import
 
+import pymonad.maybe
 import pymonad.monad
 import pymonad.monoid
 
@@ -31,6 +53,8 @@ S = TypeVar('S') # pylint: disable=invalid-name
 T = TypeVar('T') # pylint: disable=invalid-name
 
 class _List(pymonad.monad.Monad, pymonad.monoid.Monoid, Generic[T]):
+    __slots__ = ()
+
     @classmethod
     def insert(cls, value: T) -> '_List[T]':
         return cls([value], None)
@@ -46,9 +70,22 @@ class _List(pymonad.monad.Monad, pymonad.monoid.Monoid, Generic[T]):
                 result.append(function(value))
         return self.__class__(result, None)
 
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ See Monad.apply_to_arguments. """
+        return cls(
+            [pymonad.monad.call_with_values(function, values)
+             for values in itertools.product(*arguments)],
+            None
+        )
+
     def bind(self: '_List[S]', kleisli_function: Callable[[S], '_List[T]']) -> '_List[T]':
         return self.map(kleisli_function).join()
 
+    def halts_chain(self) -> bool:
+        """ See Monad.halts_chain """
+        return not self.value
+
     def join(self: '_List[_List[T]]') -> '_List[T]':
         """ Flattens a nested ListMonad instance one level. """
         return self.__class__( # pytype: disable=not-callable
@@ -61,11 +98,16 @@ class _List(pymonad.monad.Monad, pymonad.monoid.Monoid, Generic[T]):
     def then(
             self: '_List[S]', function: Union[Callable[[S], T], Callable[[S], '_List[T]']]
     ) -> '_List[T]':
-        return_value = self.map(function)
-        try:
-            return return_value.join()
-        except (TypeError, AttributeError):
-            return return_value
+        result = []
+        for value in self:
+            function_result = function(value)
+            # Plain lists are flattened too, as they always have been,
+            # but not other iterables such as strings.
+            if isinstance(function_result, (_List, list)):
+                result.extend(function_result)
+            else:
+                result.append(function_result)
+        return self.__class__(result, None)
 
     def addition_operation(self, other):
         if other is pymonad.monoid.IDENTITY: # pylint: disable=no-else-return
@@ -74,6 +116,8 @@ class _List(pymonad.monad.Monad, pymonad.monoid.Monoid, Generic[T]):
             return self.__class__((self.value + other.value), None)
 
     def __eq__(self, other):
+        if isinstance(other, _LazyList):
+            return NotImplemented
         return self.value == other.value
 
     def __getitem__(self, index):
@@ -109,3 +153,127 @@ def ListMonad(*elements: List[T]) -> _List[T]: # pylint: disable=invalid-name
 ListMonad.insert = _List.insert
 ListMonad.apply = _List.apply
 ListMonad.identity_element = _List.identity_element
+
+def _flatten(lists):
+    for elements in lists:
+        yield from elements
+
+def _then(values, function):
+    for value in values:
+        result = function(value)
+        if isinstance(result, (_List, _LazyList, list)):
+            yield from result
+        else:
+            yield result
+
+_MISSING = object() # Pads the shorter list when comparing LazyListMonads.
+
+class _LazyList(pymonad.monad.Monad, Generic[T]):
+    """ The lazy List monad class.
+
+    'value' is a function taking no arguments and returning a new
+    iterator over the elements, so that a LazyListMonad can be iterated
+    more than once unless it was created from a one-shot iterable, a
+    generator for instance.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def insert(cls, value: T) -> '_LazyList[T]':
+        """ See Monad.insert. """
+        return cls(lambda: iter((value,)), None)
+
+    @classmethod
+    def from_iterable(cls, elements: Iterable[T]) -> '_LazyList[T]':
+        """ Creates a LazyListMonad of the elements of any iterable, a ListMonad for instance.
+
+        The iterable isn't copied: it's iterated every time the
+        LazyListMonad is.
+        """
+        return cls(lambda: iter(elements), None)
+
+    def amap(self: '_LazyList[Callable[[S], T]]', monad_value: '_LazyList[S]') -> '_LazyList[T]':
+        """ See Monad.amap. """
+        return self.__class__(
+            lambda: (function(value) for function in self for value in monad_value), None
+        )
+
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ See Monad.apply_to_arguments. """
+        return cls(
+            lambda: (pymonad.monad.call_with_values(function, values)
+                     for values in itertools.product(*arguments)),
+            None
+        )
+
+    def any(self: '_LazyList[T]', predicate: Callable[[T], Any] = bool) -> bool:
+        """ Returns True if 'predicate' is true for any element, stopping at the first one. """
+        return any(predicate(element) for element in self)
+
+    def bind(self: '_LazyList[S]', kleisli_function: Callable[[S], Iterable[T]]) -> '_LazyList[T]':
+        """ See Monad.bind. 'kleisli_function' can return a ListMonad or LazyListMonad. """
+        return self.__class__(lambda: _flatten(map(kleisli_function, self)), None)
+
+    def filter(self: '_LazyList[T]', predicate: Callable[[T], Any]) -> '_LazyList[T]':
+        """ Keeps the elements for which 'predicate' is true. """
+        return self.__class__(lambda: filter(predicate, self), None)
+
+    def first(self: '_LazyList[T]') -> 'pymonad.maybe.Maybe[T]':
+        """ Returns Just the first element, computing no others, or Nothing if there are none. """
+        for element in self:
+            return pymonad.maybe.Just(element)
+        return pymonad.maybe.Nothing
+
+    def join(self: '_LazyList[Iterable[T]]') -> '_LazyList[T]':
+        """ Flattens a nested LazyListMonad instance one level. """
+        return self.__class__(lambda: _flatten(self), None)
+
+    def map(self: '_LazyList[S]', function: Callable[[S], T]) -> '_LazyList[T]':
+        """ See Monad.map. """
+        return self.__class__(lambda: map(function, self), None)
+
+    def take(self: '_LazyList[T]', number: int) -> '_LazyList[T]':
+        """ Keeps the first 'number' elements, computing no others. """
+        return self.__class__(lambda: itertools.islice(self, number), None)
+
+    def then(
+            self: '_LazyList[S]', function: Union[Callable[[S], T], Callable[[S], Iterable[T]]]
+    ) -> '_LazyList[T]':
+        """ See Monad.then. """
+        return self.__class__(lambda: _then(self, function), None)
+
+    def to_list(self: '_LazyList[T]') -> _List[T]:
+        """ Computes every element and returns them in a ListMonad. """
+        return _List(list(self), None)
+
+    def __eq__(self, other):
+        """ Compares the elements one at a time, computing them, up to the first difference. """
+        if isinstance(other, (_List, _LazyList)):
+            return all(
+                element == other_element
+                for element, other_element in itertools.zip_longest(self, other, fillvalue=_MISSING)
+            )
+        return NotImplemented
+
+    def __iter__(self) -> Iterator[T]:
+        return self.value()
+
+    def __repr__(self):
+        return 'LazyListMonad(...)'
+
+def LazyListMonad(*elements: T) -> _LazyList[T]: # pylint: disable=invalid-name
+    """ Creates an instance of the lazy List monad.
+
+    Args:
+      *elements: any number of elements to be inserted into the list.
+        See LazyListMonad.from_iterable for other sources of elements.
+
+    Returns:
+      An instance of the lazy List monad.
+    """
+    return _LazyList(lambda: iter(elements), None)
+
+LazyListMonad.apply = _LazyList.apply
+LazyListMonad.from_iterable = _LazyList.from_iterable
+LazyListMonad.insert = _LazyList.insert
@@ -21,7 +21,7 @@ The 'insert' class method is a wrapper around the 'Just' function.
   Example:
     x = Maybe.insert(9) # Same as Just(9)
 """
-from typing import Any, Callable, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar, Union
 
 import pymonad.monad
 
@@ -30,6 +30,8 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class Maybe(pymonad.monad.Monad, Generic[T]):
     """ The Maybe monad class. """
+    __slots__ = ()
+
     @classmethod
     def insert(cls, value: T) -> 'Maybe[T]':
         """ See Monad.insert """
@@ -42,6 +44,16 @@ class Maybe(pymonad.monad.Monad, Generic[T]):
         else:
             return monad_value.map(self.value)
 
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ See Monad.apply_to_arguments. """
+        values = []
+        for argument in arguments:
+            if not argument.monoid:
+                return cls(None, False)
+            values.append(argument.value)
+        return cls(pymonad.monad.call_with_values(function, values), True)
+
     def bind(self: 'Maybe[S]', kleisli_function: 'Callable[[S], Maybe[T]]') -> 'Maybe[T]':
         """ See Monad.bind """
         if self.monoid is False: #pylint: disable=no-else-return
@@ -49,6 +61,10 @@ class Maybe(pymonad.monad.Monad, Generic[T]):
         else:
             return kleisli_function(self.value)
 
+    def halts_chain(self) -> bool:
+        """ See Monad.halts_chain """
+        return self.monoid is False
+
     def is_just(self) -> bool:
         """ Returns True if the monad instance was created with the 'Just' function. """
         return self.monoid
@@ -96,6 +112,18 @@ class Maybe(pymonad.monad.Monad, Generic[T]):
 
     option = maybe
 
+    def then(
+            self: 'Maybe[S]', function: Union[Callable[[S], T], Callable[[S], 'Maybe[T]']]
+    ) -> 'Maybe[T]':
+        """ See Monad.then """
+        if self.monoid is False:
+            return self
+        result = function(self.value)
+        if isinstance(result, pymonad.monad.Monad): # pylint: disable=no-else-return
+            return result
+        else:
+            return self.__class__(result, True) # pytype: disable=not-callable
+
     def __eq__(self, other):
         """ Checks equality of Maybe objects.
 
@@ -124,6 +152,8 @@ Nothing: Maybe[Any] = Maybe(None, False) # pylint: disable=invalid-name
 
 class Option(Maybe[T]): # MonadAlias must be the first parent class
     """ An alias for the Maybe monad class. """
+    __slots__ = ()
+
     def __repr__(self):
         return f'Some {self.value}' if self.monoid else 'Nothing'
 
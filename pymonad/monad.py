@@ -14,12 +14,52 @@ how to implement them properly.
 
 # pytype complains if Any isn't imported even though it's not used anywhere.
 from typing import Any # pylint: disable=unused-import
-from typing import Callable, Generic, TypeVar, Union
+from typing import Callable, Generic, Sequence, TypeVar, Union
+
+import pymonad.chain
+import pymonad.monoid
 
 S = TypeVar('S') # pylint: disable=invalid-name
 T = TypeVar('T') # pylint: disable=invalid-name
 
-class Monad(Generic[T]):
+def call_with_values(function: Callable, values: Sequence[Any]) -> Any:
+    """ Calls 'function' with each of 'values' in turn.
+
+    The result is the same as a chain of amap calls would produce:
+    function(a)(b)(c) for values [a, b, c]. Calls with one or two
+    values, by far the most common, are spelled out to avoid the loop.
+    """
+    number_of_values = len(values)
+    if number_of_values == 1:
+        return function(values[0])
+    if number_of_values == 2:
+        return function(values[0])(values[1])
+    for value in values:
+        function = function(value)
+    return function
+
+class _Applicative:
+    """ Provides the 'to_arguments' method returned by Monad.apply. """
+    __slots__ = ('_cls', '_function')
+
+    def __init__(self, cls, function):
+        self._cls = cls
+        self._function = function
+
+    def to_arguments(self, *args):
+        """ Applies arguments to the function wrapped by the call to the apply method.
+
+        Args:
+          *args: a variable number of arguments to be supplied
+             to the function wrapped by a previous call to the
+             'apply method.
+
+        Returns:
+          A monadic value of type 'cls'
+        """
+        return self._cls.apply_to_arguments(self._function, args)
+
+class Monad(pymonad.monoid.Value, Generic[T]):
     """
     Represents a "context" in which calculations can be executed.
 
@@ -28,6 +68,8 @@ class Monad(Generic[T]):
     while maintaining the context of that specific monad.
 
     """
+    __slots__ = ('monoid',)
+
     def __init__(self, value, monoid):
         """ Initializes the internal values of the monad instance.
 
@@ -72,34 +114,33 @@ class Monad(Generic[T]):
           function: A regular function which returns non-monadic values.
 
         Returns:
-          A monad object based on the input class with the wrapped
-          function and a new method, 'to_arguments' which will apply
-          the function.
+          An object with a single method, 'to_arguments', which will
+          apply the function to its arguments and return a monad value
+          of the input class.
         """
-        class _Applicative(cls):
-            """ An internal class which provides the 'to_arguments' method. """
-            amap = cls.amap
-            bind = cls.bind
-            insert = cls.insert
-            map = cls.map
-            @staticmethod
-            def to_arguments(*args):
-                """ Applies arguments to the function wrapped by the call to the apply method.
-
-                Args:
-                  *args: a variable number of arguments to be supplied
-                     to the function wrapped by a previous call to the
-                     'apply method.
-
-                Returns:
-                  A monadic value of type 'cls'
-                """
-                result = cls.insert(function)
-                for arg in args:
-                    result = result.amap(arg)
-                return cls(result.value, result.monoid)
-
-        return _Applicative(None, None) # We don't actually care about the inputs here
+        return _Applicative(cls, function)
+
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ Applies 'function' to the values inside 'arguments'.
+
+        This is the method behind 'to_arguments'. The default
+        implementation inserts 'function' and calls amap once for each
+        argument. Sub-classes may override it with a direct
+        implementation which avoids building an intermediate monad
+        value for every argument.
+
+        Args:
+          function: a regular function which returns non-monadic values.
+          arguments: a sequence of monad values of type 'cls'.
+
+        Returns:
+          A monadic value of type 'cls'.
+        """
+        result = cls.insert(function)
+        for argument in arguments:
+            result = result.amap(argument)
+        return cls(result.value, result.monoid)
 
     @classmethod
     def insert(cls, value: T) -> 'Monad[T]':
@@ -116,6 +157,15 @@ class Monad(Generic[T]):
         """ Applies 'function' to the result of a previous monadic calculation. """
         raise NotImplementedError
 
+    def halts_chain(self) -> bool:
+        """ Returns True if no further bind, map or then can change this value.
+
+        Monads with a failure or empty value, like Nothing or Left,
+        override this method so lazy chains can skip their remaining
+        steps. See Monad.lazy.
+        """
+        return False
+
     def join(self: 'Monad[Monad[T]]') -> 'Monad[T]':
         """ Unpacks a nested monad instance one level. """
         def _join(value):
@@ -125,6 +175,26 @@ class Monad(Generic[T]):
                 raise TypeError(f'Cannot join() \'{self}\'')
         return self.bind(_join)
 
+    def lazy(self: 'Monad[T]') -> 'pymonad.chain.Lazy':
+        """ Starts a lazy chain of steps applied to this monad value.
+
+        Calls to bind, map and then on the returned object are only
+        recorded. Calling its 'run' method applies them, fusing
+        consecutive maps into one and stopping early if halts_chain()
+        becomes True.
+
+        Example:
+          (Just(1).lazy()
+           .map(add(1))
+           .map(mul(2))
+           .then(lambda x: Just(x - 1))
+           .run()) # Just(3)
+
+        Returns:
+          A pymonad.chain.Lazy object.
+        """
+        return pymonad.chain.Lazy(self)
+
     def map(self: 'Monad[S]', function: Callable[[S], T]) -> 'Monad[T]':
         """ Applies 'function' to the contents of the functor and returns a new functor value. """
         raise NotImplementedError("'fmap' not defined.")
@@ -136,9 +206,16 @@ class Monad(Generic[T]):
 
         Instead of worrying about whether to use bind or fmap,
         users can just use the then method to chain function
-        calls together. The then method uses attempts to use
-        bind first and if that doesn't work, uses fmap
-        instead.
+        calls together. The then method maps 'function' over the
+        monad value and, if 'function' returned a monad value,
+        joins the result. The choice is made by checking the type of
+        the result so exceptions raised by 'function' are never
+        mistaken for a failed bind.
+
+        The default implementation assumes that, as for Maybe,
+        Either or Writer, the 'value' of the mapped result holds the
+        result of calling 'function'. Monads where that isn't the
+        case should override then.
 
         Args:
           function: A python function or lambda expression
@@ -150,7 +227,7 @@ class Monad(Generic[T]):
           A monad value of the same type as 'self'
         """
         result = self.map(function)
-        try:
+        if isinstance(result.value, Monad): # pylint: disable=no-else-return
             return result.join()
-        except (TypeError, AttributeError):
+        else:
             return result
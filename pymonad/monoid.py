@@ -39,7 +39,17 @@ from typing import (
 T = TypeVar("T")  # pylint: disable=invalid-name
 
 
-class Monoid[T]:
+class Value:
+    """Holds the 'value' attribute of Monoid and Monad instances.
+
+    Monoid and Monad both store their data in 'value' and some
+    classes, ListMonad for instance, are both. Declaring the slot once,
+    here, lets such classes use __slots__ without a lay-out conflict.
+    """
+    __slots__ = ("value", "__weakref__")
+
+
+class Monoid[T](Value):
     """Base class for Monoid instances.
 
     To implement a monoid instance, create a sub-class of Monoid and
@@ -47,6 +57,7 @@ class Monoid[T]:
     ensuring that the closure, identity, and associativity laws hold.
 
     """
+    __slots__ = ()
 
     @classmethod
     def wrap(cls, value: T) -> Self:
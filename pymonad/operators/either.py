@@ -14,6 +14,7 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class Either(pymonad.operators.operators.MonadOperators, pymonad.either.Either[S, T]): # pylint: disable=abstract-method
     """ See pymonad.operators.operators and pymonad.either. """
+    __slots__ = ()
 
 def Left(value: S) -> Either[S, Any]: # pylint: disable=invalid-name
     """ Creates a value of the first possible type in the Either monad. """
@@ -21,7 +22,7 @@ def Left(value: S) -> Either[S, Any]: # pylint: disable=invalid-name
 
 def Right(value: T) -> Either[Any, T]: # pylint: disable=invalid-name
     """ Creates a value of the second possible type in the Either monad. """
-    return Either(value, (None, True))
+    return Either(value, pymonad.either._RIGHT) # pylint: disable=protected-access
 
 
 
@@ -30,6 +31,8 @@ def Right(value: T) -> Either[Any, T]: # pylint: disable=invalid-name
 
 
 class _Error(Either[S, T]): # pylint: disable=too-many-ancestors, abstract-method
+    __slots__ = ()
+
     def __repr__(self):
         return f'Result: {self.value}' if self.is_right() else f'Error: {self.monoid[0]}' # pylint: disable=no-member
 
@@ -39,6 +42,6 @@ def Error(value: S) -> _Error[S, Any]: # pylint: disable=invalid-name
 
 def Result(value: T) -> _Error[Any, T]: # pylint: disable=invalid-name
     """ Creates a value representing the successful result of a calculation. """
-    return _Error(value, (None, True))
+    return _Error(value, pymonad.either._RIGHT) # pylint: disable=protected-access
 
 Error.insert = _Error.insert
@@ -13,6 +13,7 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class _IO(pymonad.operators.operators.MonadOperators, pymonad.io._IO[T]): # pylint: disable=protected-access, abstract-method
     """ See pymonad.operators.operators and pymonad.io. """
+    __slots__ = ()
 
 def IO(io_function: Callable[[], T]) -> _IO[T]: # pylint: disable=invalid-name
     """ The IO monad constructor function.
@@ -24,3 +25,5 @@ def IO(io_function: Callable[[], T]) -> _IO[T]: # pylint: disable=invalid-name
 
 IO.apply = _IO.apply
 IO.insert = _IO.insert
+IO.sequence = _IO.sequence
+IO.traverse = _IO.traverse
@@ -13,6 +13,7 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class _List(pymonad.operators.operators.MonadOperators, pymonad.list._List[T]): # pylint: disable=protected-access, too-many-ancestors, abstract-method
     """ See pymonad.operators.operators and pymonad.list. """
+    __slots__ = ()
 
 def ListMonad(*elements: List[T]) -> _List[T]: # pylint: disable=invalid-name
     """ Creates an instance of the List monad.
@@ -28,3 +29,26 @@ def ListMonad(*elements: List[T]) -> _List[T]: # pylint: disable=invalid-name
 
 ListMonad.apply = _List.apply
 ListMonad.insert = _List.insert
+
+class _LazyList(pymonad.operators.operators.MonadOperators, pymonad.list._LazyList[T]): # pylint: disable=protected-access, abstract-method
+    """ See pymonad.operators.operators and pymonad.list. """
+    __slots__ = ()
+
+    def to_list(self: '_LazyList[T]') -> _List[T]:
+        """ Computes every element and returns them in a ListMonad with operators. """
+        return _List(list(self), None)
+
+def LazyListMonad(*elements: T) -> _LazyList[T]: # pylint: disable=invalid-name
+    """ Creates an instance of the lazy List monad.
+
+    Args:
+      *elements: any number of elements to be inserted into the list
+
+    Returns:
+      An instance of the lazy List monad.
+    """
+    return _LazyList(lambda: iter(elements), None)
+
+LazyListMonad.apply = _LazyList.apply
+LazyListMonad.from_iterable = _LazyList.from_iterable
+LazyListMonad.insert = _LazyList.insert
@@ -13,6 +13,7 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class Maybe(pymonad.operators.operators.MonadOperators, pymonad.maybe.Maybe[T]): # pylint: disable=abstract-method
     """ See pymonad.operators.operators and pymonad.maybe. """
+    __slots__ = ()
 
 def Just(value: T) -> Maybe[T]: # pylint: disable=invalid-name
     """ A Maybe object representing the presence of an optional value. """
@@ -27,6 +28,8 @@ Nothing = Maybe(None, False) # pylint: disable=invalid-name
 
 class Option(Maybe[T]): # pylint: disable=too-many-ancestors, abstract-method
     """ An alias for the Maybe monad class. """
+    __slots__ = ()
+
     def __repr__(self):
         return f'Some {self.value}' if self.monoid else 'Nothing' # pylint: disable=no-member
 
@@ -29,6 +29,8 @@ class MonadOperators(pymonad.monad.Monad): # pylint: disable=abstract-method
     MonadOperators is a MonadAlias which is used to add operators for
     map (*), amap (&), and bind (>>) methods to Monad classes.
     """
+    __slots__ = ()
+
     def __and__(self, monad_value):
         return self.amap(monad_value)
 
@@ -14,6 +14,7 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class _Reader(pymonad.operators.operators.MonadOperators, pymonad.reader._Reader[R, T]): # pylint: disable=protected-access, abstract-method
     """ See pymonad.operators.operators and pymonad.reader. """
+    __slots__ = ()
 
 def Reader(function: Callable[[R], T]) -> _Reader[R, T]: # pylint: disable=invalid-name
     """ Creates an instance of the Reader monad.
@@ -14,3 +14,4 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class State(pymonad.operators.operators.MonadOperators, pymonad.state.State[S, T]): # pylint: disable=protected-access, abstract-method
     """ See pymonad.operators.operators and pymonad.state. """
+    __slots__ = ()
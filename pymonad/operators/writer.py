@@ -13,3 +13,4 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class Writer(pymonad.operators.operators.MonadOperators, pymonad.writer.Writer[T]): # pylint: disable=abstract-method
     """ See pymonad.operators.operators and pymonad.writer. """
+    __slots__ = ()
@@ -49,8 +49,10 @@ which allows for recovery from errors.
 The above example will print the value '3' to the screen. The
 'long_id' coroutine is a stand-in for any async operation that may
 take some amount of time. When we await the Promise inside the print()
-call it waits for both arguments to complete before calling 'add' with
-the results. If the first call to 'catch' were removed then the error
+call it runs both arguments concurrently, so the program takes one
+second rather than two, and waits for both to complete before calling
+'add' with the results. If one of the arguments fails, the others are
+cancelled. If the first call to 'catch' were removed then the error
 would propagate and be caught by the second call. The program would
 then print the string 'Recovering...' instead of '3'.
 
@@ -92,12 +94,54 @@ accepts an Exception as it's input.
     asyncio.run(main())
 
 This program prints "<type 'IndexError'>" as its output.
+
+Like asyncio Futures, Promises run at most once. When the same promise
+is used by several others, or passed to Promise.apply more than once,
+the computation runs the first time it's awaited and every other await
+gets the same result or exception. If that first await is cancelled,
+the next await starts the computation again. A Promise which should
+run again every time it's awaited can be created with
+Promise(function, memoize=False).
+
+  Example:
+    async def main():
+        x = Promise.insert(1).then(long_id) # long_id only runs once...
+        print(await Promise.apply(add).to_arguments(x, x))
+        print(await x)                       # ...even if awaited again.
+
+A Promise can be given a time limit with 'timeout'. When the time is
+up, everything the Promise started is cancelled, and has stopped, by
+the time the asyncio.TimeoutError is raised. The deadline also applies
+to every promise awaited while running it, so a timeout set deeper in
+the chain, inside a function passed to 'then' for instance, can only
+shorten it. Such functions can check how much time is left with
+remaining_time().
+
+  Example:
+    async def main():
+        x = Promise.insert(1).then(long_id).timeout(0.5)
+        print(await x.catch(lambda error: 'Too slow.'))
 """
 import asyncio
-from typing import Callable, Generic, TypeVar, Union, Awaitable
+import collections
+import concurrent.futures
+import contextvars
+import functools
+import inspect
+import multiprocessing
+import random
+import threading
+import types
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Generic, Iterable, List, Mapping, Optional,
+    Tuple, Type, TypeVar, Union
+)
 
+import pymonad.either
 import pymonad.monad
+import pymonad.runtime
 import pymonad.tools
+from pymonad.chain import BIND, MAP, THEN
 
 S = TypeVar('S') # pylint: disable=invalid-name
 T = TypeVar('T') # pylint: disable=invalid-name
@@ -112,33 +156,396 @@ def _reject(error):
     else:
         raise error
 
+# The event loop time at which the innermost Promise.timeout being run expires.
+_deadline: contextvars.ContextVar = contextvars.ContextVar('pymonad.promise.deadline', default=None)
+
+# While Promise.retry runs a second or later attempt, maps the id of each promise it can run again to
+# (promise, parent, step): promises listed which failed run again instead of failing with the same error.
+_retry_links: contextvars.ContextVar = contextvars.ContextVar('pymonad.promise.retry_links', default=None)
+
+# True while Promise.run_sync runs a promise, without an event loop.
+_running_sync: contextvars.ContextVar = contextvars.ContextVar('pymonad.promise.running_sync', default=False)
+
+class _NeedsEventLoop(BaseException):
+    """ Raised through the steps run by Promise.run_sync when one of them needs an event loop.
+
+    It isn't an Exception so that it isn't kept as the step's error,
+    or handled by a catch step: awaiting the promise runs it again.
+    """
+
+def remaining_time() -> Optional[float]:
+    """ Returns the number of seconds left before the current deadline.
+
+    Returns:
+      None if no Promise.timeout is being run, otherwise the time left,
+      in seconds, before the innermost one expires. It is never
+      negative.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - asyncio.get_running_loop().time())
+
+_process_pool = None # pylint: disable=invalid-name
+_process_pool_lock = threading.Lock()
+
+def _shared_process_pool():
+    """ Returns the process pool used by then_in_process, creating it the first time. """
+    global _process_pool # pylint: disable=global-statement, invalid-name
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Forking a process which runs an event loop, and likely
+            # threads, can deadlock the child so start fresh ones.
+            _process_pool = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _process_pool
+
+def _error(task):
+    return asyncio.CancelledError() if task.cancelled() else task.exception()
+
+def _settled(task):
+    error = _error(task)
+    if error is None: # pylint: disable=no-else-return
+        return pymonad.either.Right(task.result())
+    else:
+        return pymonad.either.Left(error)
+
+# Each promise is either a root, wrapping a (resolve, reject) function,
+# or a step following its parent promise. Memoized promises also go
+# through these states.
+_PENDING = 0
+_RUNNING = 1
+_DONE = 2
+
+_CATCH = 3 # A step kind, along with pymonad.chain's BIND, MAP and THEN.
+_CALL = 4 # The step of a promise created by Promise(function).
+_CALL_STEP = (_CALL, None)
+
+async def _run_steps(path, value, error):
+    """ Runs the promises in 'path', a root or settled promise's descendants, in order.
+
+    Every memoized promise in 'path' is claimed while it runs and
+    keeps its result, or error, once it's done so any other await of
+    that promise gets the same result without running it again.
+    """
+    for promise in path:
+        if promise._memoize: # pylint: disable=protected-access
+            promise._state = _RUNNING # pylint: disable=protected-access
+    try:
+        for promise in path:
+            step = promise._step # pylint: disable=protected-access
+            try:
+                if step is None:
+                    value = await promise.value(promise._resolve, _reject) # pylint: disable=protected-access
+                    error = None
+                elif error is None:
+                    # Coroutine functions are awaited once more than
+                    # the equivalent normal function would be.
+                    kind, function = step
+                    if kind == _CALL:
+                        value = promise.value(promise._resolve, _reject) # pylint: disable=protected-access
+                    elif kind == BIND:
+                        value = function(value)
+                        if type(value) is types.CoroutineType: # pylint: disable=unidiomatic-typecheck
+                            value = await value
+                        value = await value
+                    elif kind == MAP:
+                        value = function(value)
+                        if type(value) is types.CoroutineType: # pylint: disable=unidiomatic-typecheck
+                            value = await value
+                    elif kind == THEN:
+                        value = function(value)
+                        if type(value) is types.CoroutineType: # pylint: disable=unidiomatic-typecheck
+                            value = await value
+                        if inspect.isawaitable(value):
+                            value = await value
+                elif step[0] == _CATCH:
+                    value = step[1](error)
+                    error = None
+            except Exception as exception: # pylint: disable=broad-except
+                if _running_sync.get() and _needs_event_loop(exception):
+                    raise _NeedsEventLoop() from exception
+                error = exception
+            if promise._memoize: # pylint: disable=protected-access
+                promise._settle(value, error) # pylint: disable=protected-access
+    except BaseException:
+        # Cancelled or interrupted: forget about this run so the next
+        # await starts over.
+        for promise in path:
+            if promise._state == _RUNNING: # pylint: disable=protected-access
+                promise._wake(_PENDING) # pylint: disable=protected-access
+        raise
+    if error is not None:
+        raise error
+    return value
+
+def _needs_event_loop(error):
+    """ Returns True if 'error' is the one asyncio raises when there's no running event loop. """
+    return type(error) is RuntimeError and error.args == ('no running event loop',) # pylint: disable=unidiomatic-typecheck
+
+async def _await_promise(promise):
+    """ Runs 'promise', and any of its ancestors which haven't already run, in a single loop. """
+    while True:
+        path = []
+        value = error = None
+        node = promise
+        while True:
+            if node._memoize: # pylint: disable=protected-access
+                if node._state == _DONE: # pylint: disable=protected-access
+                    if node._error is None or not _restore_links(node):
+                        value, error = node._result, node._error # pylint: disable=protected-access
+                        break
+                    # Failed, but Promise.retry is running: run it again.
+                if node._state == _RUNNING: # pylint: disable=protected-access
+                    # Another await is already running it. Once it's
+                    # settled, or cancelled, start over from the top.
+                    await node._wait() # pylint: disable=protected-access
+                    path = None
+                    break
+            path.append(node)
+            node = node._parent # pylint: disable=protected-access
+            if node is None:
+                break
+        if path is None:
+            continue
+        if not path:
+            if error is not None:
+                raise error
+            return value
+        path.reverse()
+        span = pymonad.runtime.current_span.get()
+        if span is not None:
+            return await _run_traced_steps(path, value, error, span)
+        return await _run_steps(path, value, error)
+
+_STEP_KINDS = {BIND: 'bind', MAP: 'map', THEN: 'then', _CATCH: 'catch'}
+
+def _step_name(promise):
+    step = promise._step # pylint: disable=protected-access
+    if step is None or step[0] == _CALL:
+        return f'Promise {pymonad.runtime.function_name(promise.value)}'
+    return f'{_STEP_KINDS[step[0]]} {pymonad.runtime.function_name(step[1])}'
+
+async def _run_traced_steps(path, value, error, parent):
+    """ Like _run_steps but records a span for the chain, under 'parent', and one for each step run.
+
+    Promises are run one at a time so each step can be timed on its
+    own. Steps skipped because of an error, or catch steps with no
+    error to handle, aren't recorded.
+    """
+    # pylint: disable=protected-access
+    chain = parent.child('chain')
+    try:
+        for promise in path:
+            step = promise._step
+            if step is not None and step[0] != _CALL and (error is None) is (step[0] == _CATCH):
+                span = None
+                run = _run_steps((promise,), value, error)
+            else:
+                span = chain.child(_step_name(promise))
+                run = pymonad.runtime.Timed(_run_steps((promise,), value, error), span)
+                token = pymonad.runtime.current_span.set(span)
+            try:
+                value, error = await run, None
+            except Exception as exception: # pylint: disable=broad-except
+                value, error = None, exception
+                if span is not None:
+                    span.error = exception
+            finally:
+                if span is not None:
+                    pymonad.runtime.current_span.reset(token)
+                    span.finish()
+    finally:
+        chain.run_ns = sum(span.run_ns for span in chain.children)
+        chain.wait_ns = sum(span.wait_ns for span in chain.children)
+        chain.error = error
+        chain.finish()
+    if error is not None:
+        raise error
+    return value
+
 class _Promise(pymonad.monad.Monad, Generic[T]):
-    def __init__(self, value, monoid):
+    """ The Promise monad class.
+
+    Promises created with Promise() wrap a (resolve, reject) function.
+    Promises created with bind, map, then or catch instead record their
+    parent promise and a single step. Awaiting one runs the whole
+    chain, from the nearest promise which has already run, in one loop
+    inside one coroutine, no matter how long the chain is.
+    """
+    __slots__ = ('_memoize', '_parent', '_step', '_state', '_result', '_error', '_waiters')
+
+    _resolve = staticmethod(pymonad.tools.identity)
+
+    def __init__(self, value, monoid, memoize=True):
         super().__init__(value, monoid)
-        self._resolve = pymonad.tools.identity
+        self._memoize = memoize
+        self._parent = None
+        self._step = None
+        self._state = _PENDING
+        self._result = None
+        self._error = None
+        self._waiters = None
 
     @classmethod
     def insert(cls, value: T) -> '_Promise[T]':
-        """ See Monad.insert. """
-        return Promise(lambda resolve, reject: resolve(value))
+        """ See Monad.insert.
+
+        The new Promise is already resolved: calling map, bind or then
+        on it with a normal, synchronous, function calls that function
+        straight away rather than waiting for the Promise to be awaited.
+        """
+        return _settled_promise(cls, value, None)
+
+    @classmethod
+    def all(cls, promises: Iterable['_Promise[T]']) -> '_Promise[List[T]]':
+        """ Combines several promises into one promise of a list of their results.
+
+        Example:
+          pages = await Promise.all(fetch(url) for url in urls)
+
+        Args:
+          promises: any iterable of promises. It is consumed immediately.
+
+        Returns:
+          A new Promise which runs every promise concurrently and
+          resolves to a list of their results, in the same order as
+          'promises'. If any of the promises fails, the others are
+          cancelled and the new Promise fails with the same error.
+        """
+        promises = list(promises)
+        async def _all(resolve, reject): # pylint: disable=unused-argument
+            return resolve(await pymonad.runtime.gather(promises))
+        return cls(_awaiting(promises, _all), None)
+
+    @classmethod
+    def all_settled(
+            cls, promises: Iterable['_Promise[T]']
+    ) -> '_Promise[List[pymonad.either.Either[Exception, T]]]':
+        """ Waits for several promises to either succeed or fail.
+
+        Example:
+          for result in await Promise.all_settled(fetch(url) for url in urls):
+              print(result.either(lambda error: f'failed: {error}', len))
+
+        Args:
+          promises: any iterable of promises. It is consumed immediately.
+
+        Returns:
+          A new Promise which runs every promise concurrently and never
+          fails. It resolves to a list, in the same order as 'promises',
+          holding Right(result) for each promise which succeeded and
+          Left(error) for each promise which failed.
+        """
+        promises = list(promises)
+        async def _all_settled(resolve, reject): # pylint: disable=unused-argument
+            tasks = [asyncio.ensure_future(promise) for promise in promises]
+            try:
+                if tasks:
+                    await asyncio.wait(tasks)
+            finally:
+                await pymonad.runtime.cancel(tasks)
+            return resolve([_settled(task) for task in tasks])
+        return cls(_awaiting(promises, _all_settled), None)
 
     def amap(self: '_Promise[Callable[[S], T]]', monad_value: '_Promise[S]') -> '_Promise[T]':
         """ See Monad.amap. """
+        if self._is_resolved() and monad_value._is_resolved(): # pylint: disable=protected-access
+            return self._extend_settled(MAP, lambda function: function(monad_value._result)) # pylint: disable=protected-access
         async def _awaitable_amap(resolve, reject): # pylint: disable=unused-argument
-            function = await self
-            value = await monad_value
+            function, value = await pymonad.runtime.gather((self, monad_value))
             return resolve(function(value))
-        return self.__class__(_awaitable_amap, None)
+        return self.__class__(_awaiting((self, monad_value), _awaitable_amap), None, self._memoize)
+
+    @classmethod
+    def any(cls, promises: Iterable['_Promise[T]']) -> '_Promise[T]':
+        """ Resolves to the result of the first of several promises to succeed.
+
+        Example:
+          page = await Promise.any(fetch(mirror) for mirror in mirrors)
+
+        Args:
+          promises: any iterable of promises. It is consumed immediately
+            and must not be empty.
+
+        Returns:
+          A new Promise which runs every promise concurrently and
+          resolves to the result of the first one to succeed,
+          cancelling the others. If every promise fails, the new
+          Promise fails with an ExceptionGroup holding every error in
+          the same order as 'promises'. Promises which were cancelled
+          are left out of the group and, if every promise was
+          cancelled, the new Promise is cancelled too.
+        """
+        promises = list(promises)
+        if not promises:
+            raise ValueError('Promise.any needs at least one promise.')
+        async def _any(resolve, reject): # pylint: disable=unused-argument
+            tasks = [asyncio.ensure_future(promise) for promise in promises]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        return resolve(await next_done)
+                    except asyncio.CancelledError:
+                        if asyncio.current_task().cancelling():
+                            raise # Promise.any itself was cancelled.
+                    except Exception: # pylint: disable=broad-except
+                        pass
+            finally:
+                await pymonad.runtime.cancel(tasks)
+            errors = [error for error in map(_error, tasks) if isinstance(error, Exception)]
+            if not errors:
+                raise asyncio.CancelledError()
+            raise ExceptionGroup('Every promise passed to Promise.any failed.', errors) # pylint: disable=undefined-variable
+        return cls(_awaiting(promises, _any), None)
+
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ See Monad.apply_to_arguments. """
+        if all(isinstance(argument, _Promise) and argument._is_resolved() for argument in arguments): # pylint: disable=protected-access
+            values = [argument._result for argument in arguments] # pylint: disable=protected-access
+            return cls.insert(function)._extend_settled( # pylint: disable=protected-access
+                MAP, lambda function: pymonad.monad.call_with_values(function, values)
+            )
+        async def _awaitable_apply(resolve, reject): # pylint: disable=unused-argument
+            values = await pymonad.runtime.gather(arguments)
+            return resolve(pymonad.monad.call_with_values(function, values))
+        return cls(_awaiting(arguments, _awaitable_apply), None)
 
     def bind(self: '_Promise[S]', kleisli_function: Callable[[S], '_Promise[T]']) -> '_Promise[T]':
         """ See Monad.bind. """
-        if asyncio.iscoroutinefunction(kleisli_function):
-            async def _bind(resolve, _):
-                return await resolve(await kleisli_function(await self))
-        else:
-            async def _bind(resolve, _):
-                return resolve(await kleisli_function(await self))
-        return self.__class__(_bind, None)
+        return self._extend(BIND, kleisli_function)
+
+    @classmethod
+    def from_executor(
+            cls,
+            function: Callable[..., T],
+            *arguments: Any,
+            executor: Union[concurrent.futures.Executor, None] = None
+    ) -> '_Promise[T]':
+        """ Creates a Promise which calls a blocking function in an executor.
+
+        Example:
+          with open(path) as file_:
+              contents = await Promise.from_executor(file_.read)
+
+        Args:
+          function: a normal, synchronous, function.
+          arguments: the arguments 'function' is called with.
+          executor: a concurrent.futures.Executor, a ThreadPoolExecutor
+            or ProcessPoolExecutor for instance. If None, the event
+            loop's default executor, a thread pool, is used.
+
+        Returns:
+          A new Promise which resolves to the result of calling
+          'function' with 'arguments' in 'executor', leaving the event
+          loop free to run other coroutines in the meantime.
+        """
+        async def _from_executor(resolve, _):
+            loop = asyncio.get_running_loop()
+            return resolve(await loop.run_in_executor(executor, function, *arguments))
+        return cls(_from_executor, None)
 
     def catch(self: '_Promise[T]', error_handler: Callable[[Exception], T]) -> '_Promise[T]':
         """ Allows users to handle errors caused earlier in the Promise chain.
@@ -157,50 +564,474 @@ class _Promise(pymonad.monad.Monad, Generic[T]):
         Returns:
           A new Promise object.
         """
-        async def _awaitable_catch(resolve, reject): # pylint: disable=unused-argument
-            try:
-                value = await self
-                return resolve(value)
-            except Exception as e: # pylint: disable=invalid-name, broad-except
-                return resolve(error_handler(e))
+        return self._extend(_CATCH, error_handler)
+
+    @classmethod
+    def imap_concurrent(
+            cls,
+            values: Union[Iterable[S], AsyncIterable[S]],
+            kleisli_function: Callable[[S], Union['_Promise[T]', Awaitable[T], T]],
+            limit: int,
+            ordered: bool = True
+    ) -> AsyncIterator[T]:
+        """ Like map_concurrent but yields each result as soon as it's available.
+
+        Example:
+          async for page in Promise.imap_concurrent(urls, fetch, limit=10):
+              save(page)
+
+        Only the results which haven't yet been consumed are kept in
+        memory, so this works for inputs too large to hold all of the
+        results at once. Leaving the loop early cancels any promises
+        still running.
+
+        Args:
+          values: see map_concurrent.
+          kleisli_function: see map_concurrent.
+          limit: see map_concurrent.
+          ordered: see map_concurrent.
+
+        Returns:
+          An asynchronous iterator over the results.
+        """
+        pymonad.runtime.check_limit(limit)
+        return pymonad.runtime.map_concurrent(values, kleisli_function, limit, ordered)
+
+    @classmethod
+    def map_concurrent(
+            cls,
+            values: Union[Iterable[S], AsyncIterable[S]],
+            kleisli_function: Callable[[S], Union['_Promise[T]', Awaitable[T], T]],
+            limit: int,
+            ordered: bool = True
+    ) -> '_Promise[List[T]]':
+        """ Maps a kleisli function over 'values' running at most 'limit' promises at once.
+
+        Example:
+          pages = await Promise.map_concurrent(urls, fetch, limit=10)
+          pages = await Promise.map_concurrent(
+              urls, lambda url: fetch(url).catch(lambda error: None), limit=10
+          )
 
-        return self.__class__(_awaitable_catch, None)
+        Values are taken from 'values' only as running promises finish,
+        so 'values' can be a generator producing far more values than
+        could be scheduled at once. If any of the promises fails, the
+        others are cancelled and the new Promise fails with the same
+        error. Use 'catch' in 'kleisli_function', as in the second
+        example, to handle errors for each value instead.
+
+        Args:
+          values: any iterable or asynchronous iterable. It is consumed
+            lazily, when the new Promise is awaited.
+          kleisli_function: a function taking a single value and
+            returning a Promise, or any other awaitable or plain value.
+          limit: the maximum number of promises running at once.
+          ordered: if True, the default, results are in the same order
+            as 'values'. Promises which finished early wait for the
+            ones before them and still count towards 'limit'. If False,
+            results are in the order in which the promises finished.
+
+        Returns:
+          A new Promise which resolves to a list of the results.
+        """
+        pymonad.runtime.check_limit(limit)
+        async def _map_all(resolve, reject): # pylint: disable=unused-argument
+            results = pymonad.runtime.map_concurrent(values, kleisli_function, limit, ordered)
+            return resolve([result async for result in results])
+        return cls(_map_all, None)
 
     def map(self: '_Promise[S]', function: Callable[[S], T]) -> '_Promise[T]':
         """ See Monad.map. """
-        if asyncio.iscoroutinefunction(function):
-            async def _map(resolve, _):
-                return await resolve(function(await self))
-        else:
-            async def _map(resolve, _):
-                return resolve(function(await self))
-        return self.__class__(_map, None)
+        return self._extend(MAP, function)
+
+    @classmethod
+    def race(cls, promises: Iterable['_Promise[T]']) -> '_Promise[T]':
+        """ Settles the same way as the first of several promises to settle.
+
+        Example:
+          page = await Promise.race([fetch(url), Promise(timeout(5))])
+
+        Args:
+          promises: any iterable of promises. It is consumed immediately
+            and must not be empty.
+
+        Returns:
+          A new Promise which runs every promise concurrently and, as
+          soon as one of them succeeds or fails, cancels the others and
+          resolves to the same result or fails with the same error.
+        """
+        promises = list(promises)
+        if not promises:
+            raise ValueError('Promise.race needs at least one promise.')
+        async def _race(resolve, reject): # pylint: disable=unused-argument
+            tasks = [asyncio.ensure_future(promise) for promise in promises]
+            try:
+                return resolve(await next(asyncio.as_completed(tasks)))
+            finally:
+                await pymonad.runtime.cancel(tasks)
+        return cls(_awaiting(promises, _race), None)
+
+    def retry(
+            self: '_Promise[T]',
+            attempts: int,
+            backoff: float = 0.1,
+            retry_on: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
+            jitter: float = 0.5
+    ) -> '_Promise[T]':
+        """ Runs the failing steps again, up to 'attempts' times in all, if the Promise fails.
+
+        Example:
+          page = await fetch(url).map(parse).retry(3, retry_on=ConnectionError)
+
+        Only the steps which failed run again: steps which succeeded
+        keep their results, whether they are part of this Promise's
+        chain or of the promises it combines, arguments to
+        Promise.apply or Promise.all for instance. Other promises
+        awaited by the steps aren't run again, unless they're part of
+        a step which is. Promises created with memoize=False run again
+        in full. Steps which had already run, and failed, when retry
+        was called can't run again.
+
+        Between attempts, the Promise waits, by the event loop's clock,
+        for 'backoff' seconds, then twice as long, then four times as
+        long and so on. A random part of each delay, up to 'jitter'
+        times the delay, is left out so that many promises failing at
+        once don't all retry at once. If a timeout would expire during
+        the delay, the Promise fails straight away instead.
+
+        Args:
+          attempts: the most times the Promise is run, at least 1.
+          backoff: the delay after the first failed attempt, in seconds.
+          retry_on: an Exception class, or a tuple of them. Other
+            errors fail the Promise without retrying.
+          jitter: the largest fraction of each delay which can be left
+            out, from 0 (none) to 1 (all of it).
+
+        Returns:
+          A new Promise object, failing with the last error if every
+          attempt fails.
+        """
+        if attempts < 1:
+            raise ValueError(f'attempts must be at least 1, not {attempts}.')
+        # Running a promise drops its parent and step so keep them here,
+        # for this retry only, in case it has to run again.
+        links = _links(self)
+        async def _retry(resolve, reject): # pylint: disable=unused-argument
+            token = None
+            try:
+                for attempt in range(1, attempts + 1):
+                    try:
+                        return resolve(await _await_promise(self))
+                    except retry_on:
+                        if attempt == attempts:
+                            raise
+                        delay = backoff * 2 ** (attempt - 1) * (1 - jitter * random.random())
+                        remaining = remaining_time()
+                        if remaining is not None and remaining < delay:
+                            raise
+                        await asyncio.sleep(delay)
+                        if token is None:
+                            token = _retry_links.set(links)
+            finally:
+                if token is not None:
+                    _retry_links.reset(token)
+                if self._memoize:
+                    links.clear() # This promise won't run again.
+        return self.__class__(_retry, None, self._memoize)
 
     def then(
             self: '_Promise[S]', function: Union[Callable[[S], T], Callable[[S], '_Promise[T]']]
     ) -> '_Promise[T]':
         """ See Monad.then. """
-        if asyncio.iscoroutinefunction(function):
-            async def _then(resolve, _):
-                result = await function(await self)
-                try:
-                    return resolve(await result)
-                except TypeError:
-                    return resolve(result)
-        else:
-            async def _then(resolve, _):
-                result = function(await self)
-                try:
-                    return resolve(await result)
-                except TypeError:
-                    return resolve(result)
+        return self._extend(THEN, function)
 
-        return self.__class__(_then, None)
+    def then_in_executor(
+            self: '_Promise[S]',
+            function: Union[Callable[[S], T], Callable[[S], '_Promise[T]']],
+            executor: Union[concurrent.futures.Executor, None]
+    ) -> '_Promise[T]':
+        """ Like 'then' but calls 'function' in 'executor' instead of on the event loop.
+
+        Synchronous functions passed to 'then' or 'map' run on the
+        event loop's thread and, while they run, nothing else can.
+        Blocking or CPU heavy steps can be sent to an executor instead.
+
+        Example:
+          Promise.insert(path).then(fetch).then_in_executor(parse, thread_pool)
+
+        Args:
+          function: a normal, synchronous, function. If it returns a
+            Promise, that Promise is awaited on the event loop.
+          executor: a concurrent.futures.Executor. If None, the event
+            loop's default executor, a thread pool, is used.
+
+        Returns:
+          A new Promise object.
+        """
+        async def _in_executor(value):
+            return await asyncio.get_running_loop().run_in_executor(executor, function, value)
+        return self._extend(THEN, _in_executor)
+
+    def then_in_process(
+            self: '_Promise[S]',
+            function: Callable[[S], T],
+            executor: Union[concurrent.futures.ProcessPoolExecutor, None] = None
+    ) -> '_Promise[T]':
+        """ Like 'then' but calls 'function' in another process.
+
+        Use this for CPU heavy steps: unlike threads, other processes
+        don't compete with the event loop for the global interpreter
+        lock. 'function', the value passed to it and its result must
+        all be picklable. Curried functions defined at module level
+        are. The shared process pool starts new Python processes,
+        rather than forking this one, so 'function' must be importable
+        from them.
+
+        Args:
+          function: a normal, synchronous, function.
+          executor: a ProcessPoolExecutor. If None, a process pool
+            shared by every Promise is used. It is created the first
+            time it's needed.
+
+        Returns:
+          A new Promise object.
+        """
+        return self.then_in_executor(function, executor or _shared_process_pool())
+
+    def then_in_thread(
+            self: '_Promise[S]',
+            function: Union[Callable[[S], T], Callable[[S], '_Promise[T]']],
+            executor: Union[concurrent.futures.ThreadPoolExecutor, None] = None
+    ) -> '_Promise[T]':
+        """ Like 'then' but calls 'function' in another thread.
+
+        Use this for blocking steps, file or database access for
+        instance.
+
+        Args:
+          function: a normal, synchronous, function.
+          executor: a ThreadPoolExecutor. If None, the event loop's
+            default executor is used.
+
+        Returns:
+          A new Promise object.
+        """
+        return self.then_in_executor(function, executor)
+
+    def timeout(self: '_Promise[T]', seconds: float) -> '_Promise[T]':
+        """ Fails with asyncio.TimeoutError if the Promise takes longer than 'seconds'.
+
+        Example:
+          page = await fetch(url).timeout(5).catch(lambda error: None)
+
+        When the time is up the Promise is cancelled, along with every
+        task it started, and the TimeoutError is only raised once they
+        have all stopped. Functions run in an executor can't be
+        stopped and carry on in the background. If the Promise is
+        memoized, awaiting it again starts it over.
+
+        The deadline applies to every promise awaited while running
+        this one: a timeout further down the chain, or in a function
+        passed to 'then' or 'bind', can shorten it but not extend it.
+        Those functions can call remaining_time() to find out how much
+        of the time is left.
+
+        Args:
+          seconds: the time limit, starting when the new Promise is
+            awaited.
+
+        Returns:
+          A new Promise object.
+        """
+        async def _timeout(resolve, reject): # pylint: disable=unused-argument
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + seconds
+            enclosing = _deadline.get()
+            if enclosing is not None and enclosing < deadline:
+                deadline = enclosing
+            token = _deadline.set(deadline)
+            try:
+                return resolve(await asyncio.wait_for(_await_promise(self), deadline - loop.time()))
+            finally:
+                _deadline.reset(token)
+        return self.__class__(_timeout, None, self._memoize)
+
+    def run_sync(self: '_Promise[T]') -> T:
+        """ Returns the result of a Promise which never needs to wait for anything.
+
+        Promises built only from Promise.insert, or from Promise(function),
+        and normal, synchronous, functions never need to wait and can
+        be run without an event loop, avoiding its overhead.
+
+          Example:
+            Promise.insert(2).map(lambda x: x * 10).run_sync() # 20
+
+        Returns:
+          The result of the Promise.
+
+        Raises:
+          The error the Promise failed with, if any, or RuntimeError if
+          the Promise has to wait for something, or needs an event loop,
+          a coroutine function sleeping for instance. Use 'await' in
+          that case: the steps which couldn't run are left pending,
+          rather than failed, so awaiting the Promise runs them.
+        """
+        if self._state == _DONE:
+            if self._error is not None:
+                raise self._error
+            return self._result
+        coroutine = _await_promise(self)
+        token = _running_sync.set(True)
+        try:
+            coroutine.send(None)
+        except StopIteration as stop:
+            return stop.value
+        except _NeedsEventLoop as needs_event_loop:
+            cause = needs_event_loop.__cause__
+        else:
+            # Closing it puts the steps it was running back to pending.
+            coroutine.close()
+            cause = None
+        finally:
+            _running_sync.reset(token)
+        raise RuntimeError('Promise.run_sync: the promise had to wait, await it instead.') from cause
 
     def __await__(self):
-        return self.value(self._resolve, _reject).__await__()
+        return _await_promise(self).__await__()
+
+    def _is_resolved(self):
+        return self._state == _DONE and self._error is None
+
+    def _extend(self, kind, function):
+        if self._state == _DONE:
+            return self._extend_settled(kind, function)
+        return _new_promise(self.__class__, self._memoize, self, (kind, function))
+
+    def _extend_settled(self, kind, function):
+        """ Applies a step to a settled promise straight away, as far as possible. """
+        error = self._error
+        if (error is None) is (kind == _CATCH):
+            return self # Either a catch with no error or any other step with an error.
+        cls = self.__class__
+        if inspect.iscoroutinefunction(function):
+            # Nothing would run before the coroutine is awaited anyway.
+            return _new_promise(cls, self._memoize, self, (kind, function))
+        try:
+            result = function(self._result if error is None else error)
+        except Exception as exception: # pylint: disable=broad-except
+            # Raised when awaited, by the runner, so that Promise.retry
+            # can run the step again.
+            return _new_promise(cls, self._memoize, self, (kind, _replay(function, None, exception)))
+        if type(result) is types.CoroutineType: # pylint: disable=unidiomatic-typecheck
+            # A normal function returned a coroutine: the runner awaits
+            # it rather than calling the function a second time.
+            return _new_promise(cls, self._memoize, self, (kind, _replay(function, result, None)))
+        if kind == MAP or kind == _CATCH:
+            return _settled_promise(cls, result, None)
+        if isinstance(result, _Promise):
+            return result
+        if kind == THEN and not inspect.isawaitable(result):
+            return _settled_promise(cls, result, None)
+        # Anything else needs to be awaited or, for bind, fail trying,
+        # just as it would following a pending promise.
+        return _new_promise(cls, self._memoize, _settled_promise(cls, result, None), (kind, pymonad.tools.identity))
+
+    async def _wait(self):
+        waiter = asyncio.get_running_loop().create_future()
+        if self._waiters is None:
+            self._waiters = []
+        self._waiters.append(waiter)
+        await waiter
+
+    def _settle(self, value, error):
+        self._result = value
+        self._error = error
+        # Nothing upstream is needed any more.
+        self._parent = None
+        self._step = None
+        self._wake(_DONE)
+
+    def _wake(self, state):
+        self._state = state
+        waiters, self._waiters = self._waiters, None
+        for waiter in waiters or ():
+            if not waiter.done():
+                waiter.set_result(None)
+
+def _replay(function, result, error):
+    """ Returns a step function which returns 'result', or raises 'error', the first time it's called.
+
+    'result' or 'error' is what 'function' returned, or raised, when it
+    was already called. Later calls, from Promise.retry or awaiting a
+    promise which isn't memoized a second time, call 'function' again.
+    """
+    outcomes = [(result, error)]
+    @functools.wraps(function)
+    def _step(value):
+        if not outcomes:
+            return function(value)
+        result, error = outcomes.pop()
+        if error is not None:
+            raise error
+        return result
+    return _step
+
+def _links(promise):
+    """ Maps the id of 'promise', and of every promise it's built from which hasn't run, to (promise, parent, step). """
+    # pylint: disable=protected-access
+    links = {}
+    remaining = [promise]
+    while remaining:
+        node = remaining.pop()
+        if node._state == _DONE or id(node) in links:
+            continue
+        links[id(node)] = (node, node._parent, node._step)
+        if node._parent is not None:
+            remaining.append(node._parent)
+        remaining.extend(
+            promise for promise in getattr(node.value, 'awaited_promises', ()) if isinstance(promise, _Promise)
+        )
+    return links
+
+def _restore_links(promise):
+    """ Gives a failed promise back its parent and step if the Promise.retry being run can run it again. """
+    links = _retry_links.get()
+    link = None if links is None else links.get(id(promise))
+    if link is None:
+        return False
+    _, promise._parent, promise._step = link # pylint: disable=protected-access
+    return True
+
+def _awaiting(promises, function):
+    """ Records that 'function', the function of a new Promise, awaits 'promises' so that retry can find them. """
+    function.awaited_promises = promises
+    return function
+
+def _new_promise(cls, memoize, parent, step, state=_PENDING, result=None, error=None):
+    """ Creates a promise without going through __init__.
+
+    Promises are created for every step of every chain so it's worth
+    avoiding the extra overhead.
+    """
+    # pylint: disable=protected-access
+    promise = _new_object(cls)
+    promise.value = None
+    promise.monoid = None
+    promise._memoize = memoize
+    promise._parent = parent
+    promise._step = step
+    promise._state = state
+    promise._result = result
+    promise._error = error
+    promise._waiters = None
+    return promise
+
+_new_object = object.__new__
 
-def Promise(function: PromiseFunction) -> _Promise[T]: # pylint: disable=invalid-name
+def _settled_promise(cls, value, error):
+    return _new_promise(cls, True, None, None, _DONE, value, error)
+
+def Promise(function: PromiseFunction, memoize: bool = True) -> _Promise[T]: # pylint: disable=invalid-name
     """ Constructs a Promise object for ordering concurrent computations.
 
     Example:
@@ -219,15 +1050,64 @@ def Promise(function: PromiseFunction) -> _Promise[T]: # pylint: disable=invalid
         value should be returned by calling resolve with the result. If
         there is an error, call 'reject' with an instance of the
         Exception class.
+      memoize: if True, the default, the computation runs at most
+        once no matter how many times the promise, or promises built
+        from it, are awaited. The result, or exception, is kept and
+        returned to every await. If False, the computation runs again
+        every time the promise is awaited. Promises built from this
+        one with bind, map, then, amap or catch inherit this setting.
 
     Returns:
       A new Promise object.
     """
-    @pymonad.tools.curry(3)
-    async def _awaitable(function, resolve, reject):
-        return function(resolve, reject)
-    return _Promise(_awaitable(function), None) # pylint: disable=no-value-for-parameter
+    promise = _Promise(function, None, memoize)
+    promise._step = _CALL_STEP # pylint: disable=protected-access
+    return promise
+
+
+def _split_arguments(args, kwargs):
+    """ Separates the arguments of a function decorated with async_func which have to be awaited.
+
+    Returns:
+      The positional and keyword arguments, with promises which have
+      already resolved replaced by their results, and a list of
+      (position or keyword, awaitable) pairs for the arguments which
+      still have to be awaited. Plain values are left untouched and
+      the arguments are only copied if some of them are awaitable.
+    """
+    waiting = [(index, arg) for index, arg in enumerate(args) if pymonad.runtime.is_awaitable(arg)]
+    if kwargs:
+        waiting.extend((name, arg) for name, arg in kwargs.items() if pymonad.runtime.is_awaitable(arg))
+    if not waiting:
+        return args, kwargs, waiting
+    args, kwargs = list(args), dict(kwargs)
+    unresolved = []
+    for key, arg in waiting:
+        if isinstance(arg, _Promise) and arg._is_resolved(): # pylint: disable=protected-access
+            _set_argument(args, kwargs, key, arg._result) # pylint: disable=protected-access
+        else:
+            unresolved.append((key, arg))
+    return args, kwargs, unresolved
 
+def _set_argument(args, kwargs, key, value):
+    if isinstance(key, int):
+        args[key] = value
+    else:
+        kwargs[key] = value
+
+async def _await_arguments(args, kwargs, waiting):
+    """ Awaits the arguments listed in 'waiting', by _split_arguments, concurrently. """
+    values = await pymonad.runtime.gather([arg for _, arg in waiting])
+    for (key, _), value in zip(waiting, values):
+        _set_argument(args, kwargs, key, value)
+    return args, kwargs
+
+async def _gather_arguments(args, kwargs):
+    """ Awaits the arguments of a function decorated with async_func. """
+    args, kwargs, waiting = _split_arguments(args, kwargs)
+    if waiting:
+        return await _await_arguments(args, kwargs, waiting)
+    return args, kwargs
 
 def async_func(func: Callable) -> Callable:
     """Transform simple function in async function using promises.
@@ -269,26 +1149,294 @@ def async_func(func: Callable) -> Callable:
 
     """
 
-    async def getArgs(args):
-        return await asyncio.gather(
-            *[arg if isinstance(arg, Awaitable) else Promise.insert(arg) for arg in args]
-        )
+    def wrapper(*args, **kwargs):
+        args, kwargs, waiting = _split_arguments(args, kwargs)
+        if not waiting:
+            # Nothing to wait for: the Promise runs without suspending.
+            return Promise(lambda resolve, reject: resolve(func(*args, **kwargs)))
 
-    async def getKwargs(kwargs):
-        kwargsTasks = [arg.map(lambda x: (ith, x)) if isinstance(arg, Awaitable) else Promise.insert((ith, arg))
-                       for ith, arg in kwargs.items()]
-        return dict(await asyncio.gather(*kwargsTasks))
+        async def async_wrap(resolve, reject): # pylint: disable=unused-argument
+            (_args, _kwargs) = await _await_arguments(args, kwargs, waiting)
 
-    async def async_wrap(*args, **kwargs):
-        (_args, _kwargs) = await asyncio.gather(getArgs(args), getKwargs(kwargs))
+            return resolve(func(*_args, **_kwargs))
+
+        return _Promise(async_wrap, None)
+
+    return wrapper
 
-        return func(*_args, **_kwargs)
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'coalesced', 'maxsize', 'currsize'])
 
+def cached_async_func(
+        func: Optional[Callable] = None, *, maxsize: Optional[int] = 128, ttl: Optional[float] = None
+) -> Callable:
+    """ Like async_func but shares the work between calls with the same arguments.
+
+    Concurrent calls with equal arguments share a single call to
+    'func': the first one makes the call and the others wait for its
+    result. Results are also kept, in a least recently used cache, for
+    later calls. Errors are never kept, the next call tries again.
+
+    Example:
+      @cached_async_func(maxsize=1024, ttl=60)
+      async def user(user_id):
+          return await fetch(f'/users/{user_id}')
+
+      a, b = await Promise.all([user(1), user(1)]) # Fetched once.
+      print(user.cache_info())
+
+    Arguments which are promises are awaited first, it's their results
+    which are compared. Calls with arguments which can't be hashed
+    aren't shared or cached. If the first call is cancelled, one of the
+    calls waiting for it makes the call instead.
+
+    Args:
+      func: a regular function, or a coroutine function, taking any
+        arguments.
+      maxsize: the most results kept at once. If None, results are
+        only removed when they expire: expired results are dropped
+        whenever a new result is kept. If 0, results aren't kept at
+        all and only concurrent calls are shared.
+      ttl: the number of seconds results are kept for, by the event
+        loop's clock. If None, they are kept until they are evicted.
+
+    Returns:
+      A counterpart of 'func' returning promises, as with async_func,
+      with two extra methods: cache_info(), returning a CacheInfo of
+      hits (calls answered from kept results), misses (calls to 'func'),
+      coalesced (calls which waited for another call), maxsize and
+      currsize, and cache_clear() which discards the kept results and
+      resets the counters.
+    """
+    if func is None:
+        return lambda function: cached_async_func(function, maxsize=maxsize, ttl=ttl)
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f'maxsize must not be negative, not {maxsize}.')
+    results = collections.OrderedDict() # Maps arguments to results, least recently used first.
+    # Maps arguments to expiry times, if there's a ttl, soonest first:
+    # a hit moves a result to the end of 'results' but doesn't make it
+    # expire any later.
+    expiries = collections.OrderedDict()
+    in_flight = {}
+    hits = misses = coalesced = 0
+
+    def _keep(key, value):
+        if ttl is not None:
+            now = asyncio.get_running_loop().time()
+            _drop_expired(now)
+            expiries[key] = now + ttl
+            expiries.move_to_end(key)
+        results[key] = value
+        results.move_to_end(key)
+        if maxsize is not None and len(results) > maxsize:
+            evicted, _ = results.popitem(last=False)
+            expiries.pop(evicted, None)
+
+    def _drop_expired(now):
+        while expiries:
+            key, expires = next(iter(expiries.items()))
+            if expires > now:
+                return
+            del expiries[key]
+            del results[key]
+
+    def _share(key, args, kwargs):
+        started = False
+        async def _shared(resolve, reject): # pylint: disable=unused-argument
+            nonlocal misses, coalesced, started
+            if started:
+                # The call which started it was cancelled: the call
+                # making it instead was counted as waiting for it.
+                coalesced -= 1
+            started = True
+            misses += 1
+            try:
+                value = await pymonad.runtime.call(lambda _: func(*args, **kwargs), None)
+            except Exception:
+                del in_flight[key]
+                raise
+            # If the call is cancelled it stays in flight: awaiting the
+            # promise again starts it over.
+            del in_flight[key]
+            if maxsize != 0:
+                _keep(key, value)
+            return resolve(value)
+        return _Promise(_shared, None)
+
+    async def _lookup(args, kwargs):
+        nonlocal hits, misses, coalesced
+        key = (tuple(args), tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return await pymonad.runtime.call(lambda _: func(*args, **kwargs), None)
+        if key in results:
+            if ttl is None or asyncio.get_running_loop().time() < expiries[key]:
+                hits += 1
+                results.move_to_end(key)
+                return results[key]
+            del results[key]
+            del expiries[key]
+        promise = in_flight.get(key)
+        if promise is None:
+            # Counted as a miss when it calls 'func'.
+            promise = in_flight[key] = _share(key, args, kwargs)
+        else:
+            coalesced += 1
+        return await promise
+
+    def cache_info():
+        return CacheInfo(hits, misses, coalesced, maxsize, len(results))
+
+    def cache_clear():
+        nonlocal hits, misses, coalesced
+        results.clear()
+        expiries.clear()
+        hits = misses = coalesced = 0
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        return _Promise(lambda resolve, reject: async_wrap(*args, **kwargs), None)
+        async def _cached(resolve, reject): # pylint: disable=unused-argument
+            return resolve(await _lookup(*await _gather_arguments(args, kwargs)))
+        return _Promise(_cached, None)
 
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
     return wrapper
 
+class _Batch:
+    """ Keys waiting to be passed to a batch function together, and the futures waiting for their results. """
+    __slots__ = ('keys', 'futures', 'handle', 'task')
+
+    def __init__(self):
+        self.keys = []
+        self.futures = []
+        self.handle = None
+        self.task = None
+
+def _settle_batch(batch, results):
+    if isinstance(results, Mapping):
+        for key, future in zip(batch.keys, batch.futures):
+            if future.done():
+                continue
+            if key in results:
+                future.set_result(results[key])
+            else:
+                future.set_exception(KeyError(key))
+        return
+    results = list(results)
+    if len(results) != len(batch.keys):
+        raise ValueError(
+            f'The batch function returned {len(results)} results for {len(batch.keys)} keys.'
+        )
+    for future, result in zip(batch.futures, results):
+        if not future.done():
+            future.set_result(result)
+
+def async_batch(max_batch: Optional[int] = None, max_delay: float = 0.0) -> Callable:
+    """ Turns a function taking a list of keys into one loading a single key, batching calls.
+
+    Calls made in the same iteration of the event loop, or within
+    'max_delay' seconds of the first one, are collected and passed to
+    the batch function in a single call. Each caller's Promise then
+    resolves to the result for its own key.
+
+    Example:
+      @async_batch(max_batch=100)
+      async def user(user_ids):
+          rows = await database.fetch('SELECT * FROM users WHERE id = ANY($1)', user_ids)
+          return {row['id']: row for row in rows}
+
+      a, b = await Promise.all([user(1), user(2)]) # One query.
+
+    Keys are collected when the promises are awaited, not when they
+    are created. A key which is itself a promise is awaited first.
+    Keys whose callers were cancelled before the batch is sent are
+    left out of it, and if every caller waiting for a batch is
+    cancelled, so is the call to the batch function.
+
+    Args:
+      max_batch: the most keys passed to the batch function at once. A
+        batch is sent as soon as it's full. If None, batches are only
+        limited by 'max_delay'.
+      max_delay: the number of seconds to wait for more keys after the
+        first one. If 0, the default, only calls made in the same
+        iteration of the event loop are batched together.
+
+    Returns:
+      A decorator. The batch function it decorates, a regular function
+      or coroutine function, takes a list of keys and returns either a
+      list of results in the same order or a mapping from keys to
+      results. Keys missing from a mapping fail with KeyError. If the
+      batch function raises an error, every caller in the batch fails
+      with it.
+    """
+    if max_batch is not None and max_batch < 1:
+        raise ValueError(f'max_batch must be at least 1, not {max_batch}.')
+
+    def decorator(batch_function: Callable) -> Callable:
+        pending = None
+
+        async def _run_batch(batch):
+            try:
+                _settle_batch(batch, await pymonad.runtime.call(batch_function, batch.keys))
+            except Exception as error: # pylint: disable=broad-except
+                for future in batch.futures:
+                    if not future.done():
+                        future.set_exception(error)
+
+        def _dispatch(batch):
+            nonlocal pending
+            if pending is batch:
+                pending = None
+            batch.handle.cancel()
+            # Leave out the callers which have already been cancelled.
+            waiting = [index for index, future in enumerate(batch.futures) if not future.done()]
+            if len(waiting) < len(batch.futures):
+                batch.keys = [batch.keys[index] for index in waiting]
+                batch.futures = [batch.futures[index] for index in waiting]
+            if waiting:
+                batch.task = asyncio.ensure_future(_run_batch(batch))
+
+        async def _load(key):
+            nonlocal pending
+            if isinstance(key, Awaitable):
+                key = await key
+            loop = asyncio.get_running_loop()
+            batch = pending
+            if batch is None:
+                batch = pending = _Batch()
+                if max_delay > 0:
+                    batch.handle = loop.call_later(max_delay, _dispatch, batch)
+                else:
+                    batch.handle = loop.call_soon(_dispatch, batch)
+            future = loop.create_future()
+            batch.keys.append(key)
+            batch.futures.append(future)
+            if max_batch is not None and len(batch.keys) >= max_batch:
+                _dispatch(batch)
+            try:
+                return await future
+            except asyncio.CancelledError:
+                if batch.task is not None and all(future.done() for future in batch.futures):
+                    batch.task.cancel()
+                raise
+
+        @functools.wraps(batch_function)
+        def wrapper(key):
+            async def _batched(resolve, reject): # pylint: disable=unused-argument
+                return resolve(await _load(key))
+            return _Promise(_batched, None)
+
+        return wrapper
+    return decorator
+
 
+Promise.all = _Promise.all
+Promise.all_settled = _Promise.all_settled
+Promise.any = _Promise.any
 Promise.apply = _Promise.apply
+Promise.from_executor = _Promise.from_executor
+Promise.imap_concurrent = _Promise.imap_concurrent
 Promise.insert = _Promise.insert
+Promise.map_concurrent = _Promise.map_concurrent
+Promise.race = _Promise.race
@@ -9,30 +9,34 @@ an additional read-only input.
 """
 from typing import Any, Callable, Generic, TypeVar, Union
 
+import pymonad.chain
 import pymonad.monad
-import pymonad.tools
+from pymonad.chain import BIND, MAP, THEN
 
 R = TypeVar('R') # pylint: disable=invalid-name
 S = TypeVar('S') # pylint: disable=invalid-name
 T = TypeVar('T') # pylint: disable=invalid-name
 
-@pymonad.tools.curry(3)
-def _bind(function_f, function_g, read_only):
-    return function_f(function_g(read_only))(read_only)
+class _ReaderChain(pymonad.chain.Chain):
+    """ A Reader function stored as a flat chain of steps. """
+    __slots__ = ()
 
-@pymonad.tools.curry(3)
-def _bind_or_map(function_f, function_g, read_only):
-    return_value = _map(function_f, function_g, read_only)
-    try:
-        return return_value(read_only)
-    except (TypeError, AttributeError):
-        return return_value
+    def __call__(self, read_only):
+        return _run(self, read_only)
 
-@pymonad.tools.curry(3)
-def _map(function_f, function_g, read_only):
-    return function_f(function_g(read_only))
+def _run(reader_function, read_only):
+    """ Calls a Reader function, passing 'read_only' to every function in the chain. """
+    return pymonad.chain.run(
+        _ReaderChain, reader_function, lambda function: function(read_only), _Reader, _function
+    )
+
+def _function(result):
+    """ Kleisli functions can return Reader values or plain functions. """
+    return result.value if isinstance(result, _Reader) else result
 
 class _Reader(pymonad.monad.Monad, Generic[R, T]):
+    __slots__ = ()
+
     @classmethod
     def insert(cls, value):
         return cls(lambda r: value, None)
@@ -40,18 +44,26 @@ class _Reader(pymonad.monad.Monad, Generic[R, T]):
     def amap(self: '_Reader[R, Callable[[S], T]]', monad_value: '_Reader[R, S]') -> '_Reader[R, T]':
         return self.__class__(lambda r: self(r)(monad_value(r)), None)
 
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ See Monad.apply_to_arguments. """
+        return cls(
+            lambda r: pymonad.monad.call_with_values(function, [argument(r) for argument in arguments]),
+            None
+        )
+
     def bind(
             self: '_Reader[R, S]', kleisli_function: Callable[[S], '_Reader[R, T]']
     ) -> '_Reader[R, T]':
-        return self.__class__(_bind(kleisli_function, self), None) # pylint: disable=no-value-for-parameter
+        return self.__class__(_ReaderChain.extend(self.value, BIND, kleisli_function), None)
 
     def map(self: '_Reader[R, S]', function: Callable[[S], T]) -> '_Reader[R, T]':
-        return self.__class__(_map(function, self), None) # pylint: disable=no-value-for-parameter
+        return self.__class__(_ReaderChain.extend(self.value, MAP, function), None)
 
     def then(
             self: '_Reader[R, S]', function: Union[Callable[[S], T], Callable[[S], '_Reader[R, T]']]
     ) -> '_Reader[R, T]':
-        return self.__class__(_bind_or_map(function, self), None) # pylint: disable=no-value-for-parameter
+        return self.__class__(_ReaderChain.extend(self.value, THEN, function), None)
 
     def __call__(self, arg: R) -> T:
         return self.value(arg)
@@ -108,6 +120,8 @@ def Compose(function: Callable[[R], T]) -> _Reader[R, T]: # pylint: disable=inva
 
 
 class _Pipe(_Reader, Generic[R, T]):
+    __slots__ = ()
+
     def flush(self):
         """ Calls the composed Pipe function returning  the embedded result.
 
@@ -0,0 +1,141 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Helpers shared by Promise, AsyncStream, pymonad.trace and pymonad.instrument.
+
+Those modules all run functions which may or may not be coroutine
+functions, clean up after the tasks they start and name the functions
+they time. The helpers doing so live here so that the modules using
+them don't reach into each other's private names.
+
+Nothing here is meant to be used directly: use Promise, AsyncStream,
+pymonad.trace and pymonad.instrument instead.
+"""
+import asyncio
+import collections
+import contextvars
+import inspect
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, List, Union
+
+# The span of the step being run, or of the innermost traced block, if tracing.
+current_span: contextvars.ContextVar = contextvars.ContextVar('pymonad.trace.span', default=None)
+
+def function_name(function: Any) -> str:
+    """ Returns the qualified name of 'function', including its module. """
+    name = getattr(function, '__qualname__', None) or type(function).__qualname__
+    module = getattr(function, '__module__', None)
+    return f'{module}.{name}' if module else name
+
+def is_awaitable(value: Any) -> bool:
+    """ Like isinstance(value, Awaitable) without the cost of the abstract base class check. """
+    return getattr(type(value), '__await__', None) is not None
+
+def check_limit(limit: int) -> None:
+    """ Raises ValueError if 'limit', the most calls running at once, is less than 1. """
+    if limit < 1:
+        raise ValueError(f'limit must be at least 1, not {limit}.')
+
+async def _iterate(values):
+    for value in values:
+        yield value
+
+def iterate(values: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    """ Returns an asynchronous iterator over an iterable or asynchronous iterable. """
+    if hasattr(values, '__aiter__'):
+        return aiter(values)
+    return _iterate(values)
+
+async def cancel(tasks: Iterable[asyncio.Future]) -> None:
+    """ Cancels 'tasks' and waits for them to stop, so nothing is left running in the background. """
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+
+async def gather(awaitables: List[Awaitable]) -> List[Any]:
+    """ Awaits 'awaitables' concurrently, cancelling the others if one of them fails. """
+    if len(awaitables) == 1:
+        return [await awaitables[0]]
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        await cancel(tasks)
+        raise
+
+async def call(function: Callable, value: Any) -> Any:
+    """ Calls 'function' with 'value', awaiting the result if it's awaitable. """
+    result = function(value)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+async def map_concurrent(
+        values: Union[Iterable, AsyncIterable], kleisli_function: Callable, limit: int, ordered: bool
+) -> AsyncIterator:
+    """ Yields the results of 'kleisli_function' on 'values', running up to 'limit' at once. """
+    iterator = iterate(values)
+    running = collections.deque() if ordered else set()
+    start = running.append if ordered else running.add
+    exhausted = False
+    try:
+        while True:
+            # In order, results waiting for an earlier one to finish
+            # count towards the limit so they can't pile up.
+            while not exhausted and len(running) < limit:
+                try:
+                    value = await anext(iterator)
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    start(asyncio.ensure_future(call(kleisli_function, value)))
+            if not running:
+                return
+            if ordered:
+                yield await running.popleft()
+            else:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                running -= done
+                for task in done:
+                    yield task.result()
+    finally:
+        await cancel(running)
+
+class Timed:
+    """ Awaits 'awaitable', adding the time spent running it and waiting for it to 'span'. """
+    __slots__ = ('awaitable', 'span')
+
+    def __init__(self, awaitable, span):
+        self.awaitable = awaitable
+        self.span = span
+
+    def __await__(self):
+        iterator = self.awaitable.__await__()
+        span = self.span
+        send, message = iterator.send, None
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                yielded = send(message)
+            except StopIteration as stop:
+                span.run_ns += time.perf_counter_ns() - start
+                return stop.value
+            except BaseException:
+                span.run_ns += time.perf_counter_ns() - start
+                raise
+            suspended = time.perf_counter_ns()
+            span.run_ns += suspended - start
+            try:
+                message = yield yielded
+                send = iterator.send
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as error: # pylint: disable=broad-except
+                message = error
+                send = iterator.throw
+            finally:
+                span.wait_ns += time.perf_counter_ns() - suspended
@@ -6,37 +6,32 @@
 
 from typing import Any, Callable, Generic, Tuple, TypeVar, Union # pylint: disable=unused-import
 
+import pymonad.chain
 import pymonad.monad
-import pymonad.tools
+from pymonad.chain import BIND, MAP, THEN
 
 A = TypeVar('A') # pylint: disable=invalid-name
 B = TypeVar('B') # pylint: disable=invalid-name
 S = TypeVar('S') # pylint: disable=invalid-name
 
-@pymonad.tools.curry(3)
-def _amap(monad_function, monad_value, state):
-    function, new_state = monad_function.run(state)
-    value, final_state = monad_value.run(new_state)
-    return function(value), final_state
-
-@pymonad.tools.curry(3)
-def _bind(monad_value, kleisli_function, state):
-    value, new_state = monad_value.run(state)
-    return kleisli_function(value).run(new_state)
-
-@pymonad.tools.curry(3)
-def _bind_or_map(monad_value, function, state):
-    value, new_state = monad_value.run(state)
-    result = function(value)
-    try:
-        return result.run(new_state)
-    except (TypeError, AttributeError):
-        return result, new_state
-
-@pymonad.tools.curry(3)
-def _map(monad_value, function, state):
-    value, new_state = monad_value.run(state)
-    return function(value), new_state
+class _StateChain(pymonad.chain.Chain):
+    """ A State computation stored as a flat chain of steps. """
+    __slots__ = ()
+
+    def __call__(self, state):
+        return _run(self, state)
+
+def _run(state_function, state):
+    """ Runs a state function, threading 'state' through every step. """
+    def _call(function):
+        nonlocal state
+        value, state = function(state)
+        return value
+    value = pymonad.chain.run(_StateChain, state_function, _call, State, _value)
+    return value, state
+
+def _value(state_value):
+    return state_value.value
 
 class State(pymonad.monad.Monad, Generic[S, A]):
     """The State monad.
@@ -51,6 +46,8 @@ class State(pymonad.monad.Monad, Generic[S, A]):
        An instance of the State monad.
 
     """
+    __slots__ = ()
+
     def __init__(self, state_function, _=None):
         super().__init__(state_function, None)
 
@@ -61,20 +58,28 @@ class State(pymonad.monad.Monad, Generic[S, A]):
 
     def amap(self: 'State[S, Callable[[A], B]]', monad_value: 'State[S, A]') -> 'State[S, B]':
         """ See Monad.amap. """
-        state_function = _amap(self, monad_value) # pylint: disable=no-value-for-parameter
-        return self.__class__(state_function)
+        return self.bind(monad_value.map)
+
+    @classmethod
+    def apply_to_arguments(cls, function, arguments):
+        """ See Monad.apply_to_arguments. """
+        def _apply(state):
+            values = []
+            for argument in arguments:
+                value, state = argument.run(state)
+                values.append(value)
+            return pymonad.monad.call_with_values(function, values), state
+        return cls(_apply)
 
     def bind(
             self: 'State[S, A]', kleisli_function: Callable[[A], 'State[S, B]']
     ) -> 'State[S, B]':
         """ See Monad.bind. """
-        state_function = _bind(self, kleisli_function) # pylint: disable=no-value-for-parameter
-        return self.__class__(state_function)
+        return self.__class__(_StateChain.extend(self.value, BIND, kleisli_function))
 
     def map(self: 'State[S, A]', function: Callable[[A], B]) -> 'State[S, B]':
         """ See Monad.map. """
-        state_function = _map(self, function) # pylint: disable=no-value-for-parameter
-        return self.__class__(state_function) # pylint: disable=not-callable
+        return self.__class__(_StateChain.extend(self.value, MAP, function)) # pylint: disable=not-callable
 
     def run(self: 'State[S, A]', input_state: S) -> Tuple[A, S]:
         """ Gives the state calculation an initial state and computes the result.
@@ -86,9 +91,10 @@ class State(pymonad.monad.Monad, Generic[S, A]):
           A tuple containing the result of the stateful calculation
           and the final state.
         """
-        return self.value(input_state)
+        return _run(self.value, input_state)
 
     def then(
             self: 'State[S, A]', function: Union[Callable[[A], B], Callable[[A], 'State[S, B]']]
     ) -> 'State[S, B]':
-        return State(_bind_or_map(self, function)) # pylint: disable=no-value-for-parameter
+        """ See Monad.then. """
+        return self.__class__(_StateChain.extend(self.value, THEN, function))
@@ -0,0 +1,318 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Implements the AsyncStream monad for processing asynchronous iterables.
+
+An AsyncStream wraps an iterable or asynchronous iterable, a message
+queue consumer or an async generator tailing a file for instance, and
+processes it one item at a time. Nothing runs until the stream is
+iterated with 'async for', or collected with to_list, and only the
+items being processed are held in memory, however long the stream.
+
+  Example:
+    import asyncio
+    from pymonad.stream import AsyncStream
+
+    async def lines(path):
+        ...  # An async generator yielding the lines of a file.
+
+    async def main():
+        stream = (AsyncStream(lines('events.log'))
+                  .map(json.loads)
+                  .catch(lambda error: {'error': str(error)})
+                  .map_concurrent(store, limit=10) # At most 10 stores running.
+                  .chunks(100, max_delay=1.0))
+        async for stored in stream:
+            print(f'Stored {len(stored)} events.')
+
+    asyncio.run(main())
+
+Functions passed to map, bind, then and catch can be normal functions
+or coroutine functions. Iterating a stream more than once iterates its
+source again, which only works if the source itself can be iterated
+more than once: lists can, async generators can't.
+"""
+import asyncio
+from typing import (
+    AsyncIterable, AsyncIterator, Awaitable, Callable, Generic, Iterable, List, Optional, TypeVar, Union
+)
+
+import pymonad.monad
+import pymonad.promise
+import pymonad.runtime
+
+S = TypeVar('S') # pylint: disable=invalid-name
+T = TypeVar('T') # pylint: disable=invalid-name
+
+Items = Union[Iterable[T], AsyncIterable[T]]
+
+async def _map(items, function):
+    async for item in items:
+        result = function(item)
+        if pymonad.runtime.is_awaitable(result):
+            result = await result
+        yield result
+
+async def _bind(items, kleisli_function):
+    async for item in items:
+        result = kleisli_function(item)
+        if pymonad.runtime.is_awaitable(result):
+            result = await result
+        async for inner_item in pymonad.runtime.iterate(result):
+            yield inner_item
+
+async def _then(items, function):
+    async for item in items:
+        result = function(item)
+        if pymonad.runtime.is_awaitable(result):
+            result = await result
+        if isinstance(result, _AsyncStream):
+            async for inner_item in result:
+                yield inner_item
+        else:
+            yield result
+
+async def _catch(items, error_handler):
+    try:
+        async for item in items:
+            yield item
+    except Exception as error: # pylint: disable=broad-except
+        result = error_handler(error)
+        if pymonad.runtime.is_awaitable(result):
+            result = await result
+        if isinstance(result, _AsyncStream):
+            async for item in result:
+                yield item
+        else:
+            yield result
+
+async def _chunks(items, size):
+    chunk = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+async def _timed_chunks(items, size, max_delay):
+    """ Like _chunks but also yields a chunk 'max_delay' seconds after its first item arrived. """
+    loop = asyncio.get_running_loop()
+    chunk = []
+    deadline = None
+    next_item = None
+    try:
+        while True:
+            if next_item is None:
+                next_item = asyncio.ensure_future(anext(items))
+            done, _ = await asyncio.wait(
+                (next_item,), timeout=deadline - loop.time() if chunk else None
+            )
+            if not done:
+                yield chunk
+                chunk = []
+                continue
+            task, next_item = next_item, None
+            try:
+                item = task.result()
+            except StopAsyncIteration:
+                break
+            if not chunk:
+                deadline = loop.time() + max_delay
+            chunk.append(item)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        if next_item is not None:
+            await pymonad.runtime.cancel((next_item,))
+
+_END = object()
+
+async def _buffer(items, size):
+    """ Reads up to 'size' items ahead of the consumer in another task. """
+    queue = asyncio.Queue(size)
+    async def _produce():
+        try:
+            async for item in items:
+                await queue.put((item, None))
+        except Exception as error: # pylint: disable=broad-except
+            await queue.put((_END, error))
+        else:
+            await queue.put((_END, None))
+    producer = asyncio.ensure_future(_produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        await pymonad.runtime.cancel((producer,))
+
+def _check_size(name, size):
+    if size < 1:
+        raise ValueError(f'{name} must be at least 1, not {size}.')
+
+class _AsyncStream(pymonad.monad.Monad, Generic[T]):
+    """ The AsyncStream monad class.
+
+    'value' is a function taking no arguments and returning a new
+    asynchronous iterator over the items of the stream.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def insert(cls, value: T) -> '_AsyncStream[T]':
+        """ See Monad.insert. """
+        return cls(lambda: pymonad.runtime.iterate((value,)), None)
+
+    def amap(self: '_AsyncStream[Callable[[S], T]]', monad_value: '_AsyncStream[S]') -> '_AsyncStream[T]':
+        """ See Monad.amap.
+
+        Like ListMonad, applies every function to every value, so
+        'monad_value' is iterated once for each function.
+        """
+        return self.bind(monad_value.map)
+
+    def bind(
+            self: '_AsyncStream[S]', kleisli_function: Callable[[S], Union['_AsyncStream[T]', Items[T]]]
+    ) -> '_AsyncStream[T]':
+        """ See Monad.bind.
+
+        Also known as flat map: 'kleisli_function' can return an
+        AsyncStream, or any iterable or asynchronous iterable, and
+        every item it returns is passed on, in order.
+        """
+        return self.__class__(lambda: _bind(self.value(), kleisli_function), None)
+
+    def buffer(self: '_AsyncStream[T]', size: int) -> '_AsyncStream[T]':
+        """ Reads items ahead of whatever consumes the stream, up to 'size' of them.
+
+        Example:
+          AsyncStream(messages).map(parse).buffer(100).map_concurrent(store, limit=10)
+
+        The items are read, and every earlier step run, in another task
+        so a slow producer and a slow consumer work at the same time.
+        Once 'size' items are waiting, reading stops until the consumer
+        catches up, so memory stays bounded. Errors are raised to the
+        consumer when it reaches them. If the consumer stops early, the
+        task reading ahead is cancelled.
+
+        Args:
+          size: the most items read ahead.
+
+        Returns:
+          A new AsyncStream.
+        """
+        _check_size('size', size)
+        return self.__class__(lambda: _buffer(self.value(), size), None)
+
+    def catch(
+            self: '_AsyncStream[T]', error_handler: Callable[[Exception], Union[T, '_AsyncStream[T]']]
+    ) -> '_AsyncStream[T]':
+        """ Handles an error raised by an earlier step, or by the source.
+
+        The stream can't carry on after an error so it ends with the
+        result of 'error_handler': a single item, or the items of an
+        AsyncStream if it returns one. Use 'catch' inside the function
+        passed to map_concurrent, or handle errors in the functions
+        passed to map, to deal with errors item by item.
+
+        Args:
+          error_handler: a function which takes an Exception as input.
+
+        Returns:
+          A new AsyncStream.
+        """
+        return self.__class__(lambda: _catch(self.value(), error_handler), None)
+
+    def chunks(self: '_AsyncStream[T]', size: int, max_delay: Optional[float] = None) -> '_AsyncStream[List[T]]':
+        """ Groups the items into lists of up to 'size' items.
+
+        Example:
+          AsyncStream(events).chunks(500, max_delay=0.1).map(insert_rows)
+
+        Args:
+          size: the most items in a list. Only the last list can be
+            shorter, unless 'max_delay' is given.
+          max_delay: if given, a list is also passed on when this many
+            seconds have passed since its first item arrived, however
+            few items it holds, so a slow source doesn't hold items
+            back for long.
+
+        Returns:
+          A new AsyncStream of lists.
+        """
+        _check_size('size', size)
+        if max_delay is None:
+            return self.__class__(lambda: _chunks(self.value(), size), None)
+        return self.__class__(lambda: _timed_chunks(self.value(), size, max_delay), None)
+
+    def map(self: '_AsyncStream[S]', function: Callable[[S], Union[T, Awaitable[T]]]) -> '_AsyncStream[T]':
+        """ See Monad.map. If 'function' returns an awaitable, it is awaited. """
+        return self.__class__(lambda: _map(self.value(), function), None)
+
+    def map_concurrent(
+            self: '_AsyncStream[S]',
+            kleisli_function: Callable[[S], Union['pymonad.promise._Promise[T]', Awaitable[T], T]],
+            limit: int,
+            ordered: bool = True
+    ) -> '_AsyncStream[T]':
+        """ Like map but runs 'kleisli_function' on up to 'limit' items at once.
+
+        See Promise.map_concurrent: items are read only as running
+        calls finish and, unless 'ordered' is False, passed on in the
+        same order they arrived. If a call fails, the others are
+        cancelled and the stream fails with the same error.
+
+        Args:
+          kleisli_function: a function taking a single item and
+            returning a Promise, or any other awaitable or plain value.
+          limit: the most calls running at once.
+          ordered: if False, results are passed on as soon as they're
+            ready instead.
+
+        Returns:
+          A new AsyncStream.
+        """
+        pymonad.runtime.check_limit(limit)
+        return self.__class__(
+            lambda: pymonad.runtime.map_concurrent(self, kleisli_function, limit, ordered), None
+        )
+
+    def then(
+            self: '_AsyncStream[S]', function: Union[Callable[[S], T], Callable[[S], '_AsyncStream[T]']]
+    ) -> '_AsyncStream[T]':
+        """ See Monad.then. """
+        return self.__class__(lambda: _then(self.value(), function), None)
+
+    def to_list(self: '_AsyncStream[T]') -> 'pymonad.promise._Promise[List[T]]':
+        """ Returns a Promise of a list of every item in the stream. """
+        async def _to_list(_):
+            return [item async for item in self]
+        return pymonad.promise.Promise.insert(None).then(_to_list)
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.value()
+
+def AsyncStream(items: Items[T]) -> _AsyncStream[T]: # pylint: disable=invalid-name
+    """ Constructs an AsyncStream over the items of an iterable or asynchronous iterable.
+
+    Args:
+      items: any iterable, a list or generator for instance, or
+        asynchronous iterable, an async generator for instance.
+
+    Returns:
+      A new AsyncStream object.
+    """
+    return _AsyncStream(lambda: pymonad.runtime.iterate(items), None)
+
+AsyncStream.apply = _AsyncStream.apply
+AsyncStream.insert = _AsyncStream.insert
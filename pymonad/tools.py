@@ -4,7 +4,10 @@
 # --------------------------------------------------------
 """ The tools module contains useful functions that don't really belong anywhere else. """
 
-from typing import Any, Callable, List, TypeVar
+import importlib
+import inspect
+import types
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, TypeVar
 
 import pymonad.monad as monad
 
@@ -12,76 +15,211 @@ R = TypeVar('R') # pylint: disable=invalid-name
 S = TypeVar('S') # pylint: disable=invalid-name
 T = TypeVar('T') # pylint: disable=invalid-name
 
-def _curry_helper(
-        number_of_arguments: int, function_to_curry: Callable, accumulated_arguments: List[Any]
-) -> Callable:
-    """ Builds a curried version of the supplied function and returns it to the caller.
-
-    Args:
-      number_of_arguments: specifies how many arguments 'function_to_curry' takes as input.
-      function_to_curry: a function or other callable object either built-in or user defined.
-      accumulated_arguments: a list containing all the arguments so
-        far supplied to 'function_to_curry'. For instance, if
-        'function_to_curry' takes two arguments but has been called with
-        only one so far, then accumulated_arguments will contain a
-        single item.
-
-    Returns:
-      A new function which may be partially applied simply by passing
-      the desired number of arguments.
+class _Curried:
+    """ A curried function or other callable object.
+
+    Calling a _Curried object collects positional arguments until at
+    least 'number_of_arguments' have been supplied and then calls the
+    wrapped function with all of them. Until then, each call returns a
+    new _Curried object holding the arguments supplied so far. Keyword
+    arguments are collected along the way and passed through to the
+    wrapped function. They count towards 'number_of_arguments' only if
+    they name one of the first 'number_of_arguments' parameters of the
+    wrapped function.
+
+    _Curried objects keep the name, docstring and signature of the
+    wrapped function, can be used as methods and, as long as the
+    wrapped function itself can be, they can be pickled and sent to a
+    process pool.
     """
-    def _curry_internal(*arguments: List[Any]):
-        """ Handles the actual partial application of curried functions.
+    __slots__ = (
+        'function', 'number_of_arguments', 'arguments', 'keywords', 'parameters', '__weakref__'
+    )
+
+    def __init__(
+            self,
+            function: Callable,
+            number_of_arguments: int,
+            arguments: Tuple[Any, ...] = (),
+            keywords: Optional[Dict[str, Any]] = None,
+            parameters: Optional[FrozenSet[str]] = None
+    ):
+        """ Initializes a curried function.
 
         Args:
-          *arguments: a variable number of arguments to be
-             (eventually) supplied to the wrapped function
-             'function_to_curry'
+          function: a function or other callable object either built-in or user defined.
+          number_of_arguments: specifies how many arguments 'function' takes as input.
+          arguments: a tuple containing the positional arguments so far supplied to 'function'.
+          keywords: a dictionary containing the keyword arguments so far supplied to 'function'.
+          parameters: the names of the parameters counted by
+            'number_of_arguments'. Worked out from the signature of
+            'function', the first time keyword arguments are supplied,
+            if not given.
+        """
+        self.function = function
+        self.number_of_arguments = number_of_arguments
+        self.arguments = arguments
+        self.keywords = keywords or {}
+        self.parameters = parameters
+
+    def __call__(self, *arguments: Any, **keywords: Any) -> Any:
+        """ Handles the actual partial application of curried functions.
 
         Returns:
-          Either the result of calling the wrapped function_to_curry
-          with the total accumulated arguments or the result of
-          calling _curry_helper with the new, larger
-          accumulated_arguments list.
+          Either the result of calling the wrapped function with the
+          total accumulated arguments or a new curried function
+          holding the new, larger, set of arguments.
         """
-        all_arguments = accumulated_arguments[:]
-        all_arguments.extend(arguments)
-        if len(all_arguments) >= number_of_arguments: # pylint: disable=no-else-return
-            return function_to_curry(*all_arguments)
-        else:
-            return _curry_helper(number_of_arguments, function_to_curry, all_arguments)
-    return _curry_internal
-
-# Use _curry_helper to define curry as itself being a curried function.
-curry = _curry_helper(2, lambda n, f: _curry_helper(n, f, []), []) # pylint: disable=invalid-name
-curry.__doc__ = """ Creates a curried function from a normal function of callable object.
-
-The curry function is itself curried and can be partially
-applied. It can be used either as a normal function call or as a
-decorator. The required number_of_arguments parameter makes it
-possible to curry functions which take a variable number of
-arguments like the built-in 'map' function.
-
-    Usage:
-
-    curried_map = curry(2, map)
-
-    @curry(2)
-    def some_func(x, y, z):
-        return x + y - z
-
-Args:
-    number_of_arguments: The number of arguments function_to_curry
-    takes as input. If function_to_curry takes a variable number of
-    arguments, then number of curried arguments desired in the
-    result: function_to_curry will be called once this many
-    arguments have been supplied.
-    function_to_curry: The function that we wish to curry
-
-Returns:
-    A new function which may be partially applied simply by passing
-    the desired number of arguments.
-"""
+        if self.arguments:
+            arguments = self.arguments + arguments
+        if keywords or self.keywords:
+            return self._call_with_keywords(arguments, keywords)
+        if len(arguments) >= self.number_of_arguments:
+            return self.function(*arguments)
+        return self._partial(arguments, self.keywords)
+
+    def _call_with_keywords(self, arguments: Tuple[Any, ...], keywords: Dict[str, Any]) -> Any:
+        if self.parameters is None:
+            self.parameters = _parameter_names(self.function, self.number_of_arguments)
+        keywords = {**self.keywords, **keywords}
+        supplied = len(arguments) + len(self.parameters.intersection(keywords))
+        if supplied >= self.number_of_arguments:
+            return self.function(*arguments, **keywords)
+        return self._partial(arguments, keywords)
+
+    def _partial(self, arguments: Tuple[Any, ...], keywords: Dict[str, Any]) -> '_Curried':
+        # Skips __init__: partial application happens on every call
+        # so it's worth avoiding the extra overhead.
+        partial = _new_curried(_Curried)
+        partial.function = self.function
+        partial.number_of_arguments = self.number_of_arguments
+        partial.arguments = arguments
+        partial.keywords = keywords
+        partial.parameters = self.parameters
+        return partial
+
+    def __get__(self, instance: Any, owner: Any = None) -> Callable:
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def __reduce__(self):
+        # Decorating a function with curry replaces the module level
+        # name with the curried function, so the wrapped function can't
+        # be pickled by name. Pickle the module level curried function
+        # instead, along with any arguments supplied so far.
+        name = (getattr(self.function, '__module__', None), self.__qualname__)
+        named = _find_global(*name)
+        if named is self:
+            return _find_global, name
+        if (isinstance(named, _Curried)
+                and named.function is self.function
+                and named.number_of_arguments == self.number_of_arguments
+                and not named.arguments and not named.keywords):
+            return _restore_curried, (named, self.arguments, self.keywords)
+        return _Curried, (self.function, self.number_of_arguments, self.arguments, self.keywords)
+
+    def __repr__(self):
+        arguments = [repr(argument) for argument in self.arguments]
+        arguments.extend(f'{name}={value!r}' for name, value in self.keywords.items())
+        return f'<curried {self.__qualname__}({", ".join(arguments)})>'
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes which aren't otherwise found,
+        # __name__ and __qualname__ for instance.
+        if name in ('__name__', '__qualname__'):
+            return getattr(self.function, name, type(self.function).__name__)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def __signature__(self):
+        signature = inspect.signature(self.function)
+        parameters = []
+        remaining = len(self.arguments)
+        for parameter in signature.parameters.values():
+            if remaining and parameter.kind in _POSITIONAL:
+                remaining -= 1
+            elif parameter.name in self.keywords:
+                parameters.append(parameter.replace(
+                    kind=inspect.Parameter.KEYWORD_ONLY, default=self.keywords[parameter.name]
+                ))
+            else:
+                parameters.append(parameter)
+        parameters.sort(key=lambda parameter: parameter.kind)
+        return signature.replace(parameters=parameters)
+
+    @property
+    def __wrapped__(self):
+        return self.function
+
+_new_curried = object.__new__
+
+# Curried functions report the docstring of the function they wrap.
+_Curried.__doc__ = property(lambda self: self.function.__doc__, doc=_Curried.__doc__)
+
+_POSITIONAL = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+def _parameter_names(function: Callable, number_of_arguments: int) -> FrozenSet[str]:
+    """ Returns the names of the first 'number_of_arguments' positional parameters of 'function'. """
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    positional = [parameter.name for parameter in parameters if parameter.kind in _POSITIONAL]
+    return frozenset(positional[:number_of_arguments])
+
+def _find_global(module_name: Optional[str], qualified_name: str) -> Any:
+    """ Returns the module level object with the given name, or None if there isn't one. """
+    try:
+        found = importlib.import_module(module_name)
+        for name in qualified_name.split('.'):
+            found = getattr(found, name)
+        return found
+    except (AttributeError, ImportError, TypeError, ValueError):
+        return None
+
+def _restore_curried(
+        curried: _Curried, arguments: Tuple[Any, ...], keywords: Dict[str, Any]
+) -> _Curried:
+    """ Rebuilds a partially applied, pickled, curried function. """
+    return _Curried(
+        curried.function, curried.number_of_arguments, arguments, keywords, curried.parameters
+    )
+
+def _curry(number_of_arguments: int, function_to_curry: Callable) -> Callable:
+    """ Creates a curried function from a normal function of callable object.
+
+    The curry function is itself curried and can be partially
+    applied. It can be used either as a normal function call or as a
+    decorator. The required number_of_arguments parameter makes it
+    possible to curry functions which take a variable number of
+    arguments like the built-in 'map' function.
+
+        Usage:
+
+        curried_map = curry(2, map)
+
+        @curry(2)
+        def some_func(x, y, z):
+            return x + y - z
+
+    Args:
+        number_of_arguments: The number of arguments function_to_curry
+        takes as input. If function_to_curry takes a variable number of
+        arguments, then number of curried arguments desired in the
+        result: function_to_curry will be called once this many
+        arguments have been supplied.
+        function_to_curry: The function that we wish to curry
+
+    Returns:
+        A new function which may be partially applied simply by passing
+        the desired number of arguments.
+    """
+    return _Curried(function_to_curry, number_of_arguments)
+
+# Use _Curried to define curry as itself being a curried function.
+_curry.__name__ = _curry.__qualname__ = 'curry'
+curry = _Curried(_curry, 2) # pylint: disable=invalid-name
 
 def identity(value: T) -> T:
     """ Returns it's input value unchanged. """
@@ -0,0 +1,126 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+""" Records how long each step of a Promise chain takes.
+
+Tracing is off unless a 'with trace()' block is being run. Inside
+one, every Promise awaited records a span for the chain and a span
+for each of its steps, nested under the span of whichever step
+awaited it. Steps started from inside the block, in other tasks
+created by Promise.apply or Promise.all for instance, are recorded
+too.
+
+Each step's time is split into the time spent running, on the event
+loop's thread, and the time spent waiting: for a timer, the network,
+another thread or another task to finish. A slow step with a long
+wait is waiting on something slow, one with a long run time is
+blocking the event loop.
+
+  Example:
+    import pymonad.trace
+
+    async def main():
+        with pymonad.trace.trace('request') as span:
+            await Promise.insert(url).then(fetch).map(parse)
+        print(span.to_json(indent=2))
+
+Steps on promises which have already resolved, Promise.insert(1).map(f)
+for instance, run straight away rather than when the promise is
+awaited, so they aren't recorded.
+"""
+import contextlib
+import json
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import pymonad.runtime
+
+class Span:
+    """ The timings of a chain, a step or a whole traced block.
+
+    Attributes:
+      name: what was timed: the kind of step followed by the qualified
+        name of its function, 'map mymodule.parse' for instance.
+      start_ns: when it started, by time.perf_counter_ns.
+      end_ns: when it ended, or None if it hasn't yet.
+      run_ns: the time spent running on the event loop's thread, in
+        nanoseconds, or None for the span of a traced block.
+      wait_ns: the time spent waiting, in nanoseconds, or None for the
+        span of a traced block.
+      error: the exception raised, if any.
+      children: the spans of chains or steps run while this one ran.
+    """
+    __slots__ = ('name', 'start_ns', 'end_ns', 'run_ns', 'wait_ns', 'error', 'children')
+
+    def __init__(self, name: str, timed: bool = True):
+        self.name = name
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.run_ns: Optional[int] = 0 if timed else None
+        self.wait_ns: Optional[int] = 0 if timed else None
+        self.error: Optional[BaseException] = None
+        self.children: List['Span'] = []
+
+    @property
+    def duration_ns(self) -> Optional[int]:
+        """ The time from start to end, in nanoseconds, or None if the span hasn't ended. """
+        return None if self.end_ns is None else self.end_ns - self.start_ns
+
+    def child(self, name: str) -> 'Span':
+        """ Starts a new span nested in this one. """
+        span = Span(name)
+        self.children.append(span)
+        return span
+
+    def finish(self) -> None:
+        """ Ends the span. """
+        self.end_ns = time.perf_counter_ns()
+
+    def to_dict(self, origin_ns: Optional[int] = None) -> Dict[str, Any]:
+        """ Returns the span, and its children, as a dictionary of plain values.
+
+        Args:
+          origin_ns: the time start times are measured from. If None,
+            this span's start, so its own start is 0.
+        """
+        if origin_ns is None:
+            origin_ns = self.start_ns
+        span = {'name': self.name, 'start_ns': self.start_ns - origin_ns, 'duration_ns': self.duration_ns}
+        if self.run_ns is not None:
+            span['run_ns'] = self.run_ns
+            span['wait_ns'] = self.wait_ns
+        if self.error is not None:
+            span['error'] = repr(self.error)
+        span['children'] = [child.to_dict(origin_ns) for child in self.children]
+        return span
+
+    def to_json(self, **kwargs: Any) -> str:
+        """ Returns to_dict() as JSON. 'kwargs' are passed on to json.dumps. """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __repr__(self):
+        return f'Span({self.name!r}, duration_ns={self.duration_ns}, children={len(self.children)})'
+
+@contextlib.contextmanager
+def trace(name: str = 'trace') -> Iterator[Span]:
+    """ Records every Promise chain run inside a 'with' block.
+
+    Args:
+      name: the name of the span covering the whole block.
+
+    Returns:
+      A context manager giving the block's Span. Once the block ends,
+      its children are the spans of the chains awaited inside it.
+    """
+    span = Span(name, timed=False)
+    token = pymonad.runtime.current_span.set(span)
+    try:
+        yield span
+    finally:
+        pymonad.runtime.current_span.reset(token)
+        span.finish()
+
+def current_span() -> Optional[Span]:
+    """ Returns the span of the step being run, or of the innermost traced block, or None if not tracing. """
+    return pymonad.runtime.current_span.get()
@@ -35,6 +35,8 @@ T = TypeVar('T') # pylint: disable=invalid-name
 
 class Writer(pymonad.monad.Monad, Generic[T]):
     """ The Writer monad class. """
+    __slots__ = ()
+
     @classmethod
     def insert(cls, value: T) -> 'Writer[T]':
         """ See Monad.insert. """
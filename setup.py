@@ -8,7 +8,7 @@ setuptools.setup(
     version='2.4.0',
     author='Jason DeLaat',
     author_email='jason.develops@gmail.com',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=['benchmarks', 'benchmarks.*']),
     url='https://github.com/jasondelaat/pymonad',
     license='BSD-3-Clause',
     description='Data structures and utilities for monadic style functional programming.',
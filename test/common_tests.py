@@ -61,6 +61,21 @@ class ApplicativeTests:
             )
         )
 
+    def test_application_to_several_arguments(self):
+        self.assertEqual(
+            self._class.apply(lambda a: lambda b: lambda c: a + b * c).to_arguments(
+                self._class.insert(1),
+                self._class.insert(2),
+                self._class.insert(3)),
+            self._class.insert(7)
+        )
+
+    def test_apply_does_not_create_classes(self):
+        self.assertIs(
+            type(self._class.apply(add)),
+            type(self._class.apply(mul))
+        )
+
 class MonadTests:
     def setUp(self):
         raise NotImplementedError('MonadTests: You need to set self._class to the monad class being tested.')
@@ -0,0 +1,75 @@
+# --------------------------------------------------------
+# (c) Copyright 2014, 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+import unittest
+
+import common_tests
+from pymonad.either import Left, Right
+from pymonad.list import ListMonad
+from pymonad.maybe import Just, Nothing
+from pymonad.writer import Writer
+
+class CountingFunction:
+    def __init__(self, function):
+        self.calls = 0
+        self.function = function
+
+    def __call__(self, value):
+        self.calls += 1
+        return self.function(value)
+
+class LazyTests(unittest.TestCase):
+    def test_nothing_is_recorded_until_run(self):
+        inc = CountingFunction(common_tests.add(1))
+        chain = Just(1).lazy().map(inc).then(inc)
+        self.assertEqual(inc.calls, 0)
+        self.assertEqual(chain.run(), Just(3))
+        self.assertEqual(inc.calls, 2)
+
+    def test_matches_eager_maybe(self):
+        add, mul = common_tests.add, common_tests.mul
+        self.assertEqual(
+            Just(1).lazy().map(add(1)).map(mul(3)).then(lambda x: Just(x - 1)).run(),
+            Just(1).map(add(1)).map(mul(3)).then(lambda x: Just(x - 1))
+        )
+
+    def test_consecutive_maps_are_fused(self):
+        calls = []
+        class Recording(Writer):
+            def map(self, function):
+                calls.append(function)
+                return super().map(function)
+        result = (Recording.insert(1).lazy()
+                  .map(common_tests.add(1))
+                  .map(common_tests.mul(2))
+                  .map(common_tests.add(3))
+                  .run())
+        self.assertEqual(result, Writer.insert(7))
+        self.assertEqual(len(calls), 1)
+
+    def test_nothing_skips_remaining_steps(self):
+        inc = CountingFunction(common_tests.add(1))
+        result = Just(1).lazy().then(lambda x: Nothing).map(inc).bind(lambda x: Just(inc(x))).run()
+        self.assertEqual(result, Nothing)
+        self.assertEqual(inc.calls, 0)
+
+    def test_left_skips_remaining_steps(self):
+        inc = CountingFunction(common_tests.add(1))
+        result = Right(1).lazy().map(inc).then(lambda x: Left('error')).map(inc).then(inc).run()
+        self.assertEqual(result, Left('error'))
+        self.assertEqual(inc.calls, 1)
+
+    def test_list(self):
+        result = (ListMonad(1, 2).lazy()
+                  .map(common_tests.add(1))
+                  .map(common_tests.mul(10))
+                  .then(lambda x: ListMonad(x, -x))
+                  .run())
+        self.assertEqual(result, ListMonad(20, -20, 30, -30))
+
+    def test_chains_can_be_shared(self):
+        chain = Just(1).lazy().map(common_tests.add(1))
+        self.assertEqual(chain.map(common_tests.mul(10)).run(), Just(20))
+        self.assertEqual(chain.then(lambda x: Nothing).run(), Nothing)
+        self.assertEqual(chain.run(), Just(2))
@@ -23,6 +23,13 @@ class EitherTests(unittest.TestCase):
     def test_either_extraction_with_Right_value(self):
         self.assertEqual(Right(1).either(lambda e: 'Left', lambda r: 'Right'), 'Right')
 
+    def test_values_have_no_dict(self):
+        for value in (Right(1), Left(1), Result(1), Error(1)):
+            self.assertFalse(hasattr(value, '__dict__'))
+
+    def test_right_values_share_their_monoid(self):
+        self.assertIs(Right(1).monoid, Right(2).map(lambda x: x).monoid)
+
 class ErrorTests(unittest.TestCase):
     def test_repr(self):
         self.assertEqual(str(Result(9)), 'Result: 9')
@@ -64,6 +71,12 @@ class EitherApplicative(common_tests.ApplicativeTests, unittest.TestCase):
             Left('')
         )
 
+    def test_applying_with_several_lefts_returns_the_first(self):
+        self.assertEqual(
+            Either.apply(common_tests.add).to_arguments(Left('first'), Left('second')),
+            Left('first')
+        )
+
 class EitherMonad(common_tests.MonadTests, unittest.TestCase):
     def setUp(self):
         self._class = Either
@@ -0,0 +1,91 @@
+# --------------------------------------------------------
+# (c) Copyright 2014, 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+import asyncio
+import unittest
+
+import common_tests
+import pymonad.instrument as instrument
+from pymonad.maybe import Just, Maybe
+from pymonad.promise import Promise
+from pymonad.state import State
+
+def inc(x):
+    return x + 1
+
+def k_inc(x):
+    return Just(x + 1)
+
+class InstrumentTests(unittest.TestCase):
+    def setUp(self):
+        instrument.reset()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(instrument.is_enabled())
+        Just(1).map(inc)
+        self.assertEqual(instrument.snapshot(), {})
+
+    def test_disable_restores_original_methods(self):
+        original = Maybe.__dict__['map']
+        instrument.enable()
+        self.assertIsNot(Maybe.__dict__['map'], original)
+        instrument.disable()
+        self.assertIs(Maybe.__dict__['map'], original)
+
+    def test_counts_method_and_function_calls(self):
+        with instrument.instrumented():
+            self.assertEqual(Just(1).map(inc).bind(k_inc).map(inc), Just(4))
+        statistics = instrument.snapshot()
+        self.assertEqual(statistics[('Maybe', 'map', None)].count, 2)
+        self.assertEqual(statistics[('Maybe', 'bind', None)].count, 1)
+        self.assertEqual(statistics[('Maybe', 'map', f'{__name__}.inc')].count, 2)
+        self.assertEqual(statistics[('Maybe', 'bind', f'{__name__}.k_inc')].count, 1)
+        self.assertFalse(instrument.is_enabled())
+
+    def test_internal_calls_are_not_counted(self):
+        with instrument.instrumented():
+            State.insert(1).then(inc).run(0)
+        statistics = instrument.snapshot()
+        self.assertEqual(statistics[('State', 'then', None)].count, 1)
+        self.assertEqual(statistics[('State', 'then', f'{__name__}.inc')].count, 1)
+        self.assertNotIn(('State', 'map', None), statistics)
+
+    def test_deferred_functions_are_counted_when_run(self):
+        with instrument.instrumented():
+            state = State.insert(1).map(inc).map(inc)
+            self.assertNotIn(('State', 'map', f'{__name__}.inc'), instrument.snapshot())
+            self.assertEqual(state.run(0), (3, 0))
+        self.assertEqual(instrument.snapshot()[('State', 'map', f'{__name__}.inc')].count, 2)
+
+    def test_coroutine_functions(self):
+        async def slow_inc(x):
+            await asyncio.sleep(0.01)
+            return x + 1
+        async def run(promise):
+            return await promise
+        loop = asyncio.new_event_loop()
+        with instrument.instrumented():
+            self.assertEqual(loop.run_until_complete(run(Promise.insert(1).map(inc).then(slow_inc))), 3)
+        loop.close()
+        statistics = instrument.snapshot()
+        slow = statistics[('_Promise', 'then', slow_inc.__module__ + '.' + slow_inc.__qualname__)]
+        self.assertEqual(slow.count, 1)
+        self.assertGreaterEqual(slow.min_ns, 10**7)
+
+    def test_histogram(self):
+        statistics = instrument.Statistics()
+        for elapsed_ns in (1, 2, 3, 1000):
+            statistics.add(elapsed_ns)
+        self.assertEqual(statistics.histogram, {1: 1, 2: 2, 10: 1})
+        self.assertEqual((statistics.min_ns, statistics.max_ns), (1, 1000))
+        self.assertEqual(statistics.mean_ns, 1006 / 4)
+
+    def test_report(self):
+        with instrument.instrumented():
+            Just(1).map(common_tests.add(1))
+        self.assertIn('Maybe', instrument.report())
@@ -2,11 +2,12 @@
 # (c) Copyright 2014, 2020 by Jason DeLaat.
 # Licensed under BSD 3-clause licence.
 # --------------------------------------------------------
+import sys
 import unittest
 
 import common_tests
 import pymonad
-from pymonad.io import _IO
+from pymonad.io import IO, _IO
 
 class EqIO(_IO):
     def __eq__(self, other):
@@ -22,6 +23,37 @@ class IOTests(unittest.TestCase):
             2
         )
 
+    def test_long_chains_do_not_overflow_the_stack(self):
+        action = IO(lambda: 0)
+        for _ in range(10 * sys.getrecursionlimit()):
+            action = action.then(lambda x: IO(lambda: x + 1))
+        self.assertEqual(action.run(), 10 * sys.getrecursionlimit())
+
+    def test_actions_are_not_run_until_requested(self):
+        log = []
+        action = IO(lambda: log.append('run') or 1).map(lambda x: x + 1)
+        self.assertEqual(log, [])
+        self.assertEqual(action.run(), 2)
+        self.assertEqual(action.run(), 2)
+        self.assertEqual(log, ['run', 'run'])
+
+    def test_sequence(self):
+        log = []
+        action = IO.sequence(IO(lambda i=i: log.append(i) or i * 2) for i in range(3))
+        self.assertEqual(log, [])
+        self.assertEqual(action.run(), [0, 2, 4])
+        self.assertEqual(log, [0, 1, 2])
+
+    def test_sequence_of_many_actions(self):
+        count = 10 * sys.getrecursionlimit()
+        self.assertEqual(IO.sequence(IO.insert(i) for i in range(count)).run(), list(range(count)))
+
+    def test_traverse(self):
+        self.assertEqual(
+            IO.traverse(lambda x: IO(lambda: x + 1), range(3)).run(),
+            [1, 2, 3]
+        )
+
 class IOFunctor(common_tests.FunctorTests, unittest.TestCase):
     def setUp(self):
         self._class = EqIO
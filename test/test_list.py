@@ -5,7 +5,8 @@
 import unittest
 
 import common_tests
-from pymonad.list import ListMonad
+from pymonad.list import LazyListMonad, ListMonad
+from pymonad.maybe import Just, Nothing
 from pymonad.monoid import IDENTITY
 
 class ListTests(unittest.TestCase):
@@ -52,6 +53,21 @@ class ListThenTests(common_tests.ThenTests, unittest.TestCase):
     def setUp(self):
         self._class = ListMonad
 
+    def test_then_does_not_flatten_iterable_values(self):
+        self.assertEqual(
+            ListMonad('ab', 'cd').then(lambda s: s.upper()),
+            ListMonad('AB', 'CD')
+        )
+
+    def test_then_flattens_list_monad_values(self):
+        self.assertEqual(
+            ListMonad(1, 2).then(lambda x: ListMonad(x, -x)),
+            ListMonad(1, -1, 2, -2)
+        )
+
+    def test_then_flattens_plain_lists(self):
+        self.assertEqual(ListMonad(1, 2).then(lambda x: [x, -x]), ListMonad(1, -1, 2, -2))
+
 class ListMonoidTests(unittest.TestCase):
     def test_identity_element(self):
         self.assertEqual(
@@ -89,3 +105,88 @@ class ListMonoidTests(unittest.TestCase):
             ListMonad(1, 2, 3) + IDENTITY
         )
         
+
+def _naturals():
+    number = 0
+    while True:
+        yield number
+        number += 1
+
+class LazyListFunctor(common_tests.FunctorTests, unittest.TestCase):
+    def setUp(self):
+        self._class = LazyListMonad
+
+class LazyListApplicative(common_tests.ApplicativeTests, unittest.TestCase):
+    def setUp(self):
+        self._class = LazyListMonad
+
+    def test_proper_output(self):
+        self.assertEqual(
+            LazyListMonad.apply(common_tests.add).to_arguments(LazyListMonad(1, 2, 3), LazyListMonad(4, 5, 6)),
+            ListMonad(5, 6, 7, 6, 7, 8, 7, 8, 9)
+        )
+
+class LazyListMonadTests(common_tests.MonadTests, unittest.TestCase):
+    def setUp(self):
+        self._class = LazyListMonad
+
+class LazyListThenTests(common_tests.ThenTests, unittest.TestCase):
+    def setUp(self):
+        self._class = LazyListMonad
+
+    def test_then_flattens_list_monad_values(self):
+        self.assertEqual(
+            LazyListMonad(1, 2).then(lambda x: ListMonad(x, -x)),
+            LazyListMonad(1, -1, 2, -2)
+        )
+
+    def test_then_flattens_plain_lists(self):
+        self.assertEqual(LazyListMonad(1, 2).then(lambda x: [x, -x]), LazyListMonad(1, -1, 2, -2))
+
+class LazyListTests(unittest.TestCase):
+    def test_steps_run_only_when_iterated(self):
+        calls = []
+        lazy = LazyListMonad(1, 2).map(calls.append)
+        self.assertEqual(calls, [])
+        lazy.to_list()
+        self.assertEqual(calls, [1, 2])
+
+    def test_take_stops_early(self):
+        lazy = LazyListMonad.from_iterable(_naturals()).bind(lambda x: ListMonad(x, -x))
+        self.assertEqual(lazy.take(5).to_list(), ListMonad(0, 0, 1, -1, 2))
+
+    def test_first(self):
+        self.assertEqual(
+            LazyListMonad.from_iterable(_naturals()).filter(lambda x: x * x > 50).first(), Just(8)
+        )
+        self.assertEqual(LazyListMonad().first(), Nothing)
+
+    def test_any(self):
+        self.assertTrue(LazyListMonad.from_iterable(_naturals()).any(lambda x: x > 10))
+        self.assertFalse(LazyListMonad(0, '').any())
+
+    def test_can_be_iterated_more_than_once(self):
+        lazy = LazyListMonad(1, 2).then(lambda x: LazyListMonad(x, x))
+        self.assertEqual(list(lazy), list(lazy))
+
+    def test_equal_to_list_monad(self):
+        self.assertEqual(ListMonad(1, 2), LazyListMonad(1, 2))
+        self.assertEqual(LazyListMonad.from_iterable(ListMonad(1, 2)).to_list(), ListMonad(1, 2))
+
+    def test_comparison_stops_at_the_first_difference(self):
+        self.assertNotEqual(LazyListMonad.from_iterable(_naturals()), ListMonad(0, 1, 5))
+        self.assertNotEqual(LazyListMonad.from_iterable(_naturals()), ListMonad(0, 1, 2))
+        self.assertNotEqual(LazyListMonad(1, 2), LazyListMonad(1, 2, 3))
+
+    def test_knight_moves(self):
+        def knight_move(position):
+            x, y = position
+            return ListMonad(*[
+                (x + dx, y + dy)
+                for dx, dy in ((1, 2), (2, 1), (-1, 2), (-2, 1), (1, -2), (2, -1), (-1, -2), (-2, -1))
+                if 0 <= x + dx < 8 and 0 <= y + dy < 8
+            ])
+        eager = ListMonad.insert((0, 0)).then(knight_move).then(knight_move).then(knight_move)
+        lazy = LazyListMonad.insert((0, 0)).then(knight_move).then(knight_move).then(knight_move)
+        self.assertEqual(lazy, eager)
+        self.assertEqual(lazy.first(), Just(list(eager)[0]))
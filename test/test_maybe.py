@@ -3,6 +3,7 @@
 # Licensed under BSD 3-clause licence.
 # --------------------------------------------------------
 import unittest
+import weakref
 
 import common_tests
 import pymonad.tools
@@ -33,6 +34,14 @@ class MaybeTests(unittest.TestCase):
     def test_maybe_method_with_Just_value(self):
         self.assertEqual(Just(1).maybe('a', lambda i: str(i)), '1')
 
+    def test_values_have_no_dict(self):
+        for value in (Just(1), Nothing, Some(1)):
+            self.assertFalse(hasattr(value, '__dict__'))
+
+    def test_values_can_be_weakly_referenced(self):
+        value = Just(1)
+        self.assertIs(weakref.ref(value)(), value)
+
 class OptionTests(unittest.TestCase):
     def test_repr_Some(self):
         self.assertEqual(str(Some(9)), 'Some 9')
@@ -75,6 +84,12 @@ class MaybeApplicative(common_tests.ApplicativeTests, unittest.TestCase):
             Nothing
         )
 
+    def test_applying_option_returns_option(self):
+        self.assertEqual(
+            str(Option.apply(common_tests.add).to_arguments(Some(1), Some(2))),
+            'Some 3'
+        )
+
 class MaybeMonad(common_tests.MonadTests, unittest.TestCase):
     def setUp(self):
         self._class = Maybe
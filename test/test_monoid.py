@@ -15,3 +15,11 @@ class MZero_Tests(unittest.TestCase):
 
     def test_repr(self):
         self.assertEqual(str(monoid.IDENTITY), 'IDENTITY')
+
+class MonoidTests(unittest.TestCase):
+    def test_value(self):
+        self.assertEqual(monoid.Monoid(3).value, 3)
+
+    def test_none_is_not_allowed(self):
+        with self.assertRaises(ValueError):
+            monoid.Monoid(None)
@@ -5,7 +5,7 @@
 
 import unittest
 import common_tests
-from pymonad.operators.list import _List
+from pymonad.operators.list import _LazyList, _List
 
 class Operator_ListFunctor(common_tests.FunctorOperatorTests, unittest.TestCase):
     def setUp(self):
@@ -18,3 +18,21 @@ class Operator_ListApplicative(common_tests.FunctorOperatorTests, unittest.TestC
 class Operator_ListMonad(common_tests.FunctorOperatorTests, unittest.TestCase):
     def setUp(self):
         self._class = _List
+
+class Operator_LazyListFunctor(common_tests.FunctorOperatorTests, unittest.TestCase):
+    def setUp(self):
+        self._class = _LazyList
+
+class Operator_LazyListApplicative(common_tests.ApplicativeOperatorTests, unittest.TestCase):
+    def setUp(self):
+        self._class = _LazyList
+
+class Operator_LazyListMonad(common_tests.MonadOperatorTests, unittest.TestCase):
+    def setUp(self):
+        self._class = _LazyList
+
+class Operator_LazyListTests(unittest.TestCase):
+    def test_to_list_keeps_the_operators(self):
+        eager = _LazyList.insert(1).to_list()
+        self.assertIsInstance(eager, _List)
+        self.assertEqual(eager >> (lambda x: _List([x, x + 1], None)), _List([1, 2], None))
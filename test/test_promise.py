@@ -4,10 +4,18 @@
 # --------------------------------------------------------
 import unittest
 import asyncio
+import concurrent.futures
+import math
+import sys
+import threading
+import time
+import unittest.mock
 
 import common_tests
 import pymonad.monad
-from pymonad.promise import Promise, _Promise
+import pymonad.tools
+from pymonad.either import Left, Right
+from pymonad.promise import Promise, _Promise, async_batch, cached_async_func, remaining_time
 
 def _run(coro):
     return asyncio.get_event_loop().run_until_complete(coro)
@@ -76,6 +84,15 @@ class PromiseApplicativeTests(unittest.TestCase):
             ))
         )
 
+    def test_application_to_several_arguments(self):
+        self.assertEqual(
+            _run(self._class.apply(lambda a: lambda b: lambda c: a + b * c).to_arguments(
+                self._class.insert(1),
+                self._class.insert(2),
+                self._class.insert(3))),
+            7
+        )
+
 
 def inc(value):
     return Promise(lambda resolve, reject: resolve(value + 1))
@@ -125,6 +142,12 @@ class PromiseThenTests(unittest.TestCase):
             _run(inc(0))
         )
 
+    def test_then_does_not_hide_errors_raised_by_kleisli_results(self):
+        def fail(resolve, reject):
+            raise TypeError('raised by user code')
+        with self.assertRaises(TypeError):
+            _run(self._class.insert(0).then(lambda x: Promise(fail)))
+
 from pymonad.promise import async_func
 
 def my_func(x: int, y: int = 1, z: int = 1):
@@ -151,3 +174,767 @@ class PromiseAlgebraFunctions(unittest.TestCase):
 
 
 
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    async def long_id(self, x):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return x
+
+class PromiseMemoizeTests(unittest.TestCase):
+    def test_fan_out_runs_upstream_once(self):
+        counter = Counter()
+        x = Promise.insert(1).then(counter.long_id)
+        y = x.map(common_tests.add(1))
+        z = x.map(common_tests.mul(10))
+        self.assertEqual(_run(Promise.apply(common_tests.add).to_arguments(y, z)), 12)
+        self.assertEqual(_run(x), 1)
+        self.assertEqual(counter.calls, 1)
+
+    def test_same_argument_twice_runs_once(self):
+        counter = Counter()
+        x = Promise.insert(2).then(counter.long_id)
+        self.assertEqual(_run(Promise.apply(common_tests.mul).to_arguments(x, x)), 4)
+        self.assertEqual(counter.calls, 1)
+
+    def test_concurrent_awaits_share_one_run(self):
+        counter = Counter()
+        x = Promise.insert(3).then(counter.long_id)
+        async def both():
+            return await asyncio.gather(x, x.map(common_tests.add(1)))
+        self.assertEqual(_run(both()), [3, 4])
+        self.assertEqual(counter.calls, 1)
+
+    def test_exceptions_are_cached(self):
+        calls = []
+        def fail(resolve, reject):
+            calls.append(1)
+            reject(IndexError())
+        x = Promise(fail)
+        for _ in range(2):
+            with self.assertRaises(IndexError):
+                _run(x)
+        self.assertEqual(len(calls), 1)
+
+    def test_opting_out_runs_every_time(self):
+        calls = []
+        def count(resolve, reject):
+            calls.append(1)
+            return resolve(len(calls))
+        x = Promise(count, memoize=False).map(common_tests.add(10))
+        self.assertEqual(_run(Promise.apply(common_tests.add).to_arguments(x, x)), 23)
+        self.assertEqual(len(calls), 2)
+
+    def test_cancelled_run_starts_over(self):
+        counter = Counter()
+        x = Promise.insert(5).then(counter.long_id)
+        async def cancel_first_run():
+            task = asyncio.ensure_future(x)
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return await x
+        self.assertEqual(_run(cancel_first_run()), 5)
+        self.assertEqual(counter.calls, 2)
+
+    def test_cancelled_waiter_does_not_cancel_the_run(self):
+        counter = Counter()
+        x = Promise.insert(6).then(counter.long_id)
+        async def cancel_second_waiter():
+            first = asyncio.ensure_future(x)
+            second = asyncio.ensure_future(x)
+            await asyncio.sleep(0)
+            second.cancel()
+            return await first
+        self.assertEqual(_run(cancel_second_waiter()), 6)
+        self.assertEqual(counter.calls, 1)
+
+class PromiseConcurrentApplyTests(unittest.TestCase):
+    @staticmethod
+    def sleeping(value, events):
+        async def _sleep(x):
+            events.append(('start', x))
+            await asyncio.sleep(0.01)
+            events.append(('end', x))
+            return x
+        return Promise.insert(value).then(_sleep)
+
+    def test_arguments_run_concurrently(self):
+        events = []
+        arguments = [self.sleeping(value, events) for value in range(3)]
+        add3 = pymonad.tools.curry(3, lambda x, y, z: x + y + z)
+        self.assertEqual(_run(Promise.apply(add3).to_arguments(*arguments)), 3)
+        self.assertEqual([event for event, _ in events], ['start'] * 3 + ['end'] * 3)
+
+    def test_amap_runs_function_and_value_concurrently(self):
+        events = []
+        function = self.sleeping(common_tests.add(1), events)
+        self.assertEqual(_run(function.amap(self.sleeping(1, events))), 2)
+        self.assertEqual([event for event, _ in events], ['start', 'start', 'end', 'end'])
+
+    def test_failing_argument_cancels_the_others(self):
+        events = []
+        async def slow_id(x):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                events.append('cancelled')
+                raise
+            return x
+        slow = Promise.insert(1).then(slow_id)
+        fail = Promise(lambda resolve, reject: reject(IndexError()))
+        with self.assertRaises(IndexError):
+            _run(Promise.apply(common_tests.add).to_arguments(slow, fail))
+        _run(asyncio.sleep(0.01))
+        self.assertEqual(events, ['cancelled'])
+
+async def _sleep_then(delay, value):
+    await asyncio.sleep(delay)
+    return value
+
+async def _sleep_then_fail(delay, error):
+    await asyncio.sleep(delay)
+    raise error
+
+def _delayed(delay, value):
+    return Promise.insert(None).then(lambda _: _sleep_then(delay, value))
+
+def _delayed_failure(delay, error):
+    return Promise.insert(None).then(lambda _: _sleep_then_fail(delay, error))
+
+class PromiseCombinatorTests(unittest.TestCase):
+    def test_all_keeps_order(self):
+        promises = [_delayed(0.01 * (3 - i), i) for i in range(3)]
+        self.assertEqual(_run(Promise.all(promises)), [0, 1, 2])
+
+    def test_all_with_thousands_of_promises(self):
+        promises = (_delayed(0.01, i) for i in range(5000))
+        self.assertEqual(_run(Promise.all(promises)), list(range(5000)))
+
+    def test_all_of_nothing(self):
+        self.assertEqual(_run(Promise.all([])), [])
+
+    def test_all_fails_with_first_error(self):
+        with self.assertRaises(IndexError):
+            _run(Promise.all([_delayed(0.01, 1), _delayed_failure(0, IndexError())]))
+
+    def test_race_settles_with_first_result(self):
+        self.assertEqual(_run(Promise.race([_delayed(0.05, 'slow'), _delayed(0, 'fast')])), 'fast')
+
+    def test_race_settles_with_first_error(self):
+        with self.assertRaises(IndexError):
+            _run(Promise.race([_delayed(0.05, 'slow'), _delayed_failure(0, IndexError())]))
+
+    def test_race_cancels_losers(self):
+        finished = []
+        slow = _delayed(0.05, 'slow').map(finished.append)
+        _run(Promise.race([slow, _delayed(0, 'fast')]))
+        _run(asyncio.sleep(0.1))
+        self.assertEqual(finished, [])
+
+    def test_race_and_any_need_promises(self):
+        with self.assertRaises(ValueError):
+            Promise.race([])
+        with self.assertRaises(ValueError):
+            Promise.any([])
+
+    def test_any_skips_failures(self):
+        promises = [_delayed_failure(0, IndexError()), _delayed(0.02, 'slow'), _delayed(0.01, 'fast')]
+        self.assertEqual(_run(Promise.any(promises)), 'fast')
+
+    def test_any_with_thousands_of_promises(self):
+        promises = [_delayed_failure(0, IndexError()) for _ in range(3000)] + [_delayed(0.01, 'ok')]
+        self.assertEqual(_run(Promise.any(promises)), 'ok')
+
+    def test_any_fails_when_every_promise_fails(self):
+        errors = [IndexError(), KeyError()]
+        with self.assertRaises(ExceptionGroup) as context:
+            _run(Promise.any([_delayed_failure(0.02, errors[0]), _delayed_failure(0, errors[1])]))
+        self.assertEqual(list(context.exception.exceptions), errors)
+
+    def test_any_leaves_cancelled_promises_out_of_the_group(self):
+        error = IndexError()
+        cancelled = _delayed_failure(0, asyncio.CancelledError())
+        group = _run(Promise.any([cancelled, _delayed_failure(0.01, error)]).catch(lambda group: group))
+        self.assertIsInstance(group, ExceptionGroup)
+        self.assertEqual(list(group.exceptions), [error])
+
+    def test_any_is_cancelled_when_every_promise_is_cancelled(self):
+        cancelled = [_delayed_failure(0, asyncio.CancelledError()) for _ in range(2)]
+        with self.assertRaises(asyncio.CancelledError):
+            _run(Promise.any(cancelled))
+
+    def test_all_settled(self):
+        error = IndexError()
+        results = _run(Promise.all_settled([_delayed(0.01, 1), _delayed_failure(0, error)]))
+        self.assertEqual(results, [Right(1), Left(error)])
+
+    def test_all_settled_with_thousands_of_promises(self):
+        promises = [_delayed(0.01, i) if i % 2 else _delayed_failure(0.01, IndexError(i))
+                    for i in range(4000)]
+        results = _run(Promise.all_settled(promises))
+        self.assertEqual(len(results), 4000)
+        self.assertTrue(all(result.is_right() == bool(i % 2) for i, result in enumerate(results)))
+
+class Throttled:
+    def __init__(self):
+        self.running = 0
+        self.most_running = 0
+        self.consumed = 0
+
+    def values(self, count):
+        for value in range(count):
+            self.consumed += 1
+            yield value
+
+    async def slow_dbl(self, x):
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        await asyncio.sleep(0.001 * (x % 3))
+        self.running -= 1
+        return 2 * x
+
+class PromiseMapConcurrentTests(unittest.TestCase):
+    def test_results_are_in_order(self):
+        throttled = Throttled()
+        result = _run(Promise.map_concurrent(throttled.values(50), throttled.slow_dbl, limit=5))
+        self.assertEqual(result, [2 * x for x in range(50)])
+        self.assertEqual(throttled.most_running, 5)
+
+    def test_unordered(self):
+        throttled = Throttled()
+        result = _run(Promise.map_concurrent(
+            throttled.values(50), throttled.slow_dbl, limit=5, ordered=False
+        ))
+        self.assertEqual(sorted(result), [2 * x for x in range(50)])
+        self.assertEqual(throttled.most_running, 5)
+
+    def test_kleisli_functions_returning_promises(self):
+        result = _run(Promise.map_concurrent(range(10), lambda x: Promise.insert(x).map(common_tests.add(1)), limit=3))
+        self.assertEqual(result, list(range(1, 11)))
+
+    def test_input_is_consumed_lazily(self):
+        throttled = Throttled()
+        async def take_three():
+            results = []
+            async for result in Promise.imap_concurrent(throttled.values(10**6), throttled.slow_dbl, limit=4):
+                results.append(result)
+                if len(results) == 3:
+                    return results
+        self.assertEqual(_run(take_three()), [0, 2, 4])
+        self.assertLessEqual(throttled.consumed, 3 + 4)
+
+    def test_async_iterable_input(self):
+        async def values():
+            for value in range(5):
+                await asyncio.sleep(0)
+                yield value
+        async def collect():
+            return [x async for x in Promise.imap_concurrent(values(), lambda x: x * 3, limit=2)]
+        self.assertEqual(_run(collect()), [0, 3, 6, 9, 12])
+
+    def test_errors_fail_the_whole_map(self):
+        def fail_on_3(x):
+            return Promise(lambda resolve, reject: reject(IndexError()) if x == 3 else resolve(x))
+        with self.assertRaises(IndexError):
+            _run(Promise.map_concurrent(range(10), fail_on_3, limit=2))
+
+    def test_catch_handles_errors_per_item(self):
+        def fail_on_3(x):
+            return (Promise(lambda resolve, reject: reject(IndexError()) if x == 3 else resolve(x))
+                    .catch(lambda error: -1))
+        self.assertEqual(
+            _run(Promise.map_concurrent(range(5), fail_on_3, limit=2)), [0, 1, 2, -1, 4]
+        )
+
+    def test_limit_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            Promise.map_concurrent(range(5), inc, limit=0)
+
+class PromiseExecutorTests(unittest.TestCase):
+    def test_then_in_thread_keeps_the_loop_responsive(self):
+        ticks = []
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.005)
+        def blocking_inc(x):
+            time.sleep(0.05)
+            return (x + 1, threading.get_ident(), len(ticks))
+        async def both():
+            return await asyncio.gather(Promise.insert(1).then_in_thread(blocking_inc), ticker())
+        (value, thread, ticks_while_blocked), _ = _run(both())
+        self.assertEqual(value, 2)
+        self.assertNotEqual(thread, threading.get_ident())
+        self.assertGreater(ticks_while_blocked, 1)
+
+    def test_then_in_thread_with_kleisli_function(self):
+        self.assertEqual(_run(Promise.insert(1).then_in_thread(inc)), 2)
+
+    def test_then_in_executor(self):
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            self.assertEqual(
+                _run(Promise.insert(3).then_in_executor(common_tests.mul(2), executor)), 6
+            )
+
+    def test_then_in_process(self):
+        self.assertEqual(_run(Promise.insert(10).then_in_process(math.factorial)), 3628800)
+
+    def test_errors_propagate(self):
+        with self.assertRaises(ZeroDivisionError):
+            _run(Promise.insert(0).then_in_thread(lambda x: 1 / x))
+
+    def test_from_executor(self):
+        self.assertEqual(_run(Promise.from_executor(sum, [1, 2, 3]).map(common_tests.add(1))), 7)
+
+class PromiseChainTests(unittest.TestCase):
+    def test_long_chains_do_not_exceed_the_recursion_limit(self):
+        promise = Promise(lambda resolve, reject: resolve(0))
+        for _ in range(3 * sys.getrecursionlimit()):
+            promise = promise.map(common_tests.add(1)).then(lambda x: x - 1).bind(inc)
+        self.assertEqual(_run(promise), 3 * sys.getrecursionlimit())
+
+    def test_catch_in_a_long_chain(self):
+        promise = Promise(lambda resolve, reject: resolve(1)).then(lambda x: x / 0)
+        for _ in range(2 * sys.getrecursionlimit()):
+            promise = promise.map(common_tests.add(1))
+        promise = promise.catch(lambda error: type(error).__name__).map(lambda name: name + '!')
+        self.assertEqual(_run(promise), 'ZeroDivisionError!')
+
+    def test_errors_raised_by_catch_propagate(self):
+        def fail(error):
+            raise KeyError()
+        promise = Promise(lambda resolve, reject: reject(IndexError())).catch(fail).catch(type)
+        self.assertIs(_run(promise), KeyError)
+
+    def test_extending_a_settled_promise_does_not_rerun_it(self):
+        counter = Counter()
+        x = Promise.insert(1).then(counter.long_id)
+        self.assertEqual(_run(x), 1)
+        self.assertEqual(_run(x.map(common_tests.add(1))), 2)
+        self.assertEqual(counter.calls, 1)
+
+    def test_unmemoized_chains_run_every_step_again(self):
+        calls = []
+        x = Promise(lambda resolve, reject: resolve(1), memoize=False).map(calls.append)
+        _run(x)
+        _run(x)
+        self.assertEqual(len(calls), 2)
+
+class PromiseResolvedTests(unittest.TestCase):
+    def test_steps_on_resolved_promises_run_straight_away(self):
+        calls = []
+        def record(x):
+            calls.append(x)
+            return x + 1
+        promise = Promise.insert(1).map(record).then(record).bind(lambda x: Promise.insert(record(x)))
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertEqual(promise.run_sync(), 4)
+        self.assertEqual(_run(promise), 4)
+
+    def test_errors_in_resolved_steps_are_raised_when_awaited(self):
+        promise = Promise.insert(0).map(lambda x: 1 / x)
+        with self.assertRaises(ZeroDivisionError):
+            _run(promise)
+        self.assertEqual(promise.map(common_tests.add(1)).catch(lambda error: 'caught').run_sync(), 'caught')
+
+    def test_coroutine_functions_still_wait(self):
+        async def slow_inc(x):
+            await asyncio.sleep(0)
+            return x + 1
+        promise = Promise.insert(1).then(slow_inc)
+        with self.assertRaises(RuntimeError):
+            promise.run_sync()
+        self.assertEqual(_run(promise), 2)
+
+    def test_run_sync_leaves_steps_needing_an_event_loop_pending(self):
+        async def sleepy_inc(x):
+            await asyncio.sleep(0.001)
+            return x + 1
+        promise = Promise.insert(1).then(sleepy_inc)
+        caught = promise.catch(lambda error: 'caught')
+        for run_sync in (promise.run_sync, caught.run_sync):
+            with self.assertRaises(RuntimeError):
+                run_sync()
+        self.assertEqual(_run(promise), 2)
+        self.assertEqual(_run(caught), 2)
+
+    def test_normal_functions_returning_coroutines_are_called_once(self):
+        calls = []
+        async def _inc(x):
+            return x + 1
+        def record_then_inc(x):
+            calls.append(x)
+            return _inc(x)
+        for step in ('map', 'then'):
+            with self.subTest(step=step):
+                calls.clear()
+                promise = getattr(Promise.insert(1), step)(record_then_inc)
+                self.assertEqual(_run(promise), 2)
+                self.assertEqual(calls, [1])
+
+    def test_bind_to_a_value_fails_as_it_does_on_pending_promises(self):
+        settled = Promise.insert(1)
+        pending = Promise(lambda resolve, reject: resolve(1))
+        for name, promise in (('settled', settled), ('pending', pending)):
+            with self.subTest(promise=name):
+                with self.assertRaises(TypeError):
+                    _run(promise.bind(common_tests.add(1)))
+
+    def test_apply_to_resolved_arguments(self):
+        promise = Promise.apply(common_tests.add).to_arguments(Promise.insert(1), Promise.insert(2))
+        self.assertEqual(promise.run_sync(), 3)
+
+    def test_run_sync_without_an_event_loop(self):
+        promise = Promise(lambda resolve, reject: resolve(2)).map(common_tests.mul(10))
+        self.assertEqual(promise.run_sync(), 20)
+
+    def test_run_sync_raises_errors(self):
+        with self.assertRaises(IndexError):
+            Promise(lambda resolve, reject: reject(IndexError())).run_sync()
+
+class PromiseTimeoutTests(unittest.TestCase):
+    @staticmethod
+    def cancellable(delay, value, events):
+        async def _sleep(x):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                events.append(('cancelled', x))
+                raise
+            return x
+        return Promise.insert(value).then(_sleep)
+
+    def test_fast_promises_resolve(self):
+        self.assertEqual(_run(Promise.insert(1).then(lambda x: _sleep_then(0.01, x)).timeout(1)), 1)
+
+    def test_slow_promises_time_out(self):
+        events = []
+        with self.assertRaises(asyncio.TimeoutError):
+            _run(self.cancellable(1, 1, events).timeout(0.01))
+        self.assertEqual(events, [('cancelled', 1)])
+
+    def test_timeouts_can_be_caught(self):
+        promise = self.cancellable(1, 1, []).timeout(0.01).catch(lambda error: type(error))
+        self.assertIs(_run(promise), asyncio.TimeoutError)
+
+    def test_every_upstream_task_has_stopped(self):
+        events = []
+        arguments = [self.cancellable(1, value, events) for value in range(3)]
+        add3 = pymonad.tools.curry(3, lambda x, y, z: x + y + z)
+        with self.assertRaises(asyncio.TimeoutError):
+            _run(Promise.apply(add3).to_arguments(*arguments).timeout(0.01))
+        self.assertEqual(sorted(events), [('cancelled', value) for value in range(3)])
+
+    def test_async_func_arguments_are_cancelled(self):
+        events = []
+        add = async_func(lambda x, y: x + y)
+        with self.assertRaises(asyncio.TimeoutError):
+            _run(add(self.cancellable(1, 1, events), y=self.cancellable(1, 2, events)).timeout(0.01))
+        self.assertEqual(sorted(events), [('cancelled', 1), ('cancelled', 2)])
+
+    def test_deadline_propagates_through_steps(self):
+        remaining = []
+        def inner(x):
+            remaining.append(remaining_time())
+            return Promise.insert(x).then(lambda y: _sleep_then(1, y)).timeout(10)
+        promise = Promise(lambda resolve, reject: resolve(1)).then(inner).timeout(0.05)
+        start = time.perf_counter()
+        with self.assertRaises(asyncio.TimeoutError):
+            _run(promise)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertLessEqual(remaining[0], 0.05)
+
+    def test_no_deadline_outside_timeouts(self):
+        async def check():
+            return remaining_time()
+        self.assertIsNone(_run(check()))
+
+    def test_timed_out_promises_start_over(self):
+        counter = Counter()
+        x = Promise.insert(1).then(counter.long_id)
+        with self.assertRaises(asyncio.TimeoutError):
+            _run(x.timeout(0))
+        self.assertEqual(_run(x), 1)
+
+class CachedAsyncFuncTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def counted(self, **options):
+        @cached_async_func(**options)
+        async def slow_double(x):
+            self.calls.append(x)
+            await asyncio.sleep(0.01)
+            return 2 * x
+        return slow_double
+
+    def test_concurrent_calls_are_shared(self):
+        double = self.counted(maxsize=0)
+        self.assertEqual(_run(Promise.all([double(1), double(1), double(2)])), [2, 2, 4])
+        self.assertEqual(sorted(self.calls), [1, 2])
+        self.assertEqual(double.cache_info(), (0, 2, 1, 0, 0))
+
+    def test_results_are_cached(self):
+        double = self.counted()
+        self.assertEqual(_run(double(1)), 2)
+        self.assertEqual(_run(double(x=1)), 2)
+        self.assertEqual(_run(double(1)), 2)
+        self.assertEqual(self.calls, [1, 1])
+        info = double.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_promise_arguments_are_compared_by_result(self):
+        double = self.counted()
+        _run(double(1))
+        self.assertEqual(_run(double(Promise.insert(0).then(inc))), 2)
+        self.assertEqual(self.calls, [1])
+
+    def test_results_expire(self):
+        double = self.counted(ttl=0.01)
+        _run(double(1))
+        _run(asyncio.sleep(0.02))
+        _run(double(1))
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_expired_results_are_dropped_without_maxsize(self):
+        double = cached_async_func(lambda x: 2 * x, maxsize=None, ttl=0.05)
+        _run(Promise.all([double(x) for x in range(1000)]))
+        self.assertGreater(double.cache_info().currsize, 1)
+        _run(asyncio.sleep(0.1))
+        _run(double(-1))
+        self.assertEqual(double.cache_info().currsize, 1)
+
+    def test_results_expire_even_when_recently_used(self):
+        double = cached_async_func(lambda x: 2 * x, maxsize=None, ttl=0.2)
+        _run(double(1))
+        _run(asyncio.sleep(0.12))
+        _run(double(2))
+        _run(double(1))
+        _run(asyncio.sleep(0.12))
+        _run(double(3))
+        self.assertEqual(double.cache_info().currsize, 2)
+
+    def test_least_recently_used_results_are_evicted(self):
+        double = self.counted(maxsize=2)
+        for x in (1, 2, 1, 3, 1, 2):
+            _run(double(x))
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+        self.assertEqual(double.cache_info().currsize, 2)
+
+    def test_errors_are_not_cached(self):
+        calls = []
+        @cached_async_func
+        def invert(x):
+            calls.append(x)
+            return 1 / x
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                _run(invert(0))
+        self.assertEqual(len(calls), 2)
+
+    def test_unhashable_arguments_are_not_cached(self):
+        total = cached_async_func(sum)
+        self.assertEqual(_run(total([1, 2])), 3)
+        self.assertEqual(_run(total([1, 2])), 3)
+        self.assertEqual(total.cache_info().currsize, 0)
+
+    def test_cache_clear(self):
+        double = self.counted()
+        _run(double(1))
+        double.cache_clear()
+        _run(double(1))
+        self.assertEqual(self.calls, [1, 1])
+        self.assertEqual(double.cache_info().misses, 1)
+
+    def test_cancelled_calls_are_taken_over(self):
+        double = self.counted()
+        async def cancel_first():
+            first = asyncio.ensure_future(double(3))
+            second = asyncio.ensure_future(double(3))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            return await second
+        self.assertEqual(_run(cancel_first()), 6)
+        self.assertEqual(self.calls, [3, 3])
+        self.assertEqual(double.cache_info()[:3], (0, 2, 0))
+
+class AsyncBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+
+    def doubles(self, **options):
+        @async_batch(**options)
+        async def double(keys):
+            self.batches.append(keys)
+            await asyncio.sleep(0)
+            return [2 * key for key in keys]
+        return double
+
+    def test_calls_in_the_same_tick_are_batched(self):
+        double = self.doubles()
+        self.assertEqual(_run(Promise.all(double(key) for key in range(3))), [0, 2, 4])
+        self.assertEqual(self.batches, [[0, 1, 2]])
+
+    def test_max_batch(self):
+        double = self.doubles(max_batch=2)
+        self.assertEqual(_run(Promise.all(double(key) for key in range(5))), [0, 2, 4, 6, 8])
+        self.assertEqual(self.batches, [[0, 1], [2, 3], [4]])
+
+    def test_max_delay(self):
+        double = self.doubles(max_delay=0.05)
+        async def spread_out():
+            first = asyncio.ensure_future(double(1))
+            await asyncio.sleep(0.01)
+            return await asyncio.gather(first, double(2))
+        self.assertEqual(_run(spread_out()), [2, 4])
+        self.assertEqual(self.batches, [[1, 2]])
+
+    def test_mapping_results(self):
+        @async_batch()
+        def lookup(keys):
+            return {key: key.upper() for key in keys if key != 'missing'}
+        self.assertEqual(_run(Promise.all([lookup('a'), lookup('b')])), ['A', 'B'])
+        results = _run(Promise.all_settled([lookup('a'), lookup('missing')]))
+        self.assertEqual(results[0], Right('A'))
+        self.assertIsInstance(results[1].either(pymonad.tools.identity, None), KeyError)
+
+    def test_errors_fail_every_caller(self):
+        @async_batch()
+        def fail(keys):
+            raise IndexError()
+        results = _run(Promise.all_settled([fail(1), fail(2)]))
+        self.assertTrue(all(result.is_left() for result in results))
+
+    def test_wrong_number_of_results(self):
+        @async_batch()
+        def too_few(keys):
+            return keys[1:]
+        with self.assertRaises(ValueError):
+            _run(Promise.all([too_few(1), too_few(2)]))
+
+    def test_promise_keys_are_awaited(self):
+        double = self.doubles()
+        self.assertEqual(_run(double(Promise.insert(1).then(inc))), 4)
+        self.assertEqual(self.batches, [[2]])
+
+    def test_cancelled_callers_are_left_out(self):
+        double = self.doubles(max_delay=0.01)
+        async def cancel_one():
+            cancelled = asyncio.ensure_future(double(1))
+            kept = asyncio.ensure_future(double(2))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await kept
+        self.assertEqual(_run(cancel_one()), 4)
+        self.assertEqual(self.batches, [[2]])
+
+    def test_max_batch_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            async_batch(max_batch=0)
+
+class AsyncFuncArgumentTests(unittest.TestCase):
+    def test_plain_arguments_need_no_event_loop(self):
+        self.assertEqual(async_my_func(1, y=2, z=5).run_sync(), 1)
+
+    def test_resolved_promises_need_no_event_loop(self):
+        self.assertEqual(async_my_func(Promise.insert(1), z=Promise.insert(5)).run_sync(), 0.6)
+
+    def test_keyword_promises_keep_their_names(self):
+        promise = async_my_func(
+            Promise.insert(1).then(inc), y=Promise.insert(2).then(inc), z=Promise.insert(4).then(inc)
+        )
+        self.assertEqual(_run(promise), my_func(2, y=3, z=5))
+
+    def test_errors_in_arguments_propagate(self):
+        with self.assertRaises(IndexError):
+            _run(async_my_func(1, y=Promise(lambda resolve, reject: reject(IndexError()))))
+
+class Flaky:
+    def __init__(self, failures, error=ConnectionError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error()
+        return x + 1
+
+class PromiseRetryTests(unittest.TestCase):
+    def setUp(self):
+        self.delays = []
+        async def record_delay(delay):
+            self.delays.append(delay)
+        patcher = unittest.mock.patch('asyncio.sleep', record_delay)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_only_the_failing_step_runs_again(self):
+        counter, flaky = Counter(), Flaky(2)
+        promise = Promise.insert(1).then(counter.long_id).map(flaky).map(common_tests.add(10))
+        self.assertEqual(_run(promise.retry(3, jitter=0)), 12)
+        self.assertEqual((counter.calls, flaky.calls), (1, 3))
+
+    def test_steps_on_resolved_promises_run_again(self):
+        flaky = Flaky(1)
+        self.assertEqual(_run(Promise.insert(1).map(flaky).retry(2)), 2)
+        self.assertEqual(flaky.calls, 2)
+
+    def test_failing_arguments_run_again(self):
+        counter, flaky = Counter(), Flaky(1)
+        promise = Promise.apply(common_tests.add).to_arguments(
+            Promise.insert(1).then(counter.long_id), Promise.insert(1).then(counter.long_id).map(flaky)
+        )
+        self.assertEqual(_run(promise.retry(2)), 3)
+        self.assertEqual((counter.calls, flaky.calls), (2, 2))
+
+    def test_other_promises_awaited_by_steps_are_not_run_again(self):
+        flaky = Flaky(1)
+        other = Promise.insert(1).map(flaky)
+        promise = Promise(lambda resolve, reject: resolve(1)).then(lambda _: other).retry(2)
+        with self.assertRaises(ConnectionError):
+            _run(promise)
+        self.assertEqual(flaky.calls, 1)
+
+    def test_failed_promises_let_go_of_their_steps(self):
+        promise = Promise.insert(1).map(Flaky(1)).map(common_tests.add(1))
+        with self.assertRaises(ConnectionError):
+            _run(promise)
+        self.assertIsNone(promise._parent)
+        self.assertIsNone(promise._step)
+
+    def test_gives_up_after_the_last_attempt(self):
+        flaky = Flaky(5)
+        with self.assertRaises(ConnectionError):
+            _run(Promise(lambda resolve, reject: resolve(1)).map(flaky).retry(3))
+        self.assertEqual(flaky.calls, 3)
+
+    def test_other_errors_are_not_retried(self):
+        flaky = Flaky(1, error=KeyError)
+        with self.assertRaises(KeyError):
+            _run(Promise.insert(1).map(flaky).retry(3, retry_on=ConnectionError))
+        self.assertEqual(flaky.calls, 1)
+
+    def test_exponential_backoff(self):
+        _run(Promise.insert(1).map(Flaky(3)).retry(4, backoff=0.5, jitter=0))
+        self.assertEqual(self.delays, [0.5, 1.0, 2.0])
+
+    def test_jitter(self):
+        _run(Promise.insert(1).map(Flaky(3)).retry(4, backoff=1, jitter=0.5))
+        for delay, full_delay in zip(self.delays, [1, 2, 4]):
+            self.assertTrue(full_delay / 2 <= delay <= full_delay)
+
+    def test_no_retry_past_a_deadline(self):
+        flaky = Flaky(1)
+        with self.assertRaises(ConnectionError):
+            _run(Promise.insert(1).map(flaky).retry(2, backoff=10).timeout(1))
+        self.assertEqual(flaky.calls, 1)
+
+    def test_attempts_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            Promise.insert(1).retry(0)
@@ -2,6 +2,7 @@
 # (c) Copyright 2014, 2020 by Jason DeLaat.
 # Licensed under BSD 3-clause licence.
 # --------------------------------------------------------
+import sys
 import unittest
 
 import common_tests
@@ -21,6 +22,16 @@ class ReaderTests(unittest.TestCase):
             EqReader(lambda r: 1, None)
         )
 
+    def test_bind_passes_read_only_input_to_result(self):
+        reader = EqReader(lambda r: r + 1, None).bind(lambda x: EqReader(lambda r: (x, r), None))
+        self.assertEqual(reader(1), (2, 1))
+
+    def test_long_chains_do_not_overflow_the_stack(self):
+        reader = EqReader(lambda r: r, None)
+        for _ in range(10 * sys.getrecursionlimit()):
+            reader = reader.then(lambda x: EqReader(lambda r: x + r, None))
+        self.assertEqual(reader(1), 10 * sys.getrecursionlimit() + 1)
+
 class ComposeTests(unittest.TestCase):
     def test_insert_disabled(self):
         with self.assertRaises(AttributeError):
@@ -39,6 +50,19 @@ class ComposeTests(unittest.TestCase):
                      .then(dec))
         self.assertEqual(inc_twice(0), 2)
 
+    def test_long_composition(self):
+        inc = lambda x: x + 1
+        composed = Compose(inc)
+        for _ in range(10 * sys.getrecursionlimit()):
+            composed = composed.then(inc)
+        self.assertEqual(composed(0), 10 * sys.getrecursionlimit() + 1)
+
+    def test_compositions_can_be_shared(self):
+        inc_twice = Compose(lambda x: x + 1).then(lambda x: x + 1)
+        self.assertEqual(inc_twice.then(lambda x: x * 10)(0), 20)
+        self.assertEqual(inc_twice.then(lambda x: x - 10)(0), -8)
+        self.assertEqual(inc_twice(0), 2)
+
 class PipeTests(unittest.TestCase):
     def test_insert_disabled(self):
         with self.assertRaises(AttributeError):
@@ -2,6 +2,7 @@
 # (c) Copyright 2014, 2020 by Jason DeLaat.
 # Licensed under BSD 3-clause licence.
 # --------------------------------------------------------
+import sys
 import unittest
 
 import common_tests
@@ -22,6 +23,32 @@ class StateTests(unittest.TestCase):
             (2, 0)
         )
 
+    def test_long_chains_do_not_overflow_the_stack(self):
+        computation = State.insert(0)
+        for _ in range(10 * sys.getrecursionlimit()):
+            computation = computation.then(lambda x: State(lambda s: (x + 1, s + 2)))
+        self.assertEqual(computation.run(0), (10 * sys.getrecursionlimit(), 20 * sys.getrecursionlimit()))
+
+    def test_recursive_kleisli_functions_do_not_overflow_the_stack(self):
+        def count_down(n):
+            if n == 0:
+                return State.insert('done')
+            return State(lambda s: (n - 1, s + 1)).bind(count_down)
+        self.assertEqual(count_down(10 * sys.getrecursionlimit()).run(0), ('done', 10 * sys.getrecursionlimit()))
+
+    def test_chains_can_be_shared(self):
+        base = State(lambda s: (s, s + 1)).map(lambda x: x * 10)
+        self.assertEqual(base.map(lambda x: x + 1).run(1), (11, 2))
+        self.assertEqual(base.then(lambda x: State.insert(x - 1)).run(1), (9, 2))
+        self.assertEqual(base.run(1), (10, 2))
+
+class StateThenErrors(unittest.TestCase):
+    def test_errors_raised_by_kleisli_results_are_not_hidden(self):
+        def fail(_):
+            raise TypeError('raised by user code')
+        with self.assertRaises(TypeError):
+            State.insert(1).then(lambda x: State(fail)).run(0)
+
 class StateFunctor(common_tests.FunctorTests, unittest.TestCase):
     def setUp(self):
         self._class = EqState
@@ -0,0 +1,178 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+import unittest
+import asyncio
+
+import common_tests
+import pymonad.tools
+from pymonad.promise import Promise
+from pymonad.stream import AsyncStream, _AsyncStream
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+def _list(stream):
+    return _run(stream.to_list())
+
+async def _slowly(items, delay):
+    for item in items:
+        await asyncio.sleep(delay)
+        yield item
+
+def inc(value):
+    return AsyncStream([value + 1])
+
+def dec(value):
+    return AsyncStream([value - 1])
+
+def dbl(value):
+    return AsyncStream([2 * value, 2 * value])
+
+k_compose = pymonad.tools.kleisli_compose
+
+class AsyncStreamFunctorTests(unittest.TestCase):
+    def setUp(self):
+        self._class = _AsyncStream
+
+    def test_identity(self):
+        self.assertEqual(_list(self._class.insert(1).map(common_tests.id)), _list(self._class.insert(1)))
+
+    def test_composition(self):
+        self.assertEqual(
+            _list(AsyncStream([1, 2]).map(lambda x: common_tests.sub(2, common_tests.add(1, x)))),
+            _list(AsyncStream([1, 2]).map(common_tests.add(1)).map(common_tests.sub(2)))
+        )
+
+class AsyncStreamApplicativeTests(unittest.TestCase):
+    def test_application_is_same_as_mapping(self):
+        f = common_tests.add(1)
+        self.assertEqual(
+            _list(AsyncStream.apply(f).to_arguments(AsyncStream([1, 2]))),
+            _list(AsyncStream([1, 2]).map(f))
+        )
+
+    def test_every_function_is_applied_to_every_value(self):
+        self.assertEqual(
+            _list(AsyncStream.apply(common_tests.add).to_arguments(AsyncStream([10, 20]), AsyncStream([1, 2]))),
+            [11, 12, 21, 22]
+        )
+
+class AsyncStreamMonadTests(unittest.TestCase):
+    def setUp(self):
+        self._class = _AsyncStream
+
+    def test_left_identity(self):
+        self.assertEqual(_list(k_compose(self._class.insert, inc)(0)), _list(inc(0)))
+
+    def test_right_identity(self):
+        self.assertEqual(_list(k_compose(inc, self._class.insert)(0)), _list(inc(0)))
+
+    def test_associativity(self):
+        self.assertEqual(
+            _list(k_compose(k_compose(dbl, inc), dec)(1)),
+            _list(k_compose(dbl, k_compose(inc, dec))(1))
+        )
+
+class AsyncStreamTests(unittest.TestCase):
+    def test_async_iterable_source(self):
+        self.assertEqual(_list(AsyncStream(_slowly(range(3), 0)).map(common_tests.add(1))), [1, 2, 3])
+
+    def test_coroutine_functions_are_awaited(self):
+        async def slow_inc(x):
+            await asyncio.sleep(0)
+            return x + 1
+        self.assertEqual(_list(AsyncStream(range(3)).map(slow_inc)), [1, 2, 3])
+
+    def test_bind_flattens(self):
+        self.assertEqual(_list(AsyncStream([1, 2]).bind(lambda x: AsyncStream(range(x)))), [0, 0, 1])
+
+    def test_then(self):
+        stream = AsyncStream([1, 2]).then(lambda x: AsyncStream([x, x]) if x == 1 else x * 10)
+        self.assertEqual(_list(stream), [1, 1, 20])
+
+    def test_catch_ends_the_stream(self):
+        stream = AsyncStream([1, 0, 2]).map(lambda x: 1 / x).catch(lambda error: type(error).__name__)
+        self.assertEqual(_list(stream), [1.0, 'ZeroDivisionError'])
+
+    def test_errors_propagate(self):
+        with self.assertRaises(ZeroDivisionError):
+            _list(AsyncStream([0]).map(lambda x: 1 / x))
+
+    def test_chunks(self):
+        self.assertEqual(_list(AsyncStream(range(5)).chunks(2)), [[0, 1], [2, 3], [4]])
+
+    def test_chunks_with_max_delay(self):
+        async def source():
+            yield 1
+            yield 2
+            await asyncio.sleep(0.05)
+            yield 3
+        self.assertEqual(_list(AsyncStream(source()).chunks(10, max_delay=0.01)), [[1, 2], [3]])
+
+    def test_sizes_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            AsyncStream([]).chunks(0)
+        with self.assertRaises(ValueError):
+            AsyncStream([]).buffer(0)
+
+    def test_map_concurrent(self):
+        running = []
+        peak = []
+        async def slow_double(x):
+            running.append(x)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(x)
+            return 2 * x
+        self.assertEqual(_list(AsyncStream(range(6)).map_concurrent(slow_double, limit=2)), [0, 2, 4, 6, 8, 10])
+        self.assertEqual(max(peak), 2)
+
+    def test_map_concurrent_with_promises(self):
+        stream = AsyncStream(range(3)).map_concurrent(lambda x: Promise.insert(x).map(common_tests.add(1)), limit=3)
+        self.assertEqual(_list(stream), [1, 2, 3])
+
+class AsyncStreamBufferTests(unittest.TestCase):
+    def test_producer_runs_at_most_size_items_ahead(self):
+        produced = []
+        def source():
+            for item in range(100):
+                produced.append(item)
+                yield item
+        async def consume_slowly():
+            consumed = []
+            async for item in AsyncStream(source()).buffer(3):
+                await asyncio.sleep(0)
+                consumed.append(item)
+                self.assertLessEqual(len(produced) - len(consumed), 4)
+            return consumed
+        self.assertEqual(_run(consume_slowly()), list(range(100)))
+
+    def test_errors_reach_the_consumer(self):
+        with self.assertRaises(ZeroDivisionError):
+            _list(AsyncStream([1, 0]).map(lambda x: 1 / x).buffer(2))
+
+    def test_stopping_early_cancels_the_producer(self):
+        events = []
+        async def endless():
+            try:
+                item = 0
+                while True:
+                    yield item
+                    item += 1
+                    await asyncio.sleep(0)
+            except asyncio.CancelledError:
+                events.append('cancelled')
+                raise
+        async def first_three():
+            result = []
+            stream = aiter(AsyncStream(endless()).buffer(2))
+            async for item in stream:
+                result.append(item)
+                if len(result) == 3:
+                    break
+            await stream.aclose()
+            return result
+        self.assertEqual(_run(first_three()), [0, 1, 2])
+        self.assertEqual(events, ['cancelled'])
@@ -2,10 +2,25 @@
 # (c) Copyright 2014, 2020 by Jason DeLaat.
 # Licensed under BSD 3-clause licence.
 # --------------------------------------------------------
+import inspect
+import pickle
 import unittest
-from pymonad.tools import monad_from_none_or_value
+from pymonad.tools import curry, monad_from_none_or_value
 from pymonad.maybe import Nothing, Some
 
+@curry(3)
+def add3(x, y, z=0):
+    """ Adds three numbers. """
+    return x + y + z
+
+class Counter:
+    def __init__(self, start):
+        self.start = start
+
+    @curry(3)
+    def add(self, x, y):
+        return self.start + x + y
+
 
 class MonadFromNoneTests(unittest.TestCase):
     def test_with_none(self):
@@ -15,3 +30,44 @@ class MonadFromNoneTests(unittest.TestCase):
     def test_with_value(self):
         option=monad_from_none_or_value(Nothing, Some, 42)
         self.assertEqual(option, Some(42))
+
+class CurryTests(unittest.TestCase):
+    def test_partial_application(self):
+        self.assertEqual(add3(1)(2)(3), 6)
+        self.assertEqual(add3(1, 2)(3), 6)
+        self.assertEqual(add3(1)(2, 3), 6)
+        self.assertEqual(add3(1, 2, 3), 6)
+
+    def test_partial_applications_are_independent(self):
+        add_one = add3(1)
+        self.assertEqual(add_one(2, 3), 6)
+        self.assertEqual(add_one(10, 20), 31)
+
+    def test_curry_is_curried(self):
+        self.assertEqual(curry(2)(lambda x, y: x - y)(3)(1), 2)
+        self.assertEqual(curry(2, lambda x, y: x - y)(3, 1), 2)
+
+    def test_keyword_arguments_are_passed_through(self):
+        self.assertEqual(add3(1, z=10)(2), 13)
+        self.assertEqual(add3(z=10)(1, 2), 13)
+
+    def test_keeps_function_metadata(self):
+        self.assertEqual(add3.__name__, 'add3')
+        self.assertEqual(add3(1).__qualname__, 'add3')
+        self.assertIsNotNone(add3.__doc__)
+        self.assertEqual(add3.__doc__, add3.function.__doc__)
+        self.assertIs(add3.__wrapped__, add3.function)
+
+    def test_signature(self):
+        self.assertEqual(str(inspect.signature(add3)), '(x, y, z=0)')
+        self.assertEqual(str(inspect.signature(add3(1))), '(y, z=0)')
+        self.assertEqual(str(inspect.signature(add3(1, z=5))), '(y, *, z=5)')
+
+    def test_pickling(self):
+        self.assertIs(pickle.loads(pickle.dumps(add3)), add3)
+        self.assertEqual(pickle.loads(pickle.dumps(add3(1)))(2, 3), 6)
+        self.assertEqual(pickle.loads(pickle.dumps(add3(1, z=10)))(2), 13)
+        self.assertEqual(pickle.loads(pickle.dumps(curry(2, max)))(1, 2), 2)
+
+    def test_curried_methods(self):
+        self.assertEqual(Counter(1).add(2)(3), 6)
@@ -0,0 +1,83 @@
+# --------------------------------------------------------
+# (c) Copyright 2020 by Jason DeLaat.
+# Licensed under BSD 3-clause licence.
+# --------------------------------------------------------
+import asyncio
+import json
+import time
+import unittest
+
+import common_tests
+import pymonad.trace as trace
+from pymonad.promise import Promise
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+async def slow_inc(x):
+    await asyncio.sleep(0.02)
+    return x + 1
+
+def blocking_inc(x):
+    time.sleep(0.02)
+    return x + 1
+
+def start(value):
+    return Promise(lambda resolve, reject: resolve(value))
+
+async def traced(promise):
+    with trace.trace('test') as span:
+        try:
+            await promise
+        except Exception: # pylint: disable=broad-except
+            pass
+    return span
+
+class TraceTests(unittest.TestCase):
+    def test_not_tracing_by_default(self):
+        self.assertIsNone(trace.current_span())
+        self.assertEqual(_run(start(1).then(slow_inc)), 2)
+
+    def test_every_step_is_recorded(self):
+        span = _run(traced(start(1).then(slow_inc).map(blocking_inc)))
+        [chain] = span.children
+        self.assertEqual(
+            [step.name for step in chain.children],
+            ['Promise test_trace.start.<locals>.<lambda>', 'then test_trace.slow_inc', 'map test_trace.blocking_inc']
+        )
+        _, sleeping, blocking = chain.children
+        self.assertGreaterEqual(sleeping.wait_ns, 10**7)
+        self.assertLess(sleeping.run_ns, 10**7)
+        self.assertGreaterEqual(blocking.run_ns, 10**7)
+        self.assertLess(blocking.wait_ns, 10**7)
+        self.assertEqual(chain.run_ns + chain.wait_ns, sum(step.run_ns + step.wait_ns for step in chain.children))
+        self.assertTrue(all(step.end_ns >= step.start_ns for step in chain.children))
+
+    def test_errors_are_recorded(self):
+        span = _run(traced(start(0).map(lambda x: 1 / x).map(common_tests.add(1)).catch(lambda error: 0)))
+        [chain] = span.children
+        self.assertEqual([step.name.split()[0] for step in chain.children], ['Promise', 'map', 'catch'])
+        self.assertIsInstance(chain.children[1].error, ZeroDivisionError)
+        self.assertIsNone(chain.error)
+
+    def test_nested_promises_are_children_of_their_step(self):
+        span = _run(traced(start(1).bind(lambda x: start(x).then(slow_inc))))
+        [chain] = span.children
+        [nested_chain] = chain.children[1].children
+        self.assertEqual(nested_chain.children[1].name, 'then test_trace.slow_inc')
+
+    def test_concurrent_arguments_are_recorded(self):
+        promise = Promise.apply(common_tests.add).to_arguments(start(1).then(slow_inc), start(2).then(slow_inc))
+        span = _run(traced(promise))
+        [chain] = span.children
+        self.assertEqual(len(chain.children[0].children), 2)
+
+    def test_json_export(self):
+        span = _run(traced(start(1).then(slow_inc)))
+        exported = json.loads(span.to_json())
+        self.assertEqual(exported['name'], 'test')
+        self.assertEqual(exported['start_ns'], 0)
+        self.assertNotIn('run_ns', exported)
+        [chain] = exported['children']
+        self.assertEqual(len(chain['children']), 2)
+        self.assertGreaterEqual(chain['children'][1]['wait_ns'], 10**7)